@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the LiDAR decode path of remote_zenoh_ui.py (no zenoh/Qt needed, only numpy).
+
+    python bench_lidar.py decode
+    python bench_lidar.py trig
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+from typing import Any, Callable, Optional
+
+import remote_zenoh_ui as ui
+
+
+def _scan_payload(layout: str, n: int) -> dict[str, Any]:
+    inc = 2.0 * math.pi / n
+    angles = [i * inc for i in range(n)]
+    ranges = [0.5 + 0.25 * math.sin(4.0 * a) for a in angles]
+    if layout == "dict_points":
+        points: Any = [
+            {"angle_rad": a, "range_m": r, "intensity": 100} for a, r in zip(angles, ranges)
+        ]
+        return {"seq": 1, "ts_ms": 0, "points": points}
+    if layout == "list_points":
+        return {"seq": 1, "ts_ms": 0, "points": [[a, r, 100] for a, r in zip(angles, ranges)]}
+    if layout == "columnar":
+        return {"seq": 1, "ts_ms": 0, "angles": angles, "ranges": ranges}
+    if layout == "laserscan":
+        return {"seq": 1, "ts_ms": 0, "angle_min": 0.0, "angle_increment": inc, "ranges": ranges}
+    raise ValueError(layout)
+
+
+def _time_ms(fn: Callable[[], Any], *, min_time_s: float) -> float:
+    fn()  # warm-up (also primes the layout cache)
+    n = 0
+    t0 = time.perf_counter()
+    while True:
+        fn()
+        n += 1
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time_s:
+            return elapsed / n * 1000.0
+
+
+def bench_decode(args: argparse.Namespace) -> int:
+    print("JSON lidar/scan -> numpy (after json.loads); ms per scan")
+    print(f"{'layout':<12} {'points':>7} {'json.loads':>11} {'per-point':>10} {'cached':>8} {'speedup':>8}")
+    for layout in ("dict_points", "list_points", "columnar", "laserscan"):
+        for n in args.points:
+            payload = _scan_payload(layout, n)
+            raw = json.dumps(payload).encode("utf-8")
+            decoder = ui._LidarJsonDecoder()
+
+            t_loads = _time_ms(lambda: json.loads(raw), min_time_s=args.min_time_s)
+            t_new = _time_ms(lambda: decoder.decode(payload), min_time_s=args.min_time_s)
+            if layout in ("dict_points", "list_points"):
+                t_old = _time_ms(
+                    lambda: ui._LidarJsonDecoder._decode_slow(payload), min_time_s=args.min_time_s
+                )
+                old_s = f"{t_old:10.3f}"
+                speedup_s = f"{t_old / t_new:7.1f}x"
+            else:
+                # The per-point path only understands "points" arrays.
+                old_s = f"{'-':>10}"
+                speedup_s = f"{'-':>8}"
+            print(f"{layout:<12} {n:>7} {t_loads:11.3f} {old_s} {t_new:8.3f} {speedup_s}")
+    return 0
+
+
+def bench_trig(args: argparse.Namespace) -> int:
+    import numpy as np
+
+    def _scans(n: int, *, dtype: str, jitter: bool) -> list[ui._LidarScan]:
+        # Fresh arrays per scan like the decoders give (float32: binary, float64: JSON), ~5% dropouts.
+        rng = np.random.default_rng(0)
+        base = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
+        scans = []
+        # Enough distinct scans that cycling through them never repeats a jittered grid in cache.
+        for i in range(64):
+            angles = base + (rng.normal(0.0, 1e-3, n) if jitter else 0.0)
+            ranges = 0.5 + 0.25 * np.sin(4.0 * base + i)
+            ranges[rng.random(n) < 0.05] = 0.0
+            scans.append(
+                ui._LidarScan(seq=i, ts_ms=0, angles=angles.astype(dtype), ranges=ranges.astype(dtype))
+            )
+        return scans
+
+    def _pipeline(scans: list[ui._LidarScan], *, cache: bool) -> tuple[Callable[[], Any], ui._LidarPipeline]:
+        pipe = ui._LidarPipeline()
+        if not cache:
+            # Always take the uncached path (per-scan np.sin/np.cos of the valid points).
+            pipe.trig.lookup = lambda angles: None  # type: ignore[method-assign]
+        it = iter(range(1 << 62))
+
+        def run() -> Any:
+            pipe.set_scan(scans[next(it) % len(scans)])
+            return pipe.filtered_xy(range_m=0.0, flip_y=False)
+
+        return run, pipe
+
+    print("LiDAR scan -> XY (stage 1: valid ranges, sin/cos); ms per scan")
+    print(
+        f"{'points':>7} {'scan':<8} {'angles':<8} {'np.sin/cos':>11} {'cached':>9} {'speedup':>8} "
+        f"{'trig cache':>10}"
+    )
+    for n in args.points:
+        for dtype, source in (("<f4", "bin"), ("<f8", "json")):
+            for jitter in (False, True):
+                scans = _scans(n, dtype=dtype, jitter=jitter)
+                t_direct = _time_ms(_pipeline(scans, cache=False)[0], min_time_s=args.min_time_s)
+                run, pipe = _pipeline(scans, cache=True)
+                t_cached = _time_ms(run, min_time_s=args.min_time_s)
+                trig = pipe.trig
+                if trig.hits + trig.misses == 0:
+                    cache_s = "bypassed"
+                else:
+                    cache_s = f"{trig.hits / (trig.hits + trig.misses + trig.bypassed):.0%} hits"
+                label = "varying" if jitter else "stable"
+                print(
+                    f"{n:>7} {source:<8} {label:<8} {t_direct:11.4f} {t_cached:9.4f} "
+                    f"{t_direct / t_cached:7.1f}x {cache_s:>10}"
+                )
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="LiDAR pipeline micro-benchmarks")
+    p.add_argument("--min-time-s", type=float, default=0.3, help="Minimum timing window per case")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    decode = sub.add_parser("decode", help="JSON scan decode: per-point loop vs cached layout")
+    decode.add_argument("--points", type=int, nargs="+", default=[1000, 5000, 20000])
+    decode.set_defaults(func=bench_decode)
+
+    trig = sub.add_parser("trig", help="Scan -> XY: per-scan sin/cos vs cached angle-grid tables")
+    trig.add_argument("--points", type=int, nargs="+", default=[360, 720, 2000])
+    trig.set_defaults(func=bench_trig)
+
+    args = p.parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
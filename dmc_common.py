@@ -0,0 +1,211 @@
+"""
+Payload formats shared by remote_zenoh_ui.py, serial_motor_bridge.py and docs/remote_zenoh_tool.py.
+
+Layouts are described in docs/keys_and_payloads.md.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Optional
+
+MOTOR_ENCODINGS = ("json", "bin")
+
+# motor/cmd binary layout (little-endian, 26 bytes):
+#   magic "MC" | version u8 | unit u8 | v_l f32 | v_r f32 | deadman_ms u16 | seq u32 | ts_ms u64
+MOTOR_BIN = struct.Struct("<2sBBffHIQ")
+MOTOR_BIN_MAGIC = b"MC"
+MOTOR_BIN_VERSION = 1
+MOTOR_BIN_UNITS = ("mps",)
+
+MOTOR_PUBLISH_MODES = ("fixed", "on_change")
+# Commands closer than this (mps) count as unchanged for "on_change" publishing.
+MOTOR_CHANGE_EPS = 1e-3
+
+# lidar/scan binary layout (little-endian):
+#   header (20 bytes): magic "LS" | version u8 | flags u8 | count u32 | seq u32 | ts_ms u64
+#   body: angle_rad f32[count] | range_m f32[count] | intensity f32[count] (if flags & 1)
+LIDAR_BIN_HEADER = struct.Struct("<2sBBIIQ")
+LIDAR_BIN_MAGIC = b"LS"
+LIDAR_BIN_VERSION = 1
+LIDAR_BIN_FLAG_INTENSITY = 0x01
+
+
+def encode_motor_cmd(
+    *, v_l: float, v_r: float, unit: str, deadman_ms: int, seq: int, ts_ms: int, encoding: str
+) -> bytes:
+    if encoding == "bin":
+        try:
+            unit_code = MOTOR_BIN_UNITS.index(unit)
+        except ValueError:
+            raise ValueError(
+                f"unit {unit!r} cannot be encoded as bin (supported: {MOTOR_BIN_UNITS})"
+            ) from None
+        return MOTOR_BIN.pack(
+            MOTOR_BIN_MAGIC,
+            MOTOR_BIN_VERSION,
+            unit_code,
+            float(v_l),
+            float(v_r),
+            max(0, min(0xFFFF, int(deadman_ms))),
+            int(seq) & 0xFFFFFFFF,
+            int(ts_ms) & 0xFFFFFFFFFFFFFFFF,
+        )
+    payload = {
+        "v_l": v_l,
+        "v_r": v_r,
+        "unit": unit,
+        "deadman_ms": int(deadman_ms),
+        "seq": int(seq),
+        "ts_ms": int(ts_ms),
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def is_motor_cmd_bin(raw: bytes) -> bool:
+    return len(raw) == MOTOR_BIN.size and raw[:2] == MOTOR_BIN_MAGIC
+
+
+def decode_motor_cmd(raw: bytes) -> dict[str, Any]:
+    """
+    Decodes motor/cmd in either encoding. Binary payloads are detected by size + magic,
+    anything else is parsed as UTF-8 JSON.
+    """
+    if is_motor_cmd_bin(raw):
+        _magic, version, unit_code, v_l, v_r, deadman_ms, seq, ts_ms = MOTOR_BIN.unpack(raw)
+        if version != MOTOR_BIN_VERSION:
+            raise ValueError(f"unsupported motor/cmd bin version: {version}")
+        unit = MOTOR_BIN_UNITS[unit_code] if unit_code < len(MOTOR_BIN_UNITS) else f"unit#{unit_code}"
+        return {
+            "v_l": v_l,
+            "v_r": v_r,
+            "unit": unit,
+            "deadman_ms": deadman_ms,
+            "seq": seq,
+            "ts_ms": ts_ms,
+        }
+    payload = json.loads(raw.decode("utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("motor/cmd JSON payload must be an object")
+    return payload
+
+
+class MotorPublishPolicy:
+    """
+    Decides whether a motor command is due.
+
+    "fixed" publishes on every check (the caller's publish-Hz timer). "on_change" publishes as soon
+    as (v_l, v_r) changes and otherwise only heartbeats every `deadman_ms * heartbeat_margin`;
+    `slack_s` (the caller's check interval) moves a heartbeat earlier so it never lands late.
+    """
+
+    def __init__(self, *, mode: str, heartbeat_margin: float) -> None:
+        self.mode = mode
+        self.heartbeat_margin = float(heartbeat_margin)
+        self._last: Optional[tuple[float, float]] = None
+        self._last_t = 0.0
+
+    def heartbeat_s(self, deadman_ms: int) -> float:
+        return max(0.01, float(deadman_ms) / 1000.0 * self.heartbeat_margin)
+
+    def due(
+        self, cmd: tuple[float, float], now: float, *, deadman_ms: int, slack_s: float = 0.0
+    ) -> Optional[str]:
+        """
+        Returns the reason to publish ("period" | "change" | "heartbeat"), or None to skip.
+        """
+        if self.mode != "on_change":
+            return "period"
+        last = self._last
+        if (
+            last is None
+            or abs(cmd[0] - last[0]) > MOTOR_CHANGE_EPS
+            or abs(cmd[1] - last[1]) > MOTOR_CHANGE_EPS
+        ):
+            return "change"
+        if last == (0.0, 0.0):
+            # A held zero needs no heartbeat: the robot's deadman stops it anyway.
+            return None
+        if now - self._last_t + slack_s >= self.heartbeat_s(deadman_ms):
+            return "heartbeat"
+        return None
+
+    def sent(self, cmd: tuple[float, float], now: float) -> None:
+        self._last = cmd
+        self._last_t = now
+
+    def reset(self) -> None:
+        self._last = None
+
+
+def encode_lidar_scan_bin(
+    *, seq: int, ts_ms: int, angles: Any, ranges: Any, intensity: Any = None
+) -> bytes:
+    """
+    Reference encoder for the binary lidar/scan format (angles/ranges/intensity are sequences of floats).
+    """
+    import numpy as np
+
+    a = np.asarray(angles, dtype="<f4")
+    r = np.asarray(ranges, dtype="<f4")
+    if a.shape != r.shape or a.ndim != 1:
+        raise ValueError("angles and ranges must be 1-D and the same length")
+    cols = [a, r]
+    flags = 0
+    if intensity is not None:
+        cols.append(np.asarray(intensity, dtype="<f4"))
+        flags |= LIDAR_BIN_FLAG_INTENSITY
+    header = LIDAR_BIN_HEADER.pack(
+        LIDAR_BIN_MAGIC, LIDAR_BIN_VERSION, flags, int(a.shape[0]), int(seq) & 0xFFFFFFFF, int(ts_ms)
+    )
+    return header + b"".join(c.tobytes() for c in cols)
+
+
+def decode_lidar_scan_bin(raw: bytes) -> tuple[int, int, Any, Any, Any]:
+    """
+    Returns (seq, ts_ms, angles, ranges, intensity|None) as float32 numpy views into `raw`
+    (no per-point work and no copies).
+    """
+    import numpy as np
+
+    _magic, version, flags, count, seq, ts_ms = LIDAR_BIN_HEADER.unpack_from(raw, 0)
+    if version != LIDAR_BIN_VERSION:
+        raise ValueError(f"unsupported lidar/scan bin version: {version}")
+    n_cols = 3 if flags & LIDAR_BIN_FLAG_INTENSITY else 2
+    expected = LIDAR_BIN_HEADER.size + 4 * n_cols * count
+    if len(raw) != expected:
+        raise ValueError(f"lidar/scan bin size mismatch (bytes={len(raw)}, expected={expected})")
+    cols = np.frombuffer(raw, dtype="<f4", count=n_cols * count, offset=LIDAR_BIN_HEADER.size)
+    cols = cols.reshape(n_cols, count)
+    return int(seq), int(ts_ms), cols[0], cols[1], (cols[2] if n_cols == 3 else None)
+
+
+def lidar_sectors(angles: Any, ranges: Any, n: int) -> tuple[Any, Any, Any]:
+    """
+    Reduces a scan to `n` fixed angular sectors: (nearest, mean, count) numpy arrays of length `n`.
+
+    Sector i is centred on i * 360/n degrees (sector 0 = angle_rad 0, straight ahead; angles grow
+    clockwise as in the scan). Non-finite points and ranges <= 0 are ignored and empty sectors have
+    nearest/mean NaN. Float ranges keep their dtype (float32 for binary scans).
+    """
+    import numpy as np
+
+    a = np.asarray(angles)
+    r = np.asarray(ranges)
+    if r.dtype.kind != "f":
+        r = r.astype(np.float64)
+    valid = np.isfinite(a) & np.isfinite(r) & (r > 0.0)
+    if not valid.all():
+        a, r = a[valid], r[valid]
+    idx = np.floor(a * (n / (2.0 * np.pi)) + 0.5).astype(np.intp) % n
+    count = np.bincount(idx, minlength=n)
+    total = np.bincount(idx, weights=r, minlength=n)
+    # Same dtype as the ranges: a casting ufunc.at is ~20x slower.
+    nearest = np.full(n, np.inf, dtype=r.dtype)
+    np.minimum.at(nearest, idx, r)
+    empty = count == 0
+    nearest[empty] = np.nan
+    mean = np.full(n, np.nan)
+    np.divide(total, count, out=mean, where=~empty)
+    return nearest, mean, count
@@ -10,10 +10,26 @@ Usage and Zenoh connection configuration examples are documented in:
 
 import argparse
 import json
+import sys
 import time
 from pathlib import Path
 from typing import Any, Optional
 
+# dmc_common.py (payload formats shared with remote_zenoh_ui.py / serial_motor_bridge.py) sits at the
+# repository root, one level above this file.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dmc_common import (
+    LIDAR_BIN_MAGIC,
+    MOTOR_BIN_UNITS,
+    MOTOR_ENCODINGS,
+    decode_lidar_scan_bin,
+    decode_motor_cmd,
+    encode_motor_cmd,
+    is_motor_cmd_bin,
+    lidar_sectors,
+)
+
 
 def _apply_connect_overrides(cfg, mode: str, connect_endpoints: list[str]):
     if mode:
@@ -60,7 +76,15 @@ def _key(robot_id: str, suffix: str) -> str:
     return f"dmc_robo/{robot_id}/{suffix}"
 
 
+def _check_motor_encoding(args: argparse.Namespace) -> None:
+    if args.encoding == "bin" and args.unit not in MOTOR_BIN_UNITS:
+        raise SystemExit(
+            f"--unit {args.unit!r} cannot be sent with --encoding bin (supported: {MOTOR_BIN_UNITS})"
+        )
+
+
 def cmd_motor(args: argparse.Namespace) -> int:
+    _check_motor_encoding(args)
     key = _key(args.robot_id, "motor/cmd")
     session = args.open_session()
     pub = session.declare_publisher(key)
@@ -71,15 +95,17 @@ def cmd_motor(args: argparse.Namespace) -> int:
 
     try:
         while time.monotonic() < end_t:
-            payload = {
-                "v_l": args.v_l,
-                "v_r": args.v_r,
-                "unit": args.unit,
-                "deadman_ms": args.deadman_ms,
-                "seq": seq,
-                "ts_ms": int(time.time() * 1000),
-            }
-            pub.put(json.dumps(payload).encode("utf-8"))
+            pub.put(
+                encode_motor_cmd(
+                    v_l=args.v_l,
+                    v_r=args.v_r,
+                    unit=args.unit,
+                    deadman_ms=args.deadman_ms,
+                    seq=seq,
+                    ts_ms=int(time.time() * 1000),
+                    encoding=args.encoding,
+                )
+            )
             seq += 1
             time.sleep(interval_s)
     finally:
@@ -88,27 +114,53 @@ def cmd_motor(args: argparse.Namespace) -> int:
 
 
 def cmd_stop(args: argparse.Namespace) -> int:
+    _check_motor_encoding(args)
     key = _key(args.robot_id, "motor/cmd")
     session = args.open_session()
     pub = session.declare_publisher(key)
 
     try:
         for i in range(args.count):
-            payload = {
-                "v_l": 0.0,
-                "v_r": 0.0,
-                "unit": args.unit,
-                "deadman_ms": args.deadman_ms,
-                "seq": i,
-                "ts_ms": int(time.time() * 1000),
-            }
-            pub.put(json.dumps(payload).encode("utf-8"))
+            pub.put(
+                encode_motor_cmd(
+                    v_l=0.0,
+                    v_r=0.0,
+                    unit=args.unit,
+                    deadman_ms=args.deadman_ms,
+                    seq=i,
+                    ts_ms=int(time.time() * 1000),
+                    encoding=args.encoding,
+                )
+            )
             time.sleep(0.05)
     finally:
         session.close()
     return 0
 
 
+def cmd_motor_echo(args: argparse.Namespace) -> int:
+    key = _key(args.robot_id, "motor/cmd")
+    session = args.open_session()
+
+    def on_sample(sample: Any) -> None:
+        raw = sample.payload.to_bytes()
+        try:
+            cmd = decode_motor_cmd(raw)
+        except Exception as e:
+            print(f"decode failed ({len(raw)} bytes): {e}")
+            return
+        enc = "bin" if is_motor_cmd_bin(raw) else "json"
+        print(f"[{enc} {len(raw)}B] {json.dumps(cmd, ensure_ascii=False)}")
+
+    sub = session.declare_subscriber(key, on_sample)
+    try:
+        input("subscribing motor/cmd... press Enter to quit\n")
+    finally:
+        sub.undeclare()
+        session.close()
+    return 0
+
+
 def cmd_oled(args: argparse.Namespace) -> int:
     key = _key(args.robot_id, "oled/cmd")
     session = args.open_session()
@@ -183,6 +235,20 @@ def cmd_camera(args: argparse.Namespace) -> int:
     return 0
 
 
+def _format_sectors(angles: Any, ranges: Any, n: int) -> str:
+    import numpy as np
+
+    nearest, _mean, count = lidar_sectors(angles, ranges, n)
+    cells = " ".join(
+        f"{i * 360.0 / n:.0f}:{'--' if count[i] == 0 else f'{nearest[i]:.2f}'}" for i in range(n)
+    )
+    closest = "none"
+    if count.any():
+        i = int(np.nanargmin(nearest))
+        closest = f"{nearest[i]:.2f} m @ {i * 360.0 / n:.0f} deg"
+    return f"  nearest per sector (deg:m) {cells} | closest {closest}"
+
+
 def cmd_lidar(args: argparse.Namespace) -> int:
     key_scan = _key(args.robot_id, "lidar/scan")
     key_front = _key(args.robot_id, "lidar/front")
@@ -194,9 +260,50 @@ def cmd_lidar(args: argparse.Namespace) -> int:
         except Exception as e:
             print(f"decode failed: {e}")
 
+    def on_scan_bin(raw: bytes) -> None:
+        try:
+            seq, ts_ms, angles, ranges, intensity = decode_lidar_scan_bin(raw)
+        except Exception as e:
+            print(f"decode failed: {e}")
+            return
+
+        n = int(angles.shape[0])
+        if args.print_json:
+            points = [
+                {
+                    "angle_rad": float(angles[i]),
+                    "range_m": float(ranges[i]),
+                    "intensity": None if intensity is None else float(intensity[i]),
+                }
+                for i in range(n)
+            ]
+            print(json.dumps({"seq": seq, "ts_ms": ts_ms, "points": points}, ensure_ascii=False))
+            return
+
+        print(f"scan: seq={seq} ts_ms={ts_ms} points={n} (bin {len(raw)} bytes)")
+        if args.sectors:
+            print(_format_sectors(angles, ranges, int(args.sectors)))
+        if not args.print_points:
+            return
+
+        import math
+
+        for i in range(min(n, int(args.max_points))):
+            angle_deg = math.degrees(float(angles[i]))
+            range_m = float(ranges[i])
+            if intensity is None:
+                print(f"  {i:04d}: angle_deg={angle_deg:8.2f} range_m={range_m:6.3f}")
+            else:
+                print(f"  {i:04d}: angle_deg={angle_deg:8.2f} range_m={range_m:6.3f} intensity={float(intensity[i])}")
+
     def on_scan(sample: Any) -> None:
+        raw = sample.payload.to_bytes()
+        if raw[:2] == LIDAR_BIN_MAGIC:
+            on_scan_bin(raw)
+            return
+
         try:
-            payload = _decode_json_payload(sample)
+            payload = json.loads(raw.decode("utf-8"))
         except Exception as e:
             print(f"decode failed: {e}")
             return
@@ -214,6 +321,19 @@ def cmd_lidar(args: argparse.Namespace) -> int:
             n = 0
         print(f"scan: seq={seq} ts_ms={ts_ms} points={n}")
 
+        if args.sectors:
+            angles: list[float] = []
+            ranges: list[float] = []
+            for p in points:
+                try:
+                    angle_rad = float(p.get("angle_rad"))
+                    range_m = float(p.get("range_m"))
+                except Exception:
+                    continue
+                angles.append(angle_rad)
+                ranges.append(range_m)
+            print(_format_sectors(angles, ranges, int(args.sectors)))
+
         if not args.print_points:
             return
 
@@ -289,14 +409,19 @@ def main(argv: Optional[list[str]] = None) -> int:
     motor.add_argument("--deadman-ms", type=int, default=300)
     motor.add_argument("--duration-s", type=float, default=2.0)
     motor.add_argument("--hz", type=float, default=20.0)
+    motor.add_argument("--encoding", choices=MOTOR_ENCODINGS, default="json")
     motor.set_defaults(func=cmd_motor)
 
     stop = sub.add_parser("stop", help="Publish zero motor command a few times")
     stop.add_argument("--unit", type=str, default="mps")
     stop.add_argument("--deadman-ms", type=int, default=300)
     stop.add_argument("--count", type=int, default=5)
+    stop.add_argument("--encoding", choices=MOTOR_ENCODINGS, default="json")
     stop.set_defaults(func=cmd_stop)
 
+    motor_echo = sub.add_parser("motor-echo", help="Subscribe motor/cmd and print decoded commands (json/bin)")
+    motor_echo.set_defaults(func=cmd_motor_echo)
+
     oled = sub.add_parser("oled", help="Publish oled/cmd once")
     oled.add_argument("--text", type=str, required=True)
     oled.set_defaults(func=cmd_oled)
@@ -310,11 +435,20 @@ def main(argv: Optional[list[str]] = None) -> int:
     cam.set_defaults(func=cmd_camera)
 
     lidar = sub.add_parser("lidar", help="Subscribe lidar scan/front and print")
-    lidar.add_argument("--scan", action="store_true", help="Subscribe lidar/scan (angle-wise raw values)")
+    lidar.add_argument(
+        "--scan", action="store_true", help="Subscribe lidar/scan (angle-wise raw values, JSON or binary)"
+    )
     lidar.add_argument("--front", action="store_true", help="Subscribe lidar/front (summary distance)")
     lidar.add_argument("--print-json", action="store_true", help="Print scan payload as raw JSON")
     lidar.add_argument("--print-points", action="store_true", help="Print per-point angle/range from scan payload")
     lidar.add_argument("--max-points", type=int, default=100, help="Max points to print when --print-points")
+    lidar.add_argument(
+        "--sectors",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Print the nearest range in each of N angular sectors per scan (compact summary, needs numpy)",
+    )
     lidar.set_defaults(func=cmd_lidar)
 
     args = p.parse_args(argv)
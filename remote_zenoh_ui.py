@@ -2,13 +2,27 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import heapq
 import json
+import operator
 import sys
+import threading
 import time
 from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+from dmc_common import (
+    LIDAR_BIN_MAGIC,
+    MOTOR_ENCODINGS,
+    MOTOR_PUBLISH_MODES,
+    MotorPublishPolicy,
+    decode_lidar_scan_bin,
+    encode_motor_cmd,
+    lidar_sectors,
+)
 
 
 def _load_toml_file(path: Path) -> dict[str, Any]:
@@ -52,15 +66,120 @@ def _clamp_int(v: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, int(v)))
 
 
+_DELIVERY_POLICIES = ("latest", "queue")
+_DELIVERY_QUEUE_MAXLEN = 1024
+_RECONNECT_CHECK_S = 0.25
+_RECONNECT_BACKOFF_MIN_S = 0.5
+
+# IMU chart: one vector, or gyro above accel with a shared (linked) time axis.
+_IMU_PLOT_MODES = ("gyro", "accel", "stacked")
+# Channels the vibration spectrum can be taken from ("amag" = |accel|).
+_IMU_FFT_CHANNELS = ("amag", "gx", "gy", "gz", "ax", "ay", "az")
+# Gaps in gyro samples longer than this (s) are not integrated into the heading.
+_IMU_HEADING_MAX_GAP_S = 0.5
+# IMU chart x axis: host receive time, or the payload ts_ms (robot clock, reordered).
+_IMU_TIME_BASES = ("receive", "robot")
+# Robot clock jump (reboot, resync) for the "robot" time base: ts_ms going back more than this (s)
+# past the reorder window, or running this much ahead of host time since the newest sample.
+_IMU_TS_JUMP_S = 2.0
+# Upper edges (ms) of the IMU arrival latency (host receive - payload ts_ms) histogram buckets.
+_IMU_LATENCY_BUCKETS_MS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0)
+# Final camera rescale: always smooth, always fast, or fast while frames arrive above a rate.
+_CAMERA_SCALINGS = ("auto", "smooth", "fast")
+# JPEG DCT scaling only offers 1/1, 1/2, 1/4 and 1/8.
+_CAMERA_MAX_DECODE_SCALE = 8
+# Camera arrival rate ("auto" scaling) is measured over windows of at least this many seconds.
+_CAMERA_RATE_WINDOW_S = 0.5
+# Upper bound (m) of the LiDAR range filter / initial view.
+_LIDAR_MAX_RANGE_M = 100.0
+# LiDAR level of detail: at most one drawn point per cell of this many screen pixels (square).
+_LIDAR_LOD_CELL_PX = 2
+# Upper bound of the LiDAR occupancy grid size (cells per side); coarser cells are used beyond it.
+_LIDAR_GRID_MAX_CELLS = 1000
+# LiDAR panel: every point (level of detail applies), or the nearest obstacle per angular sector.
+_LIDAR_DISPLAYS = ("points", "sectors")
+# Upper edges (ms) of the key -> motor/cmd put latency histogram buckets.
+_KEY_LATENCY_BUCKETS_MS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0)
+
+
+class _LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (ms) with exact percentiles over the most recent samples.
+    """
+
+    def __init__(self, edges_ms: tuple[float, ...], *, keep: int = 1000) -> None:
+        self._edges = edges_ms
+        self.counts = [0] * (len(edges_ms) + 1)  # last bucket: above the largest edge
+        self._recent: deque[float] = deque(maxlen=keep)
+
+    def add(self, ms: float) -> None:
+        i = 0
+        while i < len(self._edges) and ms > self._edges[i]:
+            i += 1
+        self.counts[i] += 1
+        self._recent.append(ms)
+
+    def clear(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self._recent.clear()
+
+    def summary(self) -> str:
+        if not self._recent:
+            return "n=0"
+        xs = sorted(self._recent)
+        p50 = xs[len(xs) // 2]
+        p95 = xs[min(len(xs) - 1, int(len(xs) * 0.95))]
+        return f"n={sum(self.counts)} p50={p50:.1f}ms p95={p95:.1f}ms max={xs[-1]:.1f}ms"
+
+    def format_buckets(self) -> str:
+        labels = [f"<={e:g}ms" for e in self._edges] + [f">{self._edges[-1]:g}ms"]
+        width = max(len(x) for x in labels)
+        peak = max(1, max(self.counts))
+        return "\n".join(
+            f"{label:>{width}} {n:6d} {'#' * int(round(30 * n / peak))}"
+            for label, n in zip(labels, self.counts)
+        )
+
+
 @dataclass(frozen=True)
 class UIConfig:
     motor_speed_step_mps: float = 0.50
     motor_publish_hz: float = 20.0
     motor_deadman_ms: int = 300
+    motor_encoding: str = "json"
+    motor_publish_mode: str = "fixed"
+    motor_heartbeat_margin: float = 0.5
+    motor_publish_on_key: bool = True
+    imu_history_samples: int = 120000
+    imu_window_s: float = 10.0
+    imu_plot: str = "gyro"
+    imu_fft_size: int = 512
+    imu_fft_hz: float = 2.0
+    imu_time_base: str = "receive"
+    imu_reorder_ms: float = 50.0
+    camera_scaling: str = "auto"
+    camera_fast_above_fps: float = 20.0
+    imu_raw_view_hz: float = 5.0
     lidar_update_hz: float = 10.0
     lidar_max_points: int = 5000
-    lidar_range_m: float = 1.0
+    lidar_range_m: float = 0.0
+    lidar_view_m: float = 2.0
     lidar_flip_y: bool = False
+    lidar_grid: bool = False
+    lidar_grid_resolution_m: float = 0.05
+    lidar_grid_extent_m: float = 10.0
+    lidar_grid_half_life_s: float = 2.0
+    lidar_display: str = "points"
+    lidar_sectors: int = 16
+    delivery_imu: str = "queue"
+    delivery_motor_telemetry: str = "latest"
+    delivery_camera: str = "latest"
+    delivery_lidar: str = "latest"
+    delivery_drain_hz: float = 60.0
+    delivery_decode_workers: int = 2
+    reconnect_grace_s: float = 3.0
+    reconnect_backoff_max_s: float = 10.0
+    render_fps: float = 30.0
 
 
 def _load_ui_config(path: Optional[Path]) -> UIConfig:
@@ -68,8 +187,16 @@ def _load_ui_config(path: Optional[Path]) -> UIConfig:
     Reads `config.toml` and returns UI defaults.
 
     Supported TOML keys:
-      [motor] speed_step_mps, publish_hz, deadman_ms
-      [lidar] update_hz, max_points, range_m, flip_y
+      [motor] speed_step_mps, publish_hz, deadman_ms, encoding, publish_mode, heartbeat_margin,
+              publish_on_key
+      [imu] history_samples, window_s, plot ("gyro" | "accel" | "stacked"), fft_size, fft_hz,
+            time_base ("receive" | "robot"), reorder_ms, raw_view_hz
+      [camera] scaling ("auto" | "smooth" | "fast"), fast_above_fps
+      [lidar] update_hz, max_points, range_m, view_m, flip_y, grid, grid_resolution_m, grid_extent_m,
+              grid_half_life_s, display ("points" | "sectors"), sectors
+      [delivery] imu, motor_telemetry, camera, lidar ("latest" | "queue"), drain_hz, decode_workers
+      [reconnect] grace_s, backoff_max_s
+      [render] fps
     """
     if path is None:
         return UIConfig()
@@ -77,6 +204,11 @@ def _load_ui_config(path: Optional[Path]) -> UIConfig:
     data = _load_toml_file(path)
     motor = _toml_get(data, ("motor",), {})
     lidar = _toml_get(data, ("lidar",), {})
+    imu = _toml_get(data, ("imu",), {})
+    delivery = _toml_get(data, ("delivery",), {})
+    reconnect = _toml_get(data, ("reconnect",), {})
+    render = _toml_get(data, ("render",), {})
+    camera = _toml_get(data, ("camera",), {})
 
     def _f(x: Any, default: float) -> float:
         try:
@@ -95,6 +227,11 @@ def _load_ui_config(path: Optional[Path]) -> UIConfig:
             return x
         return bool(default)
 
+    def _choice(x: Any, choices: tuple[str, ...], default: str) -> str:
+        if isinstance(x, str) and x.strip().lower() in choices:
+            return x.strip().lower()
+        return default
+
     speed_step = _clamp(
         _f(
             _toml_get(motor, ("speed_step_mps",), UIConfig.motor_speed_step_mps),
@@ -113,6 +250,72 @@ def _load_ui_config(path: Optional[Path]) -> UIConfig:
         50,
         2000,
     )
+    motor_encoding = _choice(
+        _toml_get(motor, ("encoding",), UIConfig.motor_encoding), MOTOR_ENCODINGS, UIConfig.motor_encoding
+    )
+    motor_publish_mode = _choice(
+        _toml_get(motor, ("publish_mode",), UIConfig.motor_publish_mode),
+        MOTOR_PUBLISH_MODES,
+        UIConfig.motor_publish_mode,
+    )
+    motor_heartbeat_margin = _clamp(
+        _f(
+            _toml_get(motor, ("heartbeat_margin",), UIConfig.motor_heartbeat_margin),
+            UIConfig.motor_heartbeat_margin,
+        ),
+        0.1,
+        0.9,
+    )
+    motor_publish_on_key = _b(
+        _toml_get(motor, ("publish_on_key",), UIConfig.motor_publish_on_key),
+        UIConfig.motor_publish_on_key,
+    )
+
+    imu_history_samples = _clamp_int(
+        _i(
+            _toml_get(imu, ("history_samples",), UIConfig.imu_history_samples),
+            UIConfig.imu_history_samples,
+        ),
+        50,
+        500000,
+    )
+    imu_window_s = _clamp(
+        _f(_toml_get(imu, ("window_s",), UIConfig.imu_window_s), UIConfig.imu_window_s),
+        1.0,
+        3600.0,
+    )
+    imu_plot = _choice(_toml_get(imu, ("plot",), UIConfig.imu_plot), _IMU_PLOT_MODES, UIConfig.imu_plot)
+    imu_fft_size = _clamp_int(
+        _i(_toml_get(imu, ("fft_size",), UIConfig.imu_fft_size), UIConfig.imu_fft_size), 32, 16384
+    )
+    imu_fft_hz = _clamp(
+        _f(_toml_get(imu, ("fft_hz",), UIConfig.imu_fft_hz), UIConfig.imu_fft_hz), 0.2, 10.0
+    )
+    imu_time_base = _choice(
+        _toml_get(imu, ("time_base",), UIConfig.imu_time_base), _IMU_TIME_BASES, UIConfig.imu_time_base
+    )
+    imu_reorder_ms = _clamp(
+        _f(_toml_get(imu, ("reorder_ms",), UIConfig.imu_reorder_ms), UIConfig.imu_reorder_ms),
+        0.0,
+        1000.0,
+    )
+    imu_raw_view_hz = _clamp(
+        _f(_toml_get(imu, ("raw_view_hz",), UIConfig.imu_raw_view_hz), UIConfig.imu_raw_view_hz),
+        0.5,
+        30.0,
+    )
+
+    camera_scaling = _choice(
+        _toml_get(camera, ("scaling",), UIConfig.camera_scaling), _CAMERA_SCALINGS, UIConfig.camera_scaling
+    )
+    camera_fast_above_fps = _clamp(
+        _f(
+            _toml_get(camera, ("fast_above_fps",), UIConfig.camera_fast_above_fps),
+            UIConfig.camera_fast_above_fps,
+        ),
+        1.0,
+        240.0,
+    )
 
     lidar_update_hz = _clamp(
         _f(_toml_get(lidar, ("update_hz",), UIConfig.lidar_update_hz), UIConfig.lidar_update_hz),
@@ -130,18 +333,118 @@ def _load_ui_config(path: Optional[Path]) -> UIConfig:
     lidar_range_m = _clamp(
         _f(_toml_get(lidar, ("range_m",), UIConfig.lidar_range_m), UIConfig.lidar_range_m),
         0.0,
-        1.0,
+        _LIDAR_MAX_RANGE_M,
+    )
+    lidar_view_m = _clamp(
+        _f(_toml_get(lidar, ("view_m",), UIConfig.lidar_view_m), UIConfig.lidar_view_m),
+        0.5,
+        _LIDAR_MAX_RANGE_M,
     )
     lidar_flip_y = _b(_toml_get(lidar, ("flip_y",), UIConfig.lidar_flip_y), UIConfig.lidar_flip_y)
+    lidar_grid = _b(_toml_get(lidar, ("grid",), UIConfig.lidar_grid), UIConfig.lidar_grid)
+    lidar_grid_extent_m = _clamp(
+        _f(_toml_get(lidar, ("grid_extent_m",), UIConfig.lidar_grid_extent_m), UIConfig.lidar_grid_extent_m),
+        0.5,
+        _LIDAR_MAX_RANGE_M,
+    )
+    lidar_grid_resolution_m = _clamp(
+        _f(
+            _toml_get(lidar, ("grid_resolution_m",), UIConfig.lidar_grid_resolution_m),
+            UIConfig.lidar_grid_resolution_m,
+        ),
+        max(0.01, 2.0 * lidar_grid_extent_m / _LIDAR_GRID_MAX_CELLS),
+        1.0,
+    )
+    lidar_grid_half_life_s = _clamp(
+        _f(
+            _toml_get(lidar, ("grid_half_life_s",), UIConfig.lidar_grid_half_life_s),
+            UIConfig.lidar_grid_half_life_s,
+        ),
+        0.1,
+        60.0,
+    )
+    lidar_display = _choice(
+        _toml_get(lidar, ("display",), UIConfig.lidar_display), _LIDAR_DISPLAYS, UIConfig.lidar_display
+    )
+    lidar_sectors = _clamp_int(
+        _i(_toml_get(lidar, ("sectors",), UIConfig.lidar_sectors), UIConfig.lidar_sectors), 4, 360
+    )
+
+    def _policy(name: str, default: str) -> str:
+        return _choice(_toml_get(delivery, (name,), default), _DELIVERY_POLICIES, default)
+
+    delivery_drain_hz = _clamp(
+        _f(_toml_get(delivery, ("drain_hz",), UIConfig.delivery_drain_hz), UIConfig.delivery_drain_hz),
+        5.0,
+        240.0,
+    )
+    delivery_decode_workers = _clamp_int(
+        _i(
+            _toml_get(delivery, ("decode_workers",), UIConfig.delivery_decode_workers),
+            UIConfig.delivery_decode_workers,
+        ),
+        1,
+        8,
+    )
+
+    reconnect_grace_s = _clamp(
+        _f(_toml_get(reconnect, ("grace_s",), UIConfig.reconnect_grace_s), UIConfig.reconnect_grace_s),
+        0.0,
+        60.0,
+    )
+    reconnect_backoff_max_s = _clamp(
+        _f(
+            _toml_get(reconnect, ("backoff_max_s",), UIConfig.reconnect_backoff_max_s),
+            UIConfig.reconnect_backoff_max_s,
+        ),
+        _RECONNECT_BACKOFF_MIN_S,
+        300.0,
+    )
+
+    render_fps = _clamp(
+        _f(_toml_get(render, ("fps",), UIConfig.render_fps), UIConfig.render_fps),
+        5.0,
+        120.0,
+    )
 
     return UIConfig(
         motor_speed_step_mps=speed_step,
         motor_publish_hz=publish_hz,
         motor_deadman_ms=deadman,
+        motor_encoding=motor_encoding,
+        motor_publish_mode=motor_publish_mode,
+        motor_heartbeat_margin=motor_heartbeat_margin,
+        motor_publish_on_key=motor_publish_on_key,
+        imu_history_samples=imu_history_samples,
+        imu_window_s=imu_window_s,
+        imu_plot=imu_plot,
+        imu_fft_size=imu_fft_size,
+        imu_fft_hz=imu_fft_hz,
+        imu_time_base=imu_time_base,
+        imu_reorder_ms=imu_reorder_ms,
+        camera_scaling=camera_scaling,
+        camera_fast_above_fps=camera_fast_above_fps,
+        imu_raw_view_hz=imu_raw_view_hz,
         lidar_update_hz=lidar_update_hz,
         lidar_max_points=lidar_max_points,
         lidar_range_m=lidar_range_m,
+        lidar_view_m=lidar_view_m,
         lidar_flip_y=lidar_flip_y,
+        lidar_grid=lidar_grid,
+        lidar_grid_resolution_m=lidar_grid_resolution_m,
+        lidar_grid_extent_m=lidar_grid_extent_m,
+        lidar_grid_half_life_s=lidar_grid_half_life_s,
+        lidar_display=lidar_display,
+        lidar_sectors=lidar_sectors,
+        delivery_imu=_policy("imu", UIConfig.delivery_imu),
+        delivery_motor_telemetry=_policy("motor_telemetry", UIConfig.delivery_motor_telemetry),
+        delivery_camera=_policy("camera", UIConfig.delivery_camera),
+        delivery_lidar=_policy("lidar", UIConfig.delivery_lidar),
+        delivery_drain_hz=delivery_drain_hz,
+        delivery_decode_workers=delivery_decode_workers,
+        reconnect_grace_s=reconnect_grace_s,
+        reconnect_backoff_max_s=reconnect_backoff_max_s,
+        render_fps=render_fps,
     )
 
 
@@ -190,28 +493,231 @@ def _build_session_opener(
     return _opener
 
 
+class _Mailbox:
+    """
+    Thread-safe hand-off from zenoh callback threads to the GUI thread.
+
+    `maxlen=1` keeps only the newest value ("latest"); a larger `maxlen` is a bounded FIFO ("queue").
+    When full, the oldest item is dropped and counted in `dropped`.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self._lock = threading.Lock()
+        self._items: deque[Any] = deque(maxlen=max(1, int(maxlen)))
+        self.received = 0
+        self.dropped = 0
+
+    def put(self, item: Any) -> None:
+        with self._lock:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append(item)
+            self.received += 1
+
+    def note_dropped(self) -> None:
+        """Counts a sample dropped before it reached the mailbox (e.g. replaced while decoding)."""
+        with self._lock:
+            self.dropped += 1
+
+    def take_all(self) -> list[Any]:
+        with self._lock:
+            if not self._items:
+                return []
+            items = list(self._items)
+            self._items.clear()
+            return items
+
+
 class _Bridge:
-    def __init__(self) -> None:
+    # topic -> UIConfig delivery policy field
+    _TOPIC_POLICY_FIELDS = {
+        "imu": "delivery_imu",
+        "motor_telemetry": "delivery_motor_telemetry",
+        "cam_jpeg": "delivery_camera",
+        "cam_meta": "delivery_camera",
+        "lidar_scan": "delivery_lidar",
+        "lidar_front": "delivery_lidar",
+    }
+
+    def __init__(self, ui_config: UIConfig) -> None:
         from PySide6.QtCore import QObject, Signal
 
         class _B(QObject):
             log = Signal(str)
-            imu = Signal(object)  # dict
-            motor_telemetry = Signal(object)  # dict
-            cam_jpeg = Signal(bytes)
-            cam_meta = Signal(object)  # dict
-            lidar_scan = Signal(object)  # dict
-            lidar_front = Signal(object)  # dict
+            status = Signal(str)
 
         self._b = _B()
+        self._policies: dict[str, str] = {
+            topic: getattr(ui_config, field) for topic, field in self._TOPIC_POLICY_FIELDS.items()
+        }
+        # Mailboxes are created per (robot_id, topic) on first use, so one bridge can serve a fleet.
+        self._lock = threading.Lock()
+        self._mailboxes: dict[tuple[str, str], _Mailbox] = {}
+        self._robots: list[str] = []
 
     @property
     def qobj(self):
         return self._b
 
+    def mailbox(self, robot_id: str, topic: str) -> _Mailbox:
+        key = (robot_id, topic)
+        mailbox = self._mailboxes.get(key)
+        if mailbox is not None:
+            return mailbox
+        with self._lock:
+            mailbox = self._mailboxes.get(key)
+            if mailbox is None:
+                maxlen = 1 if self._policies[topic] == "latest" else _DELIVERY_QUEUE_MAXLEN
+                mailbox = _Mailbox(maxlen)
+                self._mailboxes[key] = mailbox
+                if robot_id not in self._robots:
+                    self._robots.append(robot_id)
+            return mailbox
+
+    def topics(self) -> tuple[str, ...]:
+        return tuple(self._policies)
+
+    def robots(self) -> list[str]:
+        """Robot ids that have delivered at least one sample, in order of first appearance."""
+        with self._lock:
+            return list(self._robots)
+
+    def policy(self, topic: str) -> str:
+        return self._policies[topic]
+
+
+class _DecodePool:
+    """
+    Worker stage between ZenohClient and the windows.
+
+    Raw payloads are queued per stream ("lane", one per robot_id + topic) and decoded on a small
+    thread pool into ready-to-render objects, which are then put into the stream's bridge mailbox.
+    A lane runs at most one decode at a time, so per-stream order is kept while different streams
+    decode in parallel. Lanes with the "latest" policy keep only the newest pending payload.
+
+    `make_decoders()` is called once per robot, so stateful decoders (e.g. the LiDAR layout cache)
+    are per stream.
+    """
+
+    _BATCH = 32
 
-def _decode_json_payload(sample: Any) -> Any:
-    raw = sample.payload.to_bytes()
+    def __init__(
+        self,
+        *,
+        bridge: _Bridge,
+        make_decoders: Callable[[], dict[str, Callable[[bytes, float], Any]]],
+        workers: int,
+    ) -> None:
+        self._bridge = bridge
+        self._make_decoders = make_decoders
+        self._decoders: dict[str, dict[str, Callable[[bytes, float], Any]]] = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, int(workers)), thread_name_prefix="decode"
+        )
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str], deque[tuple[float, bytes]]] = {}
+        self._running: set[tuple[str, str]] = set()
+        self._received: dict[tuple[str, str], int] = {}
+        self._closed = False
+
+    def submit(self, robot_id: str, topic: str, raw: bytes) -> None:
+        recv_t = time.monotonic()
+        lane = (robot_id, topic)
+        with self._lock:
+            if self._closed:
+                return
+            pending = self._pending.get(lane)
+            if pending is None:
+                if robot_id not in self._decoders:
+                    self._decoders[robot_id] = self._make_decoders()
+                maxlen = 1 if self._bridge.policy(topic) == "latest" else _DELIVERY_QUEUE_MAXLEN
+                pending = deque(maxlen=maxlen)
+                self._pending[lane] = pending
+            if len(pending) == pending.maxlen:
+                self._bridge.mailbox(robot_id, topic).note_dropped()
+            pending.append((recv_t, raw))
+            self._received[lane] = self._received.get(lane, 0) + 1
+            if lane in self._running:
+                return
+            self._running.add(lane)
+        self._executor.submit(self._run_lane, lane)
+
+    def _run_lane(self, lane: tuple[str, str]) -> None:
+        robot_id, topic = lane
+        decode = self._decoders[robot_id][topic]
+        mailbox = self._bridge.mailbox(robot_id, topic)
+        for _ in range(self._BATCH):
+            with self._lock:
+                pending = self._pending[lane]
+                if not pending or self._closed:
+                    self._running.discard(lane)
+                    return
+                recv_t, raw = pending.popleft()
+            try:
+                result = decode(raw, recv_t)
+            except Exception as e:
+                self._bridge.qobj.log.emit(
+                    f"{robot_id}: {_TOPIC_LABELS.get(topic, topic)} decode failed: {e}"
+                )
+                continue
+            if result is not None:
+                mailbox.put(result)
+        # Yield the worker to other lanes; this lane is re-queued behind them.
+        try:
+            self._executor.submit(self._run_lane, lane)
+        except RuntimeError:  # executor shut down
+            with self._lock:
+                self._running.discard(lane)
+
+    def received(self, robot_id: str, topic: str) -> int:
+        """Payloads submitted on a lane so far, including ones replaced before they were decoded."""
+        return self._received.get((robot_id, topic), 0)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            for pending in self._pending.values():
+                pending.clear()
+        self._executor.shutdown(wait=False)
+
+
+_TOPIC_LABELS = {
+    "imu": "imu",
+    "motor_telemetry": "motor/telemetry",
+    "cam_jpeg": "camera jpeg",
+    "cam_meta": "camera/meta",
+    "lidar_scan": "lidar/scan",
+    "lidar_front": "lidar/front",
+}
+
+
+# key suffix under dmc_robo/<robot_id>/ -> topic
+_SUBSCRIPTIONS: tuple[tuple[str, str], ...] = (
+    ("motor/telemetry", "motor_telemetry"),
+    ("imu/state", "imu"),
+    ("camera/meta", "cam_meta"),
+    ("camera/image/jpeg", "cam_jpeg"),
+    ("lidar/scan", "lidar_scan"),
+    ("lidar/front", "lidar_front"),
+)
+_SUFFIX_TOPICS = dict(_SUBSCRIPTIONS)
+_FLEET_KEY = "dmc_robo/*/**"
+
+
+def _split_key(key: str) -> Optional[tuple[str, str]]:
+    """
+    `dmc_robo/<robot_id>/<suffix>` -> (robot_id, topic), or None for keys the UI does not display.
+    """
+    parts = key.split("/", 2)
+    if len(parts) != 3 or parts[0] != "dmc_robo" or not parts[1]:
+        return None
+    topic = _SUFFIX_TOPICS.get(parts[2])
+    if topic is None:
+        return None
+    return parts[1], topic
+
+
+def _decode_json_bytes(raw: bytes) -> Any:
     return json.loads(raw.decode("utf-8"))
 
 
@@ -234,174 +740,320 @@ class MotorCommand:
             "ts_ms": int(self.ts_ms),
         }
 
-    def to_bytes(self) -> bytes:
-        return json.dumps(self.to_dict()).encode("utf-8")
+    def to_bytes(self, encoding: str = "json") -> bytes:
+        return encode_motor_cmd(
+            v_l=self.v_l,
+            v_r=self.v_r,
+            unit=self.unit,
+            deadman_ms=self.deadman_ms,
+            seq=self.seq,
+            ts_ms=self.ts_ms,
+            encoding=encoding,
+        )
 
 
 class ZenohClient:
+    """
+    Owns the zenoh session.
+
+    With a `robot_id` it publishes motor/oled for that robot and subscribes its topics. With
+    `robot_id=None` (fleet mode) it is monitor-only: a single `dmc_robo/*/**` subscriber feeds every
+    robot's samples into the decode pool, dispatched by robot id and key suffix.
+
+    `open()`/`close()` run on the supervisor thread while the GUI thread publishes. `_lock` only
+    guards swapping the session, publishers and subscribers in and out; declaring, undeclaring and
+    closing (which can block on a dead link) happen outside it, so publishing never waits on them.
+    """
+
     def __init__(
-        self, *, open_session: Any, robot_id: str, bridge: _Bridge, print_publish: bool
+        self,
+        *,
+        open_session: Any,
+        robot_id: Optional[str],
+        bridge: _Bridge,
+        decode_pool: _DecodePool,
+        print_publish: bool,
+        motor_encoding: str = "json",
     ) -> None:
         self._open_session = open_session
         self._robot_id = robot_id
         self._bridge = bridge
+        self._decode_pool = decode_pool
         self._print_publish = bool(print_publish)
+        self._motor_encoding = motor_encoding
+        if robot_id is not None:
+            self._key_motor = _key(robot_id, "motor/cmd")
+            self._key_oled = _key(robot_id, "oled/cmd")
 
+        self._lock = threading.Lock()
         self._session: Any = None
         self._pub_motor: Any = None
         self._pub_oled: Any = None
-        self._sub_motor_telemetry: Any = None
-        self._sub_imu: Any = None
-        self._sub_cam_meta: Any = None
-        self._sub_cam_jpeg: Any = None
-        self._sub_lidar_scan: Any = None
-        self._sub_lidar_front: Any = None
-
-    def open(self) -> None:
-        self._session = self._open_session()
-        key_motor = _key(self._robot_id, "motor/cmd")
-        key_oled = _key(self._robot_id, "oled/cmd")
-        self._pub_motor = self._session.declare_publisher(key_motor)
-        self._pub_oled = self._session.declare_publisher(key_oled)
-        self._key_motor = key_motor
-        self._key_oled = key_oled
+        self._subs: list[Any] = []
+
+    def open(self, *, cancelled: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Opens the session and declares everything. `zenoh.open()` may block; if `cancelled()` is
+        true by the time it returns (the app is shutting down), the new session is closed instead.
+        """
+        session = self._open_session()
+        pub_motor = pub_oled = None
+        subs: list[Any] = []
+        try:
+            pub_motor, pub_oled, subs = self._declare(session)
+        except BaseException:
+            self._teardown(session, subs)
+            raise
+        with self._lock:
+            stale = cancelled is not None and cancelled()
+            if not stale:
+                self._session = session
+                self._pub_motor = pub_motor
+                self._pub_oled = pub_oled
+                self._subs = subs
+        if stale:
+            self._teardown(session, subs)
+            return
+        if self._robot_id is None:
+            self._bridge.qobj.log.emit(f"zenoh connected (fleet: {_FLEET_KEY})")
+            return
         if self._print_publish:
-            print(f"[pub] motor: {key_motor}", flush=True)
-            print(f"[pub] oled : {key_oled}", flush=True)
-
-        def on_imu(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.imu.emit(payload)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"imu decode failed: {e}")
-
-        def on_motor_telemetry(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.motor_telemetry.emit(payload)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"motor/telemetry decode failed: {e}")
-
-        def on_meta(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.cam_meta.emit(payload)
-            except Exception:
-                return
-
-        def on_jpeg(sample: Any) -> None:
-            try:
-                jpg = sample.payload.to_bytes()
-                self._bridge.qobj.cam_jpeg.emit(jpg)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"camera jpeg receive failed: {e}")
-
-        def on_lidar_scan(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.lidar_scan.emit(payload)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"lidar/scan decode failed: {e}")
-
-        def on_lidar_front(sample: Any) -> None:
-            try:
-                payload = _decode_json_payload(sample)
-                self._bridge.qobj.lidar_front.emit(payload)
-            except Exception as e:
-                self._bridge.qobj.log.emit(f"lidar/front decode failed: {e}")
-
-        self._sub_motor_telemetry = self._session.declare_subscriber(
-            _key(self._robot_id, "motor/telemetry"), on_motor_telemetry
-        )
-        self._sub_imu = self._session.declare_subscriber(_key(self._robot_id, "imu/state"), on_imu)
-        self._sub_cam_meta = self._session.declare_subscriber(
-            _key(self._robot_id, "camera/meta"), on_meta
-        )
-        self._sub_cam_jpeg = self._session.declare_subscriber(
-            _key(self._robot_id, "camera/image/jpeg"), on_jpeg
-        )
-        self._sub_lidar_scan = self._session.declare_subscriber(
-            _key(self._robot_id, "lidar/scan"), on_lidar_scan
-        )
-        self._sub_lidar_front = self._session.declare_subscriber(
-            _key(self._robot_id, "lidar/front"), on_lidar_front
-        )
-
+            print(f"[pub] motor: {self._key_motor} ({self._motor_encoding})", flush=True)
+            print(f"[pub] oled : {self._key_oled}", flush=True)
         self._bridge.qobj.log.emit("zenoh connected")
 
-    def close(self) -> None:
-        try:
-            if self._sub_lidar_front is not None:
-                self._sub_lidar_front.undeclare()
-        finally:
-            self._sub_lidar_front = None
+    def _declare(self, session: Any) -> tuple[Any, Any, list[Any]]:
+        """Declares on `session` without touching the live state: (pub_motor, pub_oled, subs)."""
+        subs: list[Any] = []
+        if self._robot_id is None:
+            subs.append(session.declare_subscriber(_FLEET_KEY, self._on_fleet_sample))
+            return None, None, subs
 
-        try:
-            if self._sub_lidar_scan is not None:
-                self._sub_lidar_scan.undeclare()
-        finally:
-            self._sub_lidar_scan = None
+        robot_id = self._robot_id
 
-        try:
-            if self._sub_cam_jpeg is not None:
-                self._sub_cam_jpeg.undeclare()
-        finally:
-            self._sub_cam_jpeg = None
+        def _submitter(topic: str) -> Callable[[Any], None]:
+            def _on_sample(sample: Any) -> None:
+                try:
+                    self._decode_pool.submit(robot_id, topic, sample.payload.to_bytes())
+                except Exception as e:
+                    self._bridge.qobj.log.emit(f"{_TOPIC_LABELS[topic]} receive failed: {e}")
 
-        try:
-            if self._sub_cam_meta is not None:
-                self._sub_cam_meta.undeclare()
-        finally:
-            self._sub_cam_meta = None
+            return _on_sample
 
         try:
-            if self._sub_imu is not None:
-                self._sub_imu.undeclare()
-        finally:
-            self._sub_imu = None
-
+            for suffix, topic in _SUBSCRIPTIONS:
+                subs.append(session.declare_subscriber(_key(robot_id, suffix), _submitter(topic)))
+            pub_motor = session.declare_publisher(self._key_motor)
+            pub_oled = session.declare_publisher(self._key_oled)
+        except BaseException:
+            # The caller closes the session; undeclare what was already declared first.
+            self._teardown(None, subs)
+            raise
+        return pub_motor, pub_oled, subs
+
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._session is not None
+
+    def link_state(self) -> str:
+        """
+        "down" (no session, or it was closed), "linked" (at least one router/peer), or "alone".
+        """
+        with self._lock:
+            session = self._session
+        if session is None or session.is_closed():
+            return "down"
+        info = session.info
+        if any(True for _ in info.routers_zid()) or any(True for _ in info.peers_zid()):
+            return "linked"
+        return "alone"
+
+    def _on_fleet_sample(self, sample: Any) -> None:
         try:
-            if self._sub_motor_telemetry is not None:
-                self._sub_motor_telemetry.undeclare()
-        finally:
-            self._sub_motor_telemetry = None
+            parsed = _split_key(str(sample.key_expr))
+            if parsed is None:
+                return
+            robot_id, topic = parsed
+            self._decode_pool.submit(robot_id, topic, sample.payload.to_bytes())
+        except Exception as e:
+            self._bridge.qobj.log.emit(f"fleet receive failed: {e}")
 
-        try:
-            if self._session is not None:
-                self._session.close()
-        finally:
-            self._session = None
+    def close(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+            subs, self._subs = self._subs, []
             self._pub_motor = None
             self._pub_oled = None
+        self._teardown(session, subs)
+
+    @staticmethod
+    def _teardown(session: Any, subs: list[Any]) -> None:
+        for sub in reversed(subs):
+            try:
+                sub.undeclare()
+            except Exception:
+                pass
+        subs.clear()
+        if session is not None:
+            try:
+                session.close()
+            except Exception:
+                pass
 
     def publish_motor(self, cmd: MotorCommand) -> None:
         self.publish_motor_ex(cmd, print_msg=None)
 
     def publish_motor_ex(self, cmd: MotorCommand, *, print_msg: Optional[bool]) -> None:
-        if self._pub_motor is None:
-            return
-        payload = cmd.to_dict()
-        self._pub_motor.put(json.dumps(payload).encode("utf-8"))
+        payload = cmd.to_bytes(self._motor_encoding)
+        # Held across put() (which does not block) so close() cannot swap the publisher out and
+        # close its session underneath it.
+        with self._lock:
+            pub = self._pub_motor
+            if pub is None:
+                return
+            pub.put(payload)
         do_print = self._print_publish if print_msg is None else bool(print_msg)
         if do_print:
             key = getattr(self, "_key_motor", "motor/cmd")
-            print(f"[pub] {key} {json.dumps(payload, ensure_ascii=False)}", flush=True)
+            print(f"[pub] {key} {json.dumps(cmd.to_dict(), ensure_ascii=False)}", flush=True)
 
     def publish_oled(self, text: str) -> None:
         self.publish_oled_ex(text, print_msg=None)
 
     def publish_oled_ex(self, text: str, *, print_msg: Optional[bool]) -> None:
-        if self._pub_oled is None:
-            return
         payload = {"text": str(text), "ts_ms": int(time.time() * 1000)}
-        self._pub_oled.put(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            pub = self._pub_oled
+            if pub is None:
+                return
+            pub.put(data)
         do_print = self._print_publish if print_msg is None else bool(print_msg)
         if do_print:
             key = getattr(self, "_key_oled", "oled/cmd")
             print(f"[pub] {key} {json.dumps(payload, ensure_ascii=False)}", flush=True)
 
 
+class _SessionSupervisor:
+    """
+    Keeps a ZenohClient connected, from a background thread.
+
+    A failed open is retried with exponential backoff instead of being fatal. Once a session has
+    seen a router/peer, losing all of them counts as an outage: zenoh gets `grace_s` to relink on
+    its own (it retries configured endpoints), after which the session is closed and reopened with
+    backoff; `ZenohClient.open()` re-declares every publisher and subscriber. The outage length
+    (link lost -> linked again) is reported on the bridge `status` signal.
+    """
+
+    def __init__(
+        self, *, client: ZenohClient, bridge: _Bridge, grace_s: float, backoff_max_s: float
+    ) -> None:
+        self._client = client
+        self._bridge = bridge
+        self._grace_s = float(grace_s)
+        self._backoff_max_s = max(_RECONNECT_BACKOFF_MIN_S, float(backoff_max_s))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.reconnects = 0
+        self.last_outage_s: Optional[float] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="zenoh-supervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _status(self, text: str) -> None:
+        self._bridge.qobj.status.emit(text)
+
+    def _log(self, msg: str) -> None:
+        self._bridge.qobj.log.emit(msg)
+
+    def _run(self) -> None:
+        client = self._client
+        backoff = _RECONNECT_BACKOFF_MIN_S
+        attempt = 0
+        down_since: Optional[float] = None  # monotonic start of the current outage
+        relink_deadline = 0.0
+        ever_linked = False
+        was_alone = False
+        wait_s = 0.0
+
+        while not self._stop.wait(wait_s):
+            wait_s = _RECONNECT_CHECK_S
+            if not client.is_open():
+                attempt += 1
+                try:
+                    client.open(cancelled=self._stop.is_set)
+                except (Exception, SystemExit) as e:
+                    # The opener reports zenoh.open() failures as SystemExit; here they are retryable.
+                    self._log(f"zenoh open failed (attempt {attempt}): {e}")
+                    self._status(f"disconnected (retry {attempt} in {backoff:.1f} s)")
+                    try:
+                        client.close()
+                    except Exception:
+                        pass
+                    if down_since is None:
+                        down_since = time.monotonic()
+                    wait_s = backoff
+                    backoff = min(backoff * 2.0, self._backoff_max_s)
+                    continue
+                # A fresh session gets the grace period (or the current backoff) to find a peer.
+                relink_deadline = time.monotonic() + max(self._grace_s, backoff)
+                was_alone = False
+                if down_since is None:
+                    self._status("connected")
+
+            now = time.monotonic()
+            state = client.link_state()
+            if state == "linked":
+                ever_linked = True
+                backoff = _RECONNECT_BACKOFF_MIN_S
+                attempt = 0
+                if down_since is not None:
+                    outage = now - down_since
+                    down_since = None
+                    self.reconnects += 1
+                    self.last_outage_s = outage
+                    self._log(f"zenoh reconnected after {outage:.2f} s")
+                    self._status(f"connected (reconnected in {outage:.2f} s, #{self.reconnects})")
+                elif was_alone:
+                    self._status("connected")
+                was_alone = False
+                continue
+
+            if state == "alone" and not ever_linked:
+                # Nothing seen yet (e.g. the robot is not up): zenoh keeps scouting by itself.
+                if down_since is None and not was_alone:
+                    self._status("connected (no router/peer yet)")
+                was_alone = True
+                continue
+
+            if down_since is None:
+                down_since = now
+                relink_deadline = now + self._grace_s
+                self._log(f"zenoh link lost ({state})")
+            if state == "alone" and now < relink_deadline:
+                self._status(f"link lost {now - down_since:.1f} s (waiting for relink)")
+                continue
+
+            # Closed session, or no relink in time: rebuild it (the next loop reopens immediately).
+            self._log(f"zenoh reopening session after {now - down_since:.1f} s")
+            self._status(f"link lost {now - down_since:.1f} s (reopening)")
+            try:
+                client.close()
+            except Exception:
+                pass
+            wait_s = 0.0
+            backoff = min(backoff * 2.0, self._backoff_max_s)
+
+
 def _get_by_path(obj: Any, path: str) -> Any:
     cur = obj
     if not path:
@@ -523,6 +1175,158 @@ def _autodetect_vec3(
     return None, None
 
 
+class _Vec3Accessor:
+    """
+    Compiled form of a vec3 field path: a precomputed key/index chain to the container plus the
+    x/y/z keys to read from it (None = a list/tuple read as [0], [1], [2]).
+    """
+
+    __slots__ = ("path", "steps", "keys")
+
+    def __init__(self, path: str, steps: tuple[Any, ...], keys: Optional[tuple[str, str, str]]) -> None:
+        self.path = path
+        self.steps = steps
+        self.keys = keys
+
+    def __call__(self, payload: Any) -> Optional[tuple[float, float, float]]:
+        cur = payload
+        try:
+            for step in self.steps:
+                cur = cur[step]
+            if self.keys is None:
+                if not isinstance(cur, (list, tuple)):
+                    return None
+                x, y, z = cur[0], cur[1], cur[2]
+            else:
+                k0, k1, k2 = self.keys
+                x, y, z = cur[k0], cur[k1], cur[k2]
+        except (KeyError, IndexError, TypeError):
+            return None
+        if (
+            isinstance(x, (int, float))
+            and isinstance(y, (int, float))
+            and isinstance(z, (int, float))
+        ):
+            return float(x), float(y), float(z)
+        return None
+
+
+def _compile_vec3_accessor(
+    payload: Any, path: str, *, keysets: tuple[tuple[str, str, str], ...]
+) -> Optional[_Vec3Accessor]:
+    """
+    Resolves `path` against `payload` once, with the same rules as `_extract_vec3_with_keysets`.
+    """
+    steps: list[Any] = []
+    cur = payload
+    if path and path != "<root>":
+        for part in path.split("."):
+            if isinstance(cur, dict):
+                if part not in cur:
+                    return None
+                steps.append(part)
+                cur = cur[part]
+            elif isinstance(cur, (list, tuple)):
+                try:
+                    i = int(part)
+                    cur = cur[i]
+                except Exception:
+                    return None
+                steps.append(i)
+            else:
+                return None
+
+    if isinstance(cur, dict):
+        for keys in keysets:
+            accessor = _Vec3Accessor(path, tuple(steps), keys)
+            if accessor(payload) is not None:
+                return accessor
+        return None
+    if isinstance(cur, (list, tuple)):
+        accessor = _Vec3Accessor(path, tuple(steps), None)
+        return accessor if accessor(payload) is not None else None
+    return None
+
+
+class _Vec3Resolver:
+    """
+    Finds one vec3 (gyro or accel) in IMU payloads without searching every sample.
+
+    The accessor found for a payload schema (fingerprint: its top-level keys) is cached, so
+    `_autodetect_vec3`'s BFS runs again only when the schema changes, or when the cached accessor
+    stops matching. Two kinds of entry are only provisional and re-detected every
+    `_REDETECT_EVERY` samples: misses (nothing found yet), and an autodetected path other than the
+    first candidate, so a payload that started with e.g. `"gyro": null` moves to the real gyro once
+    it shows up.
+    """
+
+    _MAX_SCHEMAS = 32
+    _REDETECT_EVERY = 64
+
+    def __init__(
+        self, *, candidates: tuple[str, ...], keysets: tuple[tuple[str, str, str], ...]
+    ) -> None:
+        self._candidates = candidates
+        self._keysets = keysets
+        # None = cached miss.
+        self._cache: dict[tuple[str, Any], Optional[_Vec3Accessor]] = {}
+        # Samples left before a provisional cache entry is re-detected.
+        self._provisional: dict[tuple[str, Any], int] = {}
+        self.detections = 0
+
+    @staticmethod
+    def _fingerprint(payload: Any) -> Any:
+        if isinstance(payload, dict):
+            return tuple(payload)
+        return type(payload).__name__
+
+    def resolve(
+        self, payload: Any, manual_path: str
+    ) -> tuple[Optional[tuple[float, float, float]], Optional[str]]:
+        """
+        Returns (vec, auto_path): auto_path is None for a manual path, "" when nothing was found.
+        """
+        key = (manual_path, self._fingerprint(payload))
+        try:
+            accessor = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            left = self._provisional.get(key)
+            if left is None or left > 0:
+                if left is not None:
+                    self._provisional[key] = left - 1
+                if accessor is None:
+                    return None, None if manual_path else ""
+                vec = accessor(payload)
+                if vec is not None:
+                    return vec, None if manual_path else accessor.path
+
+        self.detections += 1
+        if manual_path:
+            accessor = _compile_vec3_accessor(payload, manual_path, keysets=self._keysets)
+        else:
+            detected, _vec = _autodetect_vec3(
+                payload, candidates=self._candidates, keysets=self._keysets
+            )
+            accessor = (
+                None
+                if detected is None
+                else _compile_vec3_accessor(payload, detected, keysets=self._keysets)
+            )
+        if len(self._cache) >= self._MAX_SCHEMAS and key not in self._cache:
+            self._cache.clear()
+            self._provisional.clear()
+        self._cache[key] = accessor
+        if accessor is None or (not manual_path and accessor.path != self._candidates[0]):
+            self._provisional[key] = self._REDETECT_EVERY
+        else:
+            self._provisional.pop(key, None)
+        if accessor is None:
+            return None, None if manual_path else ""
+        return accessor(payload), None if manual_path else accessor.path
+
+
 def _extract_lidar_points(payload: Any) -> tuple[Optional[int], Optional[int], list[tuple[float, float, Optional[float]]]]:
     seq = None
     ts_ms = None
@@ -546,32 +1350,1308 @@ def _extract_lidar_points(payload: Any) -> tuple[Optional[int], Optional[int], l
         rng = None
         intensity: Optional[float] = None
 
-        if isinstance(p, dict):
-            angle = p.get("angle_rad")
-            rng = p.get("range_m")
-            intensity_any = p.get("intensity")
-            if isinstance(intensity_any, (int, float)):
-                intensity = float(intensity_any)
-        elif isinstance(p, (list, tuple)) and len(p) >= 2:
-            angle = p[0]
-            rng = p[1]
-            if len(p) >= 3 and isinstance(p[2], (int, float)):
-                intensity = float(p[2])
+        if isinstance(p, dict):
+            angle = p.get("angle_rad")
+            rng = p.get("range_m")
+            intensity_any = p.get("intensity")
+            if isinstance(intensity_any, (int, float)):
+                intensity = float(intensity_any)
+        elif isinstance(p, (list, tuple)) and len(p) >= 2:
+            angle = p[0]
+            rng = p[1]
+            if len(p) >= 3 and isinstance(p[2], (int, float)):
+                intensity = float(p[2])
+
+        if not isinstance(angle, (int, float)) or not isinstance(rng, (int, float)):
+            continue
+        out.append((float(angle), float(rng), intensity))
+
+    return (
+        int(seq) if isinstance(seq, int) else None,
+        int(ts_ms) if isinstance(ts_ms, int) else None,
+        out,
+    )
+
+
+_IMU_GYRO_CANDIDATES = ("gyro", "gyr", "angular_velocity", "angularVelocity")
+_IMU_ACCEL_CANDIDATES = ("accel", "acc", "acceleration", "linear_acceleration", "linearAcceleration")
+
+
+@dataclass
+class _ImuSample:
+    recv_t: float
+    payload: Any
+    gyro: Optional[tuple[float, float, float]]
+    accel: Optional[tuple[float, float, float]]
+    # Auto-detected paths ("" = not found); None when a manual field path was used.
+    gyro_auto_path: Optional[str]
+    accel_auto_path: Optional[str]
+    # Payload ts_ms (robot clock) and host receive time minus it; None without ts_ms.
+    ts_ms: Optional[float] = None
+    latency_ms: Optional[float] = None
+
+
+class _ImuRing:
+    """
+    Preallocated columnar history for the IMU chart: t, gyro x/y/z, accel x/y/z, heading, |accel|,
+    arrival latency (ms).
+
+    Every row is written twice (at `i` and `i + capacity`), so the newest `n` rows are always one
+    contiguous slice and `view()` returns numpy views without copying or rolling. Missing vectors
+    are stored as NaN.
+    """
+
+    COLUMNS = ("t", "gx", "gy", "gz", "ax", "ay", "az", "heading", "amag", "latency")
+
+    def __init__(self, capacity: int) -> None:
+        import numpy as np
+
+        self.capacity = max(2, int(capacity))
+        self._data = np.full((len(self.COLUMNS), 2 * self.capacity), np.nan, dtype=np.float64)
+        self._pos = 0
+        self._n = 0
+        # Rows ever appended; the newest row has index `total - 1`.
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(
+        self,
+        t: float,
+        gyro: Optional[tuple[float, float, float]],
+        accel: Optional[tuple[float, float, float]],
+        heading: float = float("nan"),
+        amag: float = float("nan"),
+        latency_ms: float = float("nan"),
+    ) -> None:
+        nan = float("nan")
+        gx, gy, gz = gyro if gyro is not None else (nan, nan, nan)
+        ax, ay, az = accel if accel is not None else (nan, nan, nan)
+        row = (t, gx, gy, gz, ax, ay, az, heading, amag, latency_ms)
+        i = self._pos
+        self._data[:, i] = row
+        self._data[:, i + self.capacity] = row
+        self._pos = (i + 1) % self.capacity
+        if self._n < self.capacity:
+            self._n += 1
+        self.total += 1
+
+    def append_block(self, block: Any) -> None:
+        """
+        Appends the columns of a (len(COLUMNS), m) array, oldest first.
+        """
+        m = int(block.shape[1])
+        if m > self.capacity:
+            self.total += m - self.capacity
+            block = block[:, m - self.capacity :]
+            m = self.capacity
+        cap = self.capacity
+        i = self._pos
+        first = min(m, cap - i)
+        for base in (0, cap):
+            self._data[:, base + i : base + i + first] = block[:, :first]
+            self._data[:, base : base + m - first] = block[:, first:]
+        self._pos = (i + m) % cap
+        self._n = min(cap, self._n + m)
+        self.total += m
+
+    def view(self) -> Any:
+        """
+        (len(COLUMNS), n) view of the newest `n` rows, oldest first. Valid until the next `append()`.
+        """
+        end = self._pos + self.capacity
+        return self._data[:, end - self._n : end]
+
+    def clear(self) -> None:
+        self._pos = 0
+        self._n = 0
+        self.total = 0
+
+
+class _ImuHistory:
+    """
+    Long IMU history with a min/max pyramid for drawing.
+
+    Raw samples go to an `_ImuRing`. Level k (k >= 1) keeps, for every bin of FACTOR**k samples,
+    the per-channel minimum (`lo` ring, t = first sample of the bin) and maximum (`hi` ring,
+    t = last sample). Complete bins are folded in numpy batches on `query()`, not per sample.
+    `query()` returns the finest level whose point count over the requested time window fits the
+    pixel budget, so a redraw costs O(pixels) whatever the history length or zoom.
+
+    Derived signals are computed as samples arrive, in O(1): `heading` is the running
+    (trapezoidal) integral of gz, `amag` is |accel|. `spectrum()` runs one windowed rfft over the
+    newest samples and is meant to be called at a low, fixed rate.
+    """
+
+    FACTOR = 4
+
+    def __init__(self, capacity: int) -> None:
+        self.raw = _ImuRing(capacity)
+        # Every level spans at least the samples of the raw ring (+2 bins for unaligned edges); the
+        # coarsest bin is at most half the raw capacity, so the not-yet-folded tail is always still
+        # in the raw ring.
+        self._levels: list[tuple[_ImuRing, _ImuRing]] = []
+        bin_size = self.FACTOR
+        while bin_size <= self.raw.capacity // 2:
+            size = self.raw.capacity // bin_size + 2
+            self._levels.append((_ImuRing(size), _ImuRing(size)))
+            bin_size *= self.FACTOR
+        self.heading = 0.0
+        self._gz_last: Optional[tuple[float, float]] = None
+        self._fft_window: Any = None
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def append(
+        self,
+        t: float,
+        gyro: Optional[tuple[float, float, float]],
+        accel: Optional[tuple[float, float, float]],
+        latency_ms: Optional[float] = None,
+    ) -> None:
+        nan = float("nan")
+        heading = nan
+        if gyro is not None:
+            gz = gyro[2]
+            last = self._gz_last
+            if last is not None and 0.0 < t - last[0] <= _IMU_HEADING_MAX_GAP_S:
+                self.heading += 0.5 * (gz + last[1]) * (t - last[0])
+            self._gz_last = (t, gz)
+            heading = self.heading
+        amag = nan
+        if accel is not None:
+            ax, ay, az = accel
+            amag = (ax * ax + ay * ay + az * az) ** 0.5
+        self.raw.append(t, gyro, accel, heading, amag, nan if latency_ms is None else latency_ms)
+        # Without redraws (e.g. minimized) fold anyway before unfolded samples get overwritten.
+        if self._levels:
+            unfolded = self.raw.total - self._levels[0][0].total * self.FACTOR
+            if unfolded >= self.raw.capacity // 2:
+                self._fold()
+
+    def clear(self) -> None:
+        self.raw.clear()
+        for lo, hi in self._levels:
+            lo.clear()
+            hi.clear()
+        self.reset_heading()
+
+    def reset_heading(self) -> None:
+        self.heading = 0.0
+        self._gz_last = None
+
+    def spectrum(self, column: str, size: int) -> Optional[tuple[Any, Any, float]]:
+        """
+        Amplitude spectrum of the newest `size` samples of `column` (Hann window, mean removed).
+
+        Returns (freqs_hz, amplitude, sample_rate_hz), or None while there is too little data.
+        The sample rate is estimated from the sample times of the window.
+        """
+        import numpy as np
+
+        view = self.raw.view()
+        n = min(int(size), view.shape[1])
+        if n < 16:
+            return None
+        t = view[0, -n:]
+        span = float(t[-1] - t[0])
+        if span <= 0.0:
+            return None
+        fs = (n - 1) / span
+        x = view[_ImuRing.COLUMNS.index(column), -n:]
+        finite = np.isfinite(x)
+        if not finite.any():
+            return None
+        x = np.where(finite, x - x[finite].mean(), 0.0)
+        if self._fft_window is None or self._fft_window.shape[0] != n:
+            self._fft_window = np.hanning(n)
+        w = self._fft_window
+        amp = np.abs(np.fft.rfft(x * w)) * (2.0 / w.sum())
+        return np.fft.rfftfreq(n, d=1.0 / fs), amp, fs
+
+    def _fold(self) -> None:
+        import numpy as np
+
+        f = self.FACTOR
+        src_lo = src_hi = self.raw
+        for lo, hi in self._levels:
+            n = src_lo.total // f - lo.total
+            if n <= 0:
+                return
+            lo_v, hi_v = src_lo.view(), src_hi.view()
+            start = lo.total * f - (src_lo.total - lo_v.shape[1])
+            stop = start + n * f
+            seg_lo = lo_v[:, start:stop].reshape(lo_v.shape[0], n, f)
+            seg_hi = hi_v[:, start:stop].reshape(hi_v.shape[0], n, f)
+            new_lo = np.empty((lo_v.shape[0], n), dtype=np.float64)
+            new_hi = np.empty_like(new_lo)
+            new_lo[0] = seg_lo[0, :, 0]
+            new_hi[0] = seg_hi[0, :, -1]
+            # fmin/fmax skip NaN (missing gyro/accel) unless the whole bin is missing.
+            np.fmin.reduce(seg_lo[1:], axis=2, out=new_lo[1:])
+            np.fmax.reduce(seg_hi[1:], axis=2, out=new_hi[1:])
+            lo.append_block(new_lo)
+            hi.append_block(new_hi)
+            src_lo, src_hi = lo, hi
+
+    def query(self, t0: float, t1: float, max_points: int) -> tuple[Any, Any]:
+        """
+        Returns (t, values) for [t0, t1] (plus one point either side); values is (9, m) in
+        `_ImuRing.COLUMNS[1:]` order. Decimated levels interleave each bin's min and max.
+        """
+        import numpy as np
+
+        self._fold()
+        raw = self.raw.view()
+        n = raw.shape[1]
+        t = raw[0]
+        i0 = max(0, int(np.searchsorted(t, t0, side="left")) - 1)
+        i1 = min(n, int(np.searchsorted(t, t1, side="right")) + 1)
+        count = i1 - i0
+        if count <= max_points or not self._levels:
+            return t[i0:i1], raw[1:, i0:i1]
+
+        level = 1
+        while level < len(self._levels) and 2 * count > max_points * self.FACTOR**level:
+            level += 1
+        lo, hi = self._levels[level - 1]
+        lo_v, hi_v = lo.view(), hi.view()
+        j0 = max(0, int(np.searchsorted(lo_v[0], t0, side="left")) - 1)
+        j1 = min(lo_v.shape[1], int(np.searchsorted(lo_v[0], t1, side="right")) + 1)
+
+        # Samples newer than the last complete bin, reduced on the fly as one partial bin.
+        tail = raw[:, lo.total * self.FACTOR**level - (self.raw.total - n) :]
+        with_tail = tail.shape[1] > 0 and tail[0, 0] <= t1
+        m = j1 - j0
+        out = np.empty((raw.shape[0], 2 * (m + int(with_tail))), dtype=np.float64)
+        out[:, 0 : 2 * m : 2] = lo_v[:, j0:j1]
+        out[:, 1 : 2 * m : 2] = hi_v[:, j0:j1]
+        if with_tail:
+            out[0, -2] = tail[0, 0]
+            out[0, -1] = tail[0, -1]
+            np.fmin.reduce(tail[1:], axis=1, out=out[1:, -2])
+            np.fmax.reduce(tail[1:], axis=1, out=out[1:, -1])
+        return out[0], out[1:]
+
+
+class _ImuReorder:
+    """
+    Puts IMU samples back into payload-timestamp order within a small window.
+
+    A sample is released once a sample at least `window_s` newer (robot time) has arrived, or
+    `window_s` after it was received (host time), so a stalled stream still drains. Samples older
+    than the last released one arrive too late to be inserted and are dropped (counted in `late`).
+    """
+
+    def __init__(self, window_s: float) -> None:
+        self.window_s = max(0.0, float(window_s))
+        self._heap: list[tuple[float, int, float, Any]] = []
+        self._seq = 0
+        self._newest = float("-inf")
+        self._released = float("-inf")
+        self.late = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, t: float, recv_t: float, item: Any) -> None:
+        if t < self._released:
+            self.late += 1
+            return
+        self._seq += 1
+        heapq.heappush(self._heap, (t, self._seq, recv_t, item))
+        if t > self._newest:
+            self._newest = t
+
+    def pop_ready(self, now: float) -> list[tuple[float, Any]]:
+        out = []
+        heap = self._heap
+        horizon = self._newest - self.window_s
+        while heap and (heap[0][0] <= horizon or heap[0][2] + self.window_s <= now):
+            t, _seq, _recv_t, item = heapq.heappop(heap)
+            self._released = t
+            out.append((t, item))
+        return out
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._newest = float("-inf")
+        self._released = float("-inf")
+        self.late = 0
+
+
+class _ImuDecoder:
+    """
+    Decodes imu/state in a worker thread. Field paths are set from the GUI thread
+    (plain attribute assignment, read once per sample).
+    """
+
+    def __init__(self) -> None:
+        self.gyro_path = ""
+        self.accel_path = ""
+        self._gyro = _Vec3Resolver(candidates=_IMU_GYRO_CANDIDATES, keysets=_VEC3_KEYSETS_GYRO)
+        self._accel = _Vec3Resolver(candidates=_IMU_ACCEL_CANDIDATES, keysets=_VEC3_KEYSETS_ACCEL)
+
+    def __call__(self, raw: bytes, recv_t: float) -> _ImuSample:
+        payload = _decode_json_bytes(raw)
+
+        gyro, gyro_auto = self._gyro.resolve(payload, self.gyro_path)
+        accel, accel_auto = self._accel.resolve(payload, self.accel_path)
+
+        ts_ms = payload.get("ts_ms") if isinstance(payload, dict) else None
+        latency_ms = None
+        if isinstance(ts_ms, (int, float)) and not isinstance(ts_ms, bool):
+            ts_ms = float(ts_ms)
+            # Wall clock at receive time (recv_t is monotonic, taken in the subscriber callback).
+            recv_wall = time.time() - (time.monotonic() - recv_t)
+            latency_ms = recv_wall * 1000.0 - ts_ms
+        else:
+            ts_ms = None
+
+        return _ImuSample(
+            recv_t=recv_t,
+            payload=payload,
+            gyro=gyro,
+            accel=accel,
+            gyro_auto_path=gyro_auto,
+            accel_auto_path=accel_auto,
+            ts_ms=ts_ms,
+            latency_ms=latency_ms,
+        )
+
+
+def _format_motor_telemetry(payload: Any) -> tuple[str, str]:
+    if not isinstance(payload, dict):
+        return "pw_l=-- pw_r=-- (raw --/--)", "cmd_v_l=-- cmd_v_r=-- seq=-- ts_ms=--"
+
+    def _i(v: Any) -> Optional[int]:
+        if isinstance(v, bool):
+            return None
+        if isinstance(v, int):
+            return int(v)
+        return None
+
+    def _f(v: Any) -> Optional[float]:
+        if isinstance(v, bool):
+            return None
+        if isinstance(v, (int, float)):
+            return float(v)
+        return None
+
+    def _s(v: Optional[Any]) -> str:
+        return "--" if v is None else str(v)
+
+    pw_text = (
+        f"pw_l={_s(_i(payload.get('pw_l')))} pw_r={_s(_i(payload.get('pw_r')))} "
+        f"(raw {_s(_i(payload.get('pw_l_raw')))}/{_s(_i(payload.get('pw_r_raw')))})"
+    )
+
+    cmd_v_l = _f(payload.get("cmd_v_l"))
+    cmd_v_r = _f(payload.get("cmd_v_r"))
+    cmd_ts_ms = _i(payload.get("cmd_ts_ms"))
+    if cmd_ts_ms is None:
+        cmd_ts_ms = _i(payload.get("ts_ms"))
+    cmd_v_l_s = "--" if cmd_v_l is None else f"{cmd_v_l:+.3f}"
+    cmd_v_r_s = "--" if cmd_v_r is None else f"{cmd_v_r:+.3f}"
+    cmd_text = (
+        f"cmd_v_l={cmd_v_l_s} cmd_v_r={cmd_v_r_s} "
+        f"seq={_s(_i(payload.get('cmd_seq')))} ts_ms={_s(cmd_ts_ms)}"
+    )
+    return pw_text, cmd_text
+
+
+def _decode_motor_telemetry(raw: bytes, recv_t: float) -> tuple[str, str]:
+    return _format_motor_telemetry(_decode_json_bytes(raw))
+
+
+def _decode_cam_meta(raw: bytes, recv_t: float) -> Optional[str]:
+    try:
+        return "meta: " + json.dumps(_decode_json_bytes(raw), ensure_ascii=False)
+    except Exception:
+        return None
+
+
+@dataclass
+class _CameraFrame:
+    recv_t: float
+    # Final image for the display (already scaled to `target_size` when one was set).
+    image: Any
+    source_size: tuple[int, int]
+    target_size: Optional[tuple[int, int]]
+    work_ms: float
+    # JPEG DCT scale used while decoding (1 = full resolution), decoder ("pillow" / "qt"), and
+    # whether the final rescale used FastTransformation.
+    decode_scale: int = 1
+    backend: str = "qt"
+    fast: bool = False
+
+
+class _CameraDecoder:
+    """
+    Decodes and scales camera/image/jpeg in a worker thread.
+
+    The GUI publishes the display size in `target_size` (a tuple assignment, read once per frame).
+    The JPEG is decoded directly at the smallest DCT scale (1/2, 1/4, 1/8) that still covers the
+    aspect-fitted display size, with Pillow's `draft()` or, without Pillow, `QImageReader`'s scaled
+    decode; only the remaining (< 2x) rescale is done on pixels. The GUI thread just paints the
+    final QImage. The camera lane is "latest": a frame arriving while the previous
+    one is still being decoded replaces the waiting one, so the worker always works on the newest.
+
+    `scaling="auto"` uses FastTransformation for the final rescale while frames arrive faster than
+    `fast_above_fps`, SmoothTransformation otherwise. The arrival rate comes from `arrivals` (the
+    lane's `_DecodePool.received` counter), not from the frames decoded here: under overload the
+    lane drops frames, and the decoded rate would fall just when the fast path is needed.
+    """
+
+    def __init__(
+        self,
+        *,
+        target_size: Optional[tuple[int, int]] = None,
+        scaling: str = "auto",
+        fast_above_fps: float = 20.0,
+    ) -> None:
+        self.target_size = target_size
+        self.scaling = scaling
+        self.fast_above_fps = float(fast_above_fps)
+        # Written by the worker only; read by the GUI for statistics.
+        self.decoded = 0
+        self.work_s = 0.0
+        self.fps = 0.0
+        # Set by the owner once the decode pool exists; without it "auto" stays smooth.
+        self.arrivals: Optional[Callable[[], int]] = None
+        self._rate_mark: Optional[tuple[float, int]] = None
+        self._pillow: Any = None
+        try:
+            from PIL import Image
+
+            self._pillow = Image
+        except Exception:
+            pass
+
+    def _use_fast(self) -> bool:
+        arrivals = self.arrivals
+        if arrivals is not None:
+            now = time.monotonic()
+            n = arrivals()
+            mark = self._rate_mark
+            if mark is None:
+                self._rate_mark = (now, n)
+            elif now - mark[0] >= _CAMERA_RATE_WINDOW_S:
+                self.fps = (n - mark[1]) / (now - mark[0])
+                self._rate_mark = (now, n)
+        if self.scaling == "auto":
+            return self.fps > self.fast_above_fps
+        return self.scaling == "fast"
+
+    @staticmethod
+    def _fit(source: tuple[int, int], target: tuple[int, int]) -> tuple[int, int]:
+        """Size of `source` scaled into `target` with KeepAspectRatio."""
+        k = min(target[0] / max(1, source[0]), target[1] / max(1, source[1]))
+        return max(1, int(source[0] * k)), max(1, int(source[1] * k))
+
+    def _decode_pillow(
+        self, raw: bytes, target: Optional[tuple[int, int]]
+    ) -> tuple[Any, tuple[int, int], int]:
+        import io
+
+        from PySide6.QtGui import QImage
+
+        im = self._pillow.open(io.BytesIO(raw))  # parses the header only
+        source_size = im.size
+        if target is not None:
+            # draft() picks the largest DCT reduction whose size is still >= the requested size.
+            im.draft("RGB", self._fit(source_size, target))
+        if im.mode != "RGB":  # grayscale / CMYK JPEGs
+            im = im.convert("RGB")
+        scale = max(1, source_size[0] // max(1, im.width))
+        # Pillow stores RGB as 4 bytes per pixel with a 0xff pad, so "RGBX" is a plain row copy.
+        # The QImage wraps those bytes (PySide keeps a reference) instead of copying them again.
+        data = im.tobytes("raw", "RGBX")
+        img = QImage(data, im.width, im.height, im.width * 4, QImage.Format_RGBX8888)
+        return img, source_size, scale
+
+    @classmethod
+    def _decode_qt(
+        cls, raw: bytes, target: Optional[tuple[int, int]]
+    ) -> tuple[Any, tuple[int, int], int]:
+        from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSize
+        from PySide6.QtGui import QImageReader
+
+        buf = QBuffer()
+        buf.setData(QByteArray(raw))
+        buf.open(QIODevice.ReadOnly)
+        reader = QImageReader(buf, b"jpg")
+        size = reader.size()
+        source_size = (size.width(), size.height())
+        scale = 1
+        if target is not None and size.isValid():
+            fit = cls._fit(source_size, target)
+            while (
+                scale < _CAMERA_MAX_DECODE_SCALE
+                and source_size[0] // (scale * 2) >= fit[0]
+                and source_size[1] // (scale * 2) >= fit[1]
+            ):
+                scale *= 2
+            if scale > 1:
+                reader.setScaledSize(
+                    QSize(-(-source_size[0] // scale), -(-source_size[1] // scale))
+                )
+        img = reader.read()
+        if img.isNull():
+            raise ValueError(f"not a decodable JPEG (bytes={len(raw)}): {reader.errorString()}")
+        return img, source_size, scale
+
+    def __call__(self, raw: bytes, recv_t: float) -> _CameraFrame:
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QImage
+
+        t = time.perf_counter()
+        fast = self._use_fast()
+        target = self.target_size
+        if target is not None and (target[0] <= 0 or target[1] <= 0):
+            target = None
+        backend = "pillow" if self._pillow is not None else "qt"
+        if backend == "pillow":
+            try:
+                img, source_size, scale = self._decode_pillow(raw, target)
+            except Exception:
+                # Let Qt have a go (and report its error if it cannot decode either).
+                backend = "qt"
+        if backend == "qt":
+            img, source_size, scale = self._decode_qt(raw, target)
+        if target is not None and (img.width(), img.height()) != target:
+            mode = Qt.FastTransformation if fast else Qt.SmoothTransformation
+            img = img.scaled(target[0], target[1], Qt.KeepAspectRatio, mode)
+        if img.format() != QImage.Format_RGB32:
+            # RGBX8888 -> RGB32 converts in place when the image owns its pixels (a scaled one), and
+            # the view's paintEvent is then a plain blit.
+            img.convertTo(QImage.Format_RGB32)
+        work_s = time.perf_counter() - t
+        self.decoded += 1
+        self.work_s += work_s
+        return _CameraFrame(
+            recv_t=recv_t,
+            image=img,
+            source_size=source_size,
+            target_size=self.target_size,
+            work_ms=work_s * 1000.0,
+            decode_scale=scale,
+            backend=backend,
+            fast=fast,
+        )
+
+
+@dataclass
+class _LidarScan:
+    seq: Optional[int]
+    ts_ms: Optional[int]
+    angles: Any  # np.ndarray [rad] (float32 views for binary scans, float64 for JSON)
+    ranges: Any  # np.ndarray [m]
+    intensity: Any = None  # Optional[np.ndarray]
+    layout: str = ""
+
+
+def _decode_lidar_scan_bin(raw: bytes) -> _LidarScan:
+    seq, ts_ms, angles, ranges, intensity = decode_lidar_scan_bin(raw)
+    return _LidarScan(
+        seq=seq, ts_ms=ts_ms, angles=angles, ranges=ranges, intensity=intensity, layout="bin"
+    )
+
+
+def _scan_header(payload: dict[str, Any]) -> tuple[Optional[int], Optional[int]]:
+    seq = payload.get("seq")
+    ts_ms = payload.get("ts_ms")
+    return (
+        int(seq) if isinstance(seq, int) else None,
+        int(ts_ms) if isinstance(ts_ms, int) else None,
+    )
+
+
+def _column(items: Any, getter: Callable[[Any], Any]) -> Any:
+    import numpy as np
+
+    return np.fromiter(map(getter, items), dtype=np.float64, count=len(items))
+
+
+class _LidarJsonDecoder:
+    """
+    Bulk decoder for JSON lidar/scan payloads.
+
+    The layout is detected on the first scan of a stream and cached; later scans go straight to the
+    numpy conversion for that layout. If a scan no longer fits the cached layout, it is detected again.
+    Scans with bad points (e.g. null ranges) fall back to the per-point `_extract_lidar_points`.
+
+    Layouts:
+      dict_points : {"points": [{"angle_rad": a, "range_m": r, "intensity": i}, ...]}
+      list_points : {"points": [[a, r, i?], ...]}
+      columnar    : {"angles" | "angle_rad": [...], "ranges" | "range_m": [...], "intensities"?: [...]}
+      laserscan   : {"angle_min": a0, "angle_increment": da, "ranges": [...], "intensities"?: [...]}
+    """
+
+    _GET_ANGLE = operator.itemgetter("angle_rad")
+    _GET_RANGE = operator.itemgetter("range_m")
+    _GET_INTENSITY = operator.itemgetter("intensity")
+    _GET_0 = operator.itemgetter(0)
+    _GET_1 = operator.itemgetter(1)
+    _GET_2 = operator.itemgetter(2)
+
+    def __init__(self) -> None:
+        self.layout: Optional[str] = None
+
+    @staticmethod
+    def detect(payload: Any) -> str:
+        if not isinstance(payload, dict):
+            return "unknown"
+        points = payload.get("points")
+        if isinstance(points, list) and points:
+            first = points[0]
+            if isinstance(first, dict):
+                return "dict_points"
+            if isinstance(first, (list, tuple)):
+                return "list_points"
+            return "unknown"
+        ranges = payload.get("ranges", payload.get("range_m"))
+        if isinstance(ranges, list):
+            if "angle_min" in payload and "angle_increment" in payload:
+                return "laserscan"
+            if isinstance(payload.get("angles", payload.get("angle_rad")), list):
+                return "columnar"
+        return "unknown"
+
+    def decode(self, payload: Any) -> _LidarScan:
+        layout = self.layout
+        if layout is not None:
+            try:
+                return self._decode_layout(payload, layout)
+            except (KeyError, IndexError, TypeError, ValueError, AttributeError):
+                pass
+
+        detected = self.detect(payload)
+        if detected != "unknown":
+            try:
+                scan = self._decode_layout(payload, detected)
+                self.layout = detected
+                return scan
+            except (KeyError, IndexError, TypeError, ValueError, AttributeError):
+                pass
+        return self._decode_slow(payload)
+
+    def _decode_layout(self, payload: dict[str, Any], layout: str) -> _LidarScan:
+        import numpy as np
+
+        seq, ts_ms = _scan_header(payload)
+        intensity = None
+        if layout == "dict_points":
+            points = payload["points"]
+            angles = _column(points, self._GET_ANGLE)
+            ranges = _column(points, self._GET_RANGE)
+            try:
+                intensity = _column(points, self._GET_INTENSITY)
+            except (KeyError, TypeError, ValueError):
+                intensity = None
+        elif layout == "list_points":
+            points = payload["points"]
+            angles = _column(points, self._GET_0)
+            ranges = _column(points, self._GET_1)
+            try:
+                intensity = _column(points, self._GET_2)
+            except (IndexError, TypeError, ValueError):
+                intensity = None
+        elif layout == "columnar":
+            angles_any = payload.get("angles", payload.get("angle_rad"))
+            ranges_any = payload.get("ranges", payload.get("range_m"))
+            angles = np.asarray(angles_any, dtype=np.float64)
+            ranges = np.asarray(ranges_any, dtype=np.float64)
+            if angles.ndim != 1 or angles.shape != ranges.shape:
+                raise ValueError("columnar scan: angles/ranges shape mismatch")
+            intensity = self._optional_column(payload, ranges.shape)
+        elif layout == "laserscan":
+            ranges = np.asarray(payload["ranges"], dtype=np.float64)
+            if ranges.ndim != 1:
+                raise ValueError("laserscan: ranges must be 1-D")
+            angle_min = float(payload["angle_min"])
+            angle_inc = float(payload["angle_increment"])
+            angles = angle_min + angle_inc * np.arange(ranges.shape[0], dtype=np.float64)
+            intensity = self._optional_column(payload, ranges.shape)
+        else:
+            raise ValueError(f"unknown layout: {layout}")
+        return _LidarScan(
+            seq=seq, ts_ms=ts_ms, angles=angles, ranges=ranges, intensity=intensity, layout=layout
+        )
+
+    @staticmethod
+    def _optional_column(payload: dict[str, Any], shape: tuple[int, ...]) -> Any:
+        import numpy as np
+
+        values = payload.get("intensities", payload.get("intensity"))
+        if not isinstance(values, list):
+            return None
+        try:
+            arr = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        return arr if arr.shape == shape else None
+
+    @staticmethod
+    def _decode_slow(payload: Any) -> _LidarScan:
+        import numpy as np
+
+        seq, ts_ms, pts = _extract_lidar_points(payload)
+        n = len(pts)
+        angles = np.fromiter((p[0] for p in pts), dtype=np.float64, count=n)
+        ranges = np.fromiter((p[1] for p in pts), dtype=np.float64, count=n)
+        return _LidarScan(seq=seq, ts_ms=ts_ms, angles=angles, ranges=ranges, layout="per-point")
+
+
+class _LidarScanDecoder:
+    """
+    lidar/scan decoder for one stream: binary scans are detected by magic, JSON goes through a
+    `_LidarJsonDecoder` that keeps the detected layout for this stream.
+    """
+
+    def __init__(self) -> None:
+        self._json = _LidarJsonDecoder()
+
+    def __call__(self, raw: bytes, recv_t: float) -> _LidarScan:
+        if raw[:2] == LIDAR_BIN_MAGIC:
+            return _decode_lidar_scan_bin(raw)
+        return self._json.decode(_decode_json_bytes(raw))
+
+
+def _decode_lidar_front(raw: bytes, recv_t: float) -> str:
+    return "front: " + json.dumps(_decode_json_bytes(raw), ensure_ascii=False)
+
+
+class _TrigCache:
+    """
+    sin/cos tables for a LiDAR angle grid, reused while scans keep the same angles.
+
+    Most sensors publish the same angle set every scan, so a scan whose angles equal the cached
+    grid (same length, checked on a few samples and then exactly) reuses the tables; any other
+    scan recomputes them and becomes the new grid. After `MAX_MISSES` misses in a row (angles that
+    vary per scan) the cache stands aside for `BACKOFF_SCANS` scans before trying again, so varying
+    angles cost about the same as no cache.
+
+    Only float64 angles (JSON scans) are cached. numpy computes float32 sin/cos (binary scans)
+    with SIMD at a few ns per point, which is less than comparing and gathering the tables.
+    """
+
+    MAX_MISSES = 3
+    BACKOFF_SCANS = 15
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0  # float32 angles or backing off: computed directly by the caller
+        self._miss_streak = 0
+        self._backoff = 0
+        self._angles: Any = None
+        self._sin: Any = None
+        self._cos: Any = None
+
+    def lookup(self, angles: Any) -> Optional[tuple[Any, Any]]:
+        """(sin, cos) tables of `angles` (do not modify), or None for float32 angles."""
+        import numpy as np
+
+        if angles.dtype != np.float64 or self._backoff > 0:
+            self._backoff = max(0, self._backoff - 1)
+            self.bypassed += 1
+            return None
+        cached = self._angles
+        if (
+            cached is not None
+            and cached.shape == angles.shape
+            and (angles.shape[0] == 0 or (cached[0] == angles[0] and cached[-1] == angles[-1]))
+            and np.array_equal(cached, angles)
+        ):
+            self.hits += 1
+            self._miss_streak = 0
+            return self._sin, self._cos
+        self.misses += 1
+        self._miss_streak += 1
+        if self._miss_streak >= self.MAX_MISSES:
+            self._miss_streak = 0
+            self._backoff = self.BACKOFF_SCANS
+        # Own copy: binary scans are views into the received buffer.
+        self._angles = np.array(angles)
+        self._sin = np.sin(self._angles)
+        self._cos = np.cos(self._angles)
+        return self._sin, self._cos
+
+
+class _LidarPipeline:
+    """
+    Scan -> scatter positions for one LiDAR view, with the derived arrays cached per stage.
+
+    Stage 1 (once per new scan): drop invalid ranges and convert to XY. Stage 2 (new scan or changed
+    range filter / flip): filter and flip the cached XY. Stage 3 (also on pan/zoom/resize): level of
+    detail in screen space; points outside the viewport are culled and at most one point is kept per
+    `_LIDAR_LOD_CELL_PX` pixel cell, so a zoomed-out 20k-point scan draws roughly as many points as
+    pixels it covers, while zooming in brings the detail back. `max_points` caps what remains.
+
+    `view()` returns None when neither the scan nor the settings/viewport changed since its last
+    result, so an unchanged view costs nothing. Scans are identified by arrival order
+    (`set_scan()` calls), not by seq, which may repeat or be missing.
+    """
+
+    def __init__(self) -> None:
+        self.scan: Optional[_LidarScan] = None
+        self.arrived = 0
+        self.prepared = 0  # stage 1 runs
+        self.filtered = 0  # stage 2 runs
+        self.lod = 0  # stage 3 runs
+        self._prepared_id = 0
+        self.trig = _TrigCache()
+        self._a: Any = None
+        self._r: Any = None
+        self._x: Any = None
+        self._y: Any = None
+        self._sectors_key: Optional[tuple[int, int, float, bool]] = None
+        self._filter_key: Optional[tuple[int, float, bool]] = None
+        self._fx: Any = None
+        self._fy: Any = None
+        self._key: Optional[tuple[Any, ...]] = None
+
+    def set_scan(self, scan: _LidarScan) -> None:
+        self.scan = scan
+        self.arrived += 1
+
+    def invalidate(self) -> None:
+        """Makes the next `view()` / `sectors()` return a result (cached arrays are kept)."""
+        self._key = None
+        self._sectors_key = None
+
+    def view(
+        self,
+        *,
+        range_m: float,
+        max_points: int,
+        flip_y: bool,
+        viewport: Optional[tuple[float, float, float, float, int, int]] = None,
+    ) -> Optional[tuple[Any, int]]:
+        """
+        (pos (n, 2), n) for the current scan and settings, or None if unchanged.
+
+        `viewport` is (x0, x1, y0, y1, width_px, height_px) of the plot area; None skips the
+        screen-space stage (only `max_points` applies).
+        """
+        import numpy as np
+
+        if self.scan is None:
+            return None
+        key = (self.arrived, float(range_m), int(max_points), bool(flip_y), viewport)
+        if key == self._key:
+            return None
+        x, y = self.filtered_xy(range_m=range_m, flip_y=flip_y)
+        if viewport is not None:
+            x, y = self._screen_lod(x, y, viewport)
+            self.lod += 1
+        n = int(x.shape[0])
+        if n > max_points:
+            idx = np.linspace(0, n - 1, num=max_points, dtype=np.int64)
+            x, y = x[idx], y[idx]
+            n = max_points
+        self._key = key
+        return np.column_stack((x, y)), n
+
+    def filtered_xy(self, *, range_m: float, flip_y: bool) -> tuple[Any, Any]:
+        """Stage 1+2 output (x, y) for the current scan (cached); the scan must be set."""
+        if self._prepared_id != self.arrived:
+            self._prepare()
+        filter_key = (self.arrived, float(range_m), bool(flip_y))
+        if filter_key != self._filter_key:
+            x, y = self._x, self._y
+            if range_m > 0.0:
+                keep = self._r <= range_m
+                x, y = x[keep], y[keep]
+            self._fx, self._fy = x, (-y if flip_y else y)
+            self._filter_key = filter_key
+            self.filtered += 1
+        return self._fx, self._fy
+
+    def sectors(self, n: int, *, range_m: float, flip_y: bool) -> Optional[tuple[Any, Any, Any]]:
+        """`lidar_sectors()` of the current scan after the range filter, or None if unchanged."""
+        import numpy as np
+
+        if self.scan is None:
+            return None
+        key = (self.arrived, int(n), float(range_m), bool(flip_y))
+        if key == self._sectors_key:
+            return None
+        if self._prepared_id != self.arrived:
+            self._prepare()
+        a, r = self._a, self._r
+        if range_m > 0.0:
+            keep = r <= range_m
+            a, r = a[keep], r[keep]
+        if flip_y:
+            # Mirror front/back like the XY view (y -> -y).
+            a = np.pi - a
+        self._sectors_key = key
+        return lidar_sectors(a, r, int(n))
+
+    @staticmethod
+    def _screen_lod(
+        x: Any, y: Any, viewport: tuple[float, float, float, float, int, int]
+    ) -> tuple[Any, Any]:
+        import numpy as np
+
+        x0, x1, y0, y1, w_px, h_px = viewport
+        cols = max(1, int(w_px) // _LIDAR_LOD_CELL_PX)
+        rows = max(1, int(h_px) // _LIDAR_LOD_CELL_PX)
+        if x1 <= x0 or y1 <= y0:
+            return x[:0], y[:0]
+        cx = (x - x0) * (cols / (x1 - x0))
+        cy = (y - y0) * (rows / (y1 - y0))
+        inside = (cx >= 0.0) & (cx < cols) & (cy >= 0.0) & (cy < rows)
+        if not inside.all():
+            x, y, cx, cy = x[inside], y[inside], cx[inside], cy[inside]
+        if x.shape[0] <= 1:
+            return x, y
+        cell = cy.astype(np.intp) * cols + cx.astype(np.intp)
+        # One point per occupied cell, without sorting: every point writes its index into its cell
+        # and keeps itself only if it is the one left there (whichever write lands last).
+        idx = np.arange(x.shape[0], dtype=np.intp)
+        owner = np.empty(cols * rows, dtype=np.intp)
+        owner[cell] = idx
+        keep = owner[cell] == idx
+        return x[keep], y[keep]
+
+    def _prepare(self) -> None:
+        import numpy as np
+
+        scan = self.scan
+        assert scan is not None
+        # inf/NaN ranges (no return) would otherwise pass `> 0` and be drawn at infinity.
+        valid = np.isfinite(scan.ranges) & (scan.ranges > 0.0)
+        r = scan.ranges[valid]
+        a = scan.angles[valid]
+        tables = self.trig.lookup(scan.angles)
+        if tables is None:
+            sin, cos = np.sin(a), np.cos(a)
+        else:
+            sin, cos = tables[0][valid], tables[1][valid]
+        # Robot front is +Y (up) and angle_rad=0 points forward; x is right.
+        self._a = a
+        self._r = r
+        self._x = r * sin
+        self._y = r * cos
+        self._prepared_id = self.arrived
+        self.prepared += 1
+
+
+class _OccupancyGrid:
+    """
+    Robot-centred LiDAR hit-count grid that accumulates scans with exponential decay.
+
+    Before a scan is added the whole grid is multiplied by 0.5 ** (dt / half_life_s); the scan's
+    points are then binned with one `np.add.at`, so an update costs O(cells + points) however
+    many scans have been accumulated. There is no odometry, so the grid is in the robot frame: it
+    steadies sparse or flickering returns while the robot stands still or turns slowly.
+    """
+
+    def __init__(self, *, resolution_m: float, extent_m: float, half_life_s: float) -> None:
+        import numpy as np
+
+        self.resolution_m = float(resolution_m)
+        self.size = max(1, int(round(2.0 * extent_m / self.resolution_m)))
+        self.extent_m = self.size * self.resolution_m / 2.0  # half width, snapped to whole cells
+        self.half_life_s = float(half_life_s)
+        # grid[ix, iy]: x (right) is the first axis, as pyqtgraph's ImageItem expects by default.
+        self.grid = np.zeros((self.size, self.size), dtype=np.float32)
+        self.scans = 0
+        self._t: Optional[float] = None
+
+    def clear(self) -> None:
+        self.grid.fill(0.0)
+        self.scans = 0
+        self._t = None
+
+    def add(self, x: Any, y: Any, t: float) -> None:
+        import numpy as np
+
+        if self._t is not None and t > self._t:
+            self.grid *= np.float32(0.5 ** ((t - self._t) / self.half_life_s))
+        self._t = t
+        n = self.size
+        ix = np.floor((x + self.extent_m) / self.resolution_m).astype(np.intp)
+        iy = np.floor((y + self.extent_m) / self.resolution_m).astype(np.intp)
+        inside = (ix >= 0) & (ix < n) & (iy >= 0) & (iy < n)
+        # Unbuffered add: repeated cells each count (the grid is contiguous, so this is a view).
+        np.add.at(self.grid.reshape(-1), ix[inside] * n + iy[inside], 1.0)
+        self.scans += 1
+
+
+class _JsonTreeView:
+    """
+    Read-only key/value tree of a JSON payload, updated in place.
+
+    Items are rebuilt only when the set of paths changes; otherwise just the value cells whose
+    text changed are updated, so no document is re-laid out per sample.
+    """
+
+    _MAX_NODES = 2000
+
+    def __init__(self) -> None:
+        from PySide6.QtWidgets import QTreeWidget
+
+        self.widget = QTreeWidget()
+        self.widget.setColumnCount(2)
+        self.widget.setHeaderLabels(["key", "value"])
+        self.widget.setUniformRowHeights(True)
+        self.widget.setColumnWidth(0, 220)
+        self._items: dict[tuple[str, ...], Any] = {}
+        self._texts: dict[tuple[str, ...], str] = {}
+        self._shape: Optional[tuple[tuple[str, ...], ...]] = None
+
+    @classmethod
+    def _flatten(cls, payload: Any) -> list[tuple[tuple[str, ...], str]]:
+        # Pre-order (parents before children); containers show their size as the value.
+        rows: list[tuple[tuple[str, ...], str]] = []
+
+        def _walk(path: tuple[str, ...], obj: Any) -> None:
+            if len(rows) >= cls._MAX_NODES:
+                return
+            if isinstance(obj, dict):
+                rows.append((path, f"{{{len(obj)}}}"))
+                for k, v in obj.items():
+                    _walk(path + (str(k),), v)
+            elif isinstance(obj, list):
+                rows.append((path, f"[{len(obj)}]"))
+                for i, v in enumerate(obj):
+                    _walk(path + (str(i),), v)
+            else:
+                try:
+                    text = json.dumps(obj, ensure_ascii=False)
+                except Exception:
+                    text = str(obj)
+                rows.append((path, text))
+
+        _walk((), payload)
+        return rows
+
+    def update(self, payload: Any) -> None:
+        rows = self._flatten(payload)
+        shape = tuple(path for path, _ in rows)
+        if shape != self._shape:
+            self._rebuild(rows)
+            self._shape = shape
+            return
+        for path, text in rows:
+            if self._texts.get(path) != text:
+                self._texts[path] = text
+                item = self._items.get(path)
+                if item is not None:
+                    item.setText(1, text)
+
+    def _rebuild(self, rows: list[tuple[tuple[str, ...], str]]) -> None:
+        from PySide6.QtWidgets import QTreeWidgetItem
+
+        collapsed = {
+            path for path, item in self._items.items() if item.childCount() and not item.isExpanded()
+        }
+        self.widget.clear()
+        self._items = {}
+        self._texts = {}
+        root = self.widget.invisibleRootItem()
+        for path, text in rows:
+            self._texts[path] = text
+            if path:
+                parent = self._items.get(path[:-1], root)
+                self._items[path] = QTreeWidgetItem(parent, [path[-1], text])
+            elif text[:1] not in ("{", "["):
+                # Scalar payload (containers show "{n}" / "[n]"): a single row.
+                self._items[path] = QTreeWidgetItem(root, ["<root>", text])
+        for path, item in self._items.items():
+            if item.childCount():
+                item.setExpanded(path not in collapsed)
+
+
+class _CameraView:
+    """
+    Camera panel that paints the newest frame's QImage straight from `paintEvent`.
+
+    No QPixmap is made per frame: `set_image()` only keeps a reference and schedules a repaint,
+    and Qt coalesces repaints, so frames set faster than the widget repaints are skipped (counted
+    in `skipped`). While the panel is hidden or the window minimized no paintEvent runs at all, so
+    frames are not counted as skipped then. Frames already scaled to `target_size()` are blitted 1:1, centered; others are
+    scaled by the painter until the decoder catches up with a resize.
+    """
+
+    def __init__(self, placeholder: str) -> None:
+        from PySide6.QtWidgets import QFrame
+
+        owner = self
+
+        class _Widget(QFrame):
+            def paintEvent(self, event: Any) -> None:  # type: ignore[override]
+                super().paintEvent(event)
+                owner._paint(self)
+
+        self.widget = _Widget()
+        self.widget.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        self._placeholder = placeholder
+        self._image: Any = None
+        self._pending = False
+        self.painted = 0
+        self.skipped = 0
+
+    def target_size(self) -> tuple[int, int]:
+        r = self.widget.contentsRect()
+        return r.width(), r.height()
+
+    def set_image(self, image: Any) -> None:
+        self._image = image
+        widget = self.widget
+        if not widget.isVisible() or widget.window().isMinimized():
+            # The newest frame is painted when the panel is exposed again.
+            self._pending = False
+            return
+        if self._pending:
+            self.skipped += 1
+        self._pending = True
+        widget.update()
+
+    def _paint(self, widget: Any) -> None:
+        from PySide6.QtCore import QPoint, QRect, Qt
+        from PySide6.QtGui import QPainter
+
+        rect = widget.contentsRect()
+        painter = QPainter(widget)
+        try:
+            img = self._image
+            if img is None:
+                painter.drawText(rect, Qt.AlignCenter, self._placeholder)
+                return
+            w, h = img.width(), img.height()
+            if w > rect.width() or h > rect.height():
+                k = min(rect.width() / w, rect.height() / h)
+                w, h = max(1, int(w * k)), max(1, int(h * k))
+            x = rect.x() + (rect.width() - w) // 2
+            y = rect.y() + (rect.height() - h) // 2
+            if (w, h) == (img.width(), img.height()):
+                painter.drawImage(QPoint(x, y), img)
+            else:
+                painter.drawImage(QRect(x, y, w, h), img)
+        finally:
+            painter.end()
+        if self._pending:
+            self._pending = False
+            self.painted += 1
+
+
+class _RenderPanel:
+    __slots__ = ("name", "render", "min_interval_s", "ready", "dirty", "last_t", "cost_s")
+
+    def __init__(
+        self,
+        name: str,
+        render: Callable[[], None],
+        min_interval_s: float,
+        ready: Optional[Callable[[], bool]],
+    ) -> None:
+        self.name = name
+        self.render = render
+        self.min_interval_s = float(min_interval_s)
+        self.ready = ready
+        self.dirty = False
+        self.last_t = 0.0
+        self.cost_s = 0.0
+
 
-        if not isinstance(angle, (int, float)) or not isinstance(rng, (int, float)):
-            continue
-        out.append((float(angle), float(rng), intensity))
+class _RenderScheduler:
+    """
+    Frame-paced repaint for MainWindow.
 
-    return (
-        int(seq) if isinstance(seq, int) else None,
-        int(ts_ms) if isinstance(ts_ms, int) else None,
-        out,
-    )
+    Data handlers only store the newest state and `mark()` their panel dirty; `frame()` (driven by
+    one timer at the target FPS) renders each dirty panel at most once. A panel can be slower than
+    the frame rate (`min_interval_s`) or skip while it is not visible (`ready`); it then stays dirty
+    and is rendered on a later frame. Frame time (all panels) and per-panel cost are accumulated
+    and reported by `summary()`.
+    """
+
+    def __init__(self, *, on_error: Callable[[str, Exception], None]) -> None:
+        self._panels: dict[str, _RenderPanel] = {}
+        self._on_error = on_error
+        self._frames = 0
+        self._frame_sum_s = 0.0
+        self._frame_max_s = 0.0
+
+    def add(
+        self,
+        name: str,
+        render: Callable[[], None],
+        *,
+        min_interval_s: float = 0.0,
+        ready: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self._panels[name] = _RenderPanel(name, render, min_interval_s, ready)
+
+    def mark(self, name: str) -> None:
+        self._panels[name].dirty = True
+
+    def expedite(self, name: str) -> None:
+        """Lets a rate-limited panel render on the next frame (if dirty)."""
+        self._panels[name].last_t = 0.0
+
+    def frame(self, now: float) -> None:
+        t_frame = time.perf_counter()
+        rendered = False
+        for panel in self._panels.values():
+            if not panel.dirty or now - panel.last_t < panel.min_interval_s:
+                continue
+            if panel.ready is not None and not panel.ready():
+                continue
+            panel.dirty = False
+            panel.last_t = now
+            rendered = True
+            t = time.perf_counter()
+            try:
+                panel.render()
+            except Exception as e:
+                self._on_error(panel.name, e)
+            panel.cost_s += time.perf_counter() - t
+        if not rendered:
+            return
+        dt = time.perf_counter() - t_frame
+        self._frames += 1
+        self._frame_sum_s += dt
+        if dt > self._frame_max_s:
+            self._frame_max_s = dt
+
+    def summary(self) -> tuple[str, str]:
+        """
+        Returns (label, tooltip) for the frames rendered since the previous call and resets them.
+        """
+        n = self._frames
+        if n == 0:
+            label = "frames=0"
+        else:
+            avg_ms = self._frame_sum_s / n * 1000.0
+            label = f"frames={n} avg={avg_ms:.2f}ms max={self._frame_max_s * 1000.0:.2f}ms"
+        lines = []
+        for panel in self._panels.values():
+            lines.append(f"{panel.name:<10} {panel.cost_s * 1000.0:8.2f} ms")
+            panel.cost_s = 0.0
+        self._frames = 0
+        self._frame_sum_s = 0.0
+        self._frame_max_s = 0.0
+        return label, "render cost per panel (last interval)\n" + "\n".join(lines)
 
 
 class MainWindow:
     def __init__(
-        self, *, client: ZenohClient, bridge: _Bridge, args: argparse.Namespace, ui_config: UIConfig
+        self,
+        *,
+        client: ZenohClient,
+        supervisor: _SessionSupervisor,
+        bridge: _Bridge,
+        imu_decoder: _ImuDecoder,
+        cam_decoder: _CameraDecoder,
+        args: argparse.Namespace,
+        ui_config: UIConfig,
     ) -> None:
         from PySide6.QtCore import QEvent, QObject, QTimer, Qt
         from PySide6.QtGui import QAction, QCloseEvent, QFont, QKeyEvent
@@ -593,12 +2673,13 @@ class MainWindow:
             QSpinBox,
             QSizePolicy,
             QSplitter,
+            QTableWidget,
+            QToolButton,
             QVBoxLayout,
             QWidget,
         )
 
         import pyqtgraph as pg
-        import numpy as np
 
         self._Qt = Qt
         self._QCloseEvent = QCloseEvent
@@ -606,10 +2687,12 @@ class MainWindow:
         self._QObject = QObject
         self._QKeyEvent = QKeyEvent
         self._QMessageBox = QMessageBox
-        self._np = np
 
         self._client = client
         self._bridge = bridge
+        self._imu_decoder = imu_decoder
+        self._cam_decoder = cam_decoder
+        self._robot_id: str = args.robot_id
         self._args = args
         self._ui_config = ui_config
 
@@ -625,6 +2708,17 @@ class MainWindow:
         self._motor_dt_s: deque[float] = deque(maxlen=200)
         self._motor_period_last_print_t = 0.0
         self._print_motor_period = bool(getattr(args, "print_motor_period", False))
+        self._motor_policy = MotorPublishPolicy(
+            mode=getattr(args, "motor_publish_mode", None) or self._ui_config.motor_publish_mode,
+            heartbeat_margin=self._ui_config.motor_heartbeat_margin,
+        )
+        # publish reason -> count since the last rate update ("stop" for zero commands)
+        self._motor_pub_counts: dict[str, int] = {}
+        self._motor_rate_last_t = time.monotonic()
+        # Key transition -> first motor/cmd put reflecting it (monotonic time the filter saw the key).
+        self._motor_key_t: Optional[float] = None
+        self._key_latency = _LatencyHistogram(_KEY_LATENCY_BUCKETS_MS)
+        self._print_key_latency = bool(getattr(args, "print_key_latency", False))
 
         class _Win(QMainWindow):
             def __init__(self, owner: "MainWindow"):
@@ -659,6 +2753,12 @@ class MainWindow:
             "note: key capture disabled while typing in text fields"
         )
         conn_form.addRow("keys", self._lbl_keys)
+        self._lbl_delivery = QLabel("dropped: --")
+        self._lbl_delivery.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        conn_form.addRow("delivery", self._lbl_delivery)
+        self._lbl_render = QLabel("frames: --")
+        self._lbl_render.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        conn_form.addRow("render", self._lbl_render)
         left_layout.addWidget(conn_box)
 
         motor_box = QGroupBox("Motor")
@@ -678,6 +2778,22 @@ class MainWindow:
         self._spin_deadman.setRange(50, 2000)
         self._spin_deadman.setValue(int(self._ui_config.motor_deadman_ms))
         motor_form.addRow("deadman ms", self._spin_deadman)
+        self._combo_publish_mode = QComboBox()
+        self._combo_publish_mode.addItems(list(MOTOR_PUBLISH_MODES))
+        self._combo_publish_mode.setCurrentText(self._motor_policy.mode)
+        self._combo_publish_mode.setToolTip(
+            "fixed: publish at 'publish Hz' while a key is held\n"
+            "on_change: publish on key change, then heartbeat every deadman ms x "
+            f"{self._motor_policy.heartbeat_margin:g}"
+        )
+        motor_form.addRow("publish mode", self._combo_publish_mode)
+        self._chk_publish_on_key = QCheckBox("publish on key press/release")
+        self._chk_publish_on_key.setChecked(bool(self._ui_config.motor_publish_on_key))
+        self._chk_publish_on_key.setToolTip(
+            "on: send motor/cmd from the key event itself (timer re-phased from there)\n"
+            "off: wait for the next publish timer tick"
+        )
+        motor_form.addRow(self._chk_publish_on_key)
         self._btn_stop = QPushButton("STOP (send zero)")
         motor_form.addRow(self._btn_stop)
         self._lbl_motor = QLabel("v_l=0.000 v_r=0.000")
@@ -686,6 +2802,12 @@ class MainWindow:
         self._lbl_motor_period = QLabel("dt=-- avg=--")
         self._lbl_motor_period.setFrameStyle(QFrame.Panel | QFrame.Sunken)
         motor_form.addRow("pub period", self._lbl_motor_period)
+        self._lbl_motor_rate = QLabel("--")
+        self._lbl_motor_rate.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        motor_form.addRow("pub rate", self._lbl_motor_rate)
+        self._lbl_key_latency = QLabel("n=0")
+        self._lbl_key_latency.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        motor_form.addRow("key→put", self._lbl_key_latency)
         self._lbl_motor_telem_pw = QLabel("pw_l=-- pw_r=-- (raw --/--)")
         self._lbl_motor_telem_pw.setFrameStyle(QFrame.Panel | QFrame.Sunken)
         motor_form.addRow("telemetry pw", self._lbl_motor_telem_pw)
@@ -710,8 +2832,66 @@ class MainWindow:
         imu_form = QFormLayout(imu_box)
 
         self._combo_imu_plot = QComboBox()
-        self._combo_imu_plot.addItems(["gyro", "accel"])
+        self._combo_imu_plot.addItems(list(_IMU_PLOT_MODES))
+        self._combo_imu_plot.setCurrentText(self._ui_config.imu_plot)
+        self._combo_imu_plot.setToolTip("stacked: gyro above accel, sharing the time axis")
         imu_form.addRow("plot", self._combo_imu_plot)
+        self._spin_imu_window = QDoubleSpinBox()
+        self._spin_imu_window.setRange(1.0, 3600.0)
+        self._spin_imu_window.setDecimals(1)
+        self._spin_imu_window.setSingleStep(5.0)
+        self._spin_imu_window.setValue(float(self._ui_config.imu_window_s))
+        self._chk_imu_follow = QCheckBox("follow newest")
+        self._chk_imu_follow.setChecked(True)
+        row = QWidget()
+        row_l = QHBoxLayout(row)
+        row_l.setContentsMargins(0, 0, 0, 0)
+        row_l.addWidget(self._spin_imu_window, 1)
+        row_l.addWidget(self._chk_imu_follow)
+        imu_form.addRow("window (s)", row)
+
+        self._combo_imu_time_base = QComboBox()
+        self._combo_imu_time_base.addItems(list(_IMU_TIME_BASES))
+        self._combo_imu_time_base.setCurrentText(self._ui_config.imu_time_base)
+        self._combo_imu_time_base.setToolTip(
+            "receive: host receive time\n"
+            f"robot: payload ts_ms, reordered within {self._ui_config.imu_reorder_ms:g} ms "
+            "(changing this clears the chart history)"
+        )
+        self._chk_imu_latency = QCheckBox("latency plot")
+        row = QWidget()
+        row_l = QHBoxLayout(row)
+        row_l.setContentsMargins(0, 0, 0, 0)
+        row_l.addWidget(self._combo_imu_time_base, 1)
+        row_l.addWidget(self._chk_imu_latency)
+        imu_form.addRow("time base", row)
+        self._lbl_imu_latency = QLabel("n=0")
+        self._lbl_imu_latency.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        imu_form.addRow("arrival latency", self._lbl_imu_latency)
+
+        self._chk_imu_heading = QCheckBox("heading (∫gz dt)")
+        self._chk_imu_amag = QCheckBox("|accel|")
+        self._btn_heading_zero = QPushButton("zero heading")
+        row = QWidget()
+        row_l = QHBoxLayout(row)
+        row_l.setContentsMargins(0, 0, 0, 0)
+        row_l.addWidget(self._chk_imu_heading)
+        row_l.addWidget(self._chk_imu_amag)
+        row_l.addWidget(self._btn_heading_zero)
+        imu_form.addRow("derived", row)
+        self._chk_imu_fft = QCheckBox(f"spectrum ({self._ui_config.imu_fft_size} samples)")
+        self._combo_fft_channel = QComboBox()
+        self._combo_fft_channel.addItems(list(_IMU_FFT_CHANNELS))
+        row = QWidget()
+        row_l = QHBoxLayout(row)
+        row_l.setContentsMargins(0, 0, 0, 0)
+        row_l.addWidget(self._chk_imu_fft)
+        row_l.addWidget(self._combo_fft_channel, 1)
+        imu_form.addRow("vibration", row)
+        self._lbl_imu_derived = QLabel("heading=-- |a|=--")
+        self._lbl_imu_derived.setFont(QFont("Monospace"))
+        self._lbl_imu_derived.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        imu_form.addRow("derived latest", self._lbl_imu_derived)
 
         self._combo_gyro_path = QLineEdit()
         self._combo_gyro_path.setPlaceholderText("auto (examples: gyro, angular_velocity)")
@@ -743,14 +2923,36 @@ class MainWindow:
         self._spin_lidar_max_points.setValue(int(self._ui_config.lidar_max_points))
         lidar_form.addRow("max points", self._spin_lidar_max_points)
         self._spin_lidar_range_m = QDoubleSpinBox()
-        self._spin_lidar_range_m.setRange(0.0, 1.0)
+        self._spin_lidar_range_m.setRange(0.0, _LIDAR_MAX_RANGE_M)
         self._spin_lidar_range_m.setDecimals(2)
         self._spin_lidar_range_m.setSingleStep(0.5)
         self._spin_lidar_range_m.setValue(float(self._ui_config.lidar_range_m))
-        lidar_form.addRow("range max (m) (<=1.0)", self._spin_lidar_range_m)
+        lidar_form.addRow("range max (m) (0 = all)", self._spin_lidar_range_m)
+        self._btn_lidar_view = QPushButton("reset view")
+        self._btn_lidar_view.setToolTip("Zoom/pan the LiDAR plot with the mouse; this goes back to the initial view")
+        lidar_form.addRow(self._btn_lidar_view)
         self._chk_lidar_flip_y = QCheckBox("flip Y (front/back)")
         self._chk_lidar_flip_y.setChecked(bool(self._ui_config.lidar_flip_y))
         lidar_form.addRow(self._chk_lidar_flip_y)
+        self._chk_lidar_grid = QCheckBox("occupancy grid (decay)")
+        self._chk_lidar_grid.setChecked(bool(self._ui_config.lidar_grid))
+        self._chk_lidar_grid.setToolTip(
+            f"Accumulate scans into a {self._ui_config.lidar_grid_resolution_m:g} m grid "
+            f"(+/- {self._ui_config.lidar_grid_extent_m:g} m) whose hits halve every "
+            f"{self._ui_config.lidar_grid_half_life_s:g} s"
+        )
+        lidar_form.addRow(self._chk_lidar_grid)
+        self._combo_lidar_display = QComboBox()
+        self._combo_lidar_display.addItems(list(_LIDAR_DISPLAYS))
+        self._combo_lidar_display.setCurrentText(self._ui_config.lidar_display)
+        self._combo_lidar_display.setToolTip(
+            "points: every point of the scan; sectors: nearest obstacle per angular sector (outline + table)"
+        )
+        lidar_form.addRow("display", self._combo_lidar_display)
+        self._spin_lidar_sectors = QSpinBox()
+        self._spin_lidar_sectors.setRange(4, 360)
+        self._spin_lidar_sectors.setValue(int(self._ui_config.lidar_sectors))
+        lidar_form.addRow("sectors", self._spin_lidar_sectors)
         self._lbl_lidar = QLabel("scan: --")
         self._lbl_lidar.setFrameStyle(QFrame.Panel | QFrame.Sunken)
         lidar_form.addRow("status", self._lbl_lidar)
@@ -772,14 +2974,15 @@ class MainWindow:
         cam_panel = QWidget()
         cam_layout = QVBoxLayout(cam_panel)
         cam_layout.setContentsMargins(0, 0, 0, 0)
-        self._cam_label = QLabel("camera: waiting for jpeg...")
-        self._cam_label.setAlignment(Qt.AlignCenter)
-        self._cam_label.setMinimumHeight(300)
-        self._cam_label.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        self._cam_view = _CameraView("camera: waiting for jpeg...")
+        self._cam_view.widget.setMinimumHeight(300)
         self._lbl_cam_meta = QLabel("meta: --")
         self._lbl_cam_meta.setFrameStyle(QFrame.Panel | QFrame.Sunken)
-        cam_layout.addWidget(self._cam_label, 1)
+        self._lbl_cam_stats = QLabel("frames: --")
+        self._lbl_cam_stats.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        cam_layout.addWidget(self._cam_view.widget, 1)
         cam_layout.addWidget(self._lbl_cam_meta)
+        cam_layout.addWidget(self._lbl_cam_stats)
         right_split.addWidget(cam_panel)
 
         lidar_panel = QWidget()
@@ -800,9 +3003,8 @@ class MainWindow:
         self._lidar_plot.setLabel("left", "y", units="m")
         self._lidar_plot.setLabel("bottom", "x", units="m")
         self._lidar_plot.enableAutoRange(False)
-        self._lidar_plot.setXRange(-1.0, 1.0, padding=0.0)
-        self._lidar_plot.setYRange(-1.0, 1.0, padding=0.0)
-        self._lidar_plot.setTitle("LiDAR (top view) 2m x 2m")
+        self._lidar_plot.setTitle("LiDAR (top view)")
+        self._reset_lidar_view()
 
         self._lidar_axis_x = pg.InfiniteLine(pos=0.0, angle=0, pen=pg.mkPen((150, 150, 150), style=Qt.DashLine))
         self._lidar_axis_y = pg.InfiniteLine(pos=0.0, angle=90, pen=pg.mkPen((150, 150, 150), style=Qt.DashLine))
@@ -819,9 +3021,24 @@ class MainWindow:
         self._lidar_front_arrow = pg.ArrowItem(pos=(0.0, 0.35), angle=90, brush=pg.mkBrush("c"), pen=pg.mkPen("c"))
         self._lidar_plot.addItem(self._lidar_front_arrow)
 
+        # Occupancy grid (optional) under the scatter; one image for the whole grid.
+        self._lidar_grid_image = pg.ImageItem()
+        self._lidar_grid_image.setLookupTable(pg.colormap.get("inferno").getLookupTable(nPts=256))
+        self._lidar_grid_image.setZValue(-10)
+        self._lidar_grid_image.setVisible(False)
+        self._lidar_plot.addItem(self._lidar_grid_image)
+
         self._lidar_scatter = pg.ScatterPlotItem(size=2, pen=None, brush=pg.mkBrush(255, 255, 0, 200))
         self._lidar_plot.addItem(self._lidar_scatter)
+        # Sector display: nearest obstacle per sector as a closed outline (2 points per sector).
+        self._lidar_sector_curve = pg.PlotDataItem(pen=pg.mkPen((255, 140, 0), width=2))
+        self._lidar_plot.addItem(self._lidar_sector_curve)
         lidar_layout.addWidget(self._lidar_plot, 1)
+        self._lidar_sector_table = QTableWidget(0, 3)
+        self._lidar_sector_table.setHorizontalHeaderLabels(["nearest (m)", "mean (m)", "points"])
+        self._lidar_sector_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._lidar_sector_table.horizontalHeader().setStretchLastSection(True)
+        lidar_layout.addWidget(self._lidar_sector_table, 1)
         right_split.addWidget(lidar_panel)
 
         imu_panel = QWidget()
@@ -833,16 +3050,58 @@ class MainWindow:
         self._plot.addLegend()
         self._plot.setLabel("left", "gyro")
         self._plot.setLabel("bottom", "t", units="s")
+        # X follows the newest samples (or the user's zoom/pan); y fits what is drawn.
+        self._plot.getViewBox().enableAutoRange(x=False, y=True)
+        self._plot.getViewBox().setAutoVisible(y=True)
         self._curve_x = self._plot.plot([], [], pen=pg.mkPen("r", width=2), name="x")
         self._curve_y = self._plot.plot([], [], pen=pg.mkPen("g", width=2), name="y")
         self._curve_z = self._plot.plot([], [], pen=pg.mkPen("b", width=2), name="z")
-        self._raw = QPlainTextEdit()
-        self._raw.setReadOnly(True)
-        self._raw.setMaximumBlockCount(2000)
-        self._raw.setPlaceholderText("imu raw JSON will appear here")
+
+        # Optional plots below the main one share its time axis: zoom/pan on any of them moves all.
+        def _time_plot(label: str) -> Any:
+            plot = pg.PlotWidget()
+            plot.showGrid(x=True, y=True, alpha=0.25)
+            plot.setLabel("left", label)
+            plot.setLabel("bottom", "t", units="s")
+            plot.setXLink(self._plot)
+            plot.getViewBox().enableAutoRange(x=False, y=True)
+            plot.getViewBox().setAutoVisible(y=True)
+            plot.setVisible(False)
+            return plot
+
+        # Accel half of the "stacked" view.
+        self._plot_accel = _time_plot("accel")
+        self._curve_ax = self._plot_accel.plot([], [], pen=pg.mkPen("r", width=2))
+        self._curve_ay = self._plot_accel.plot([], [], pen=pg.mkPen("g", width=2))
+        self._curve_az = self._plot_accel.plot([], [], pen=pg.mkPen("b", width=2))
+        self._plot_heading = _time_plot("heading")
+        self._curve_heading = self._plot_heading.plot([], [], pen=pg.mkPen("m", width=2))
+        self._plot_amag = _time_plot("|accel|")
+        self._curve_amag = self._plot_amag.plot([], [], pen=pg.mkPen("c", width=2))
+        self._plot_latency = _time_plot("latency (ms)")
+        self._curve_latency = self._plot_latency.plot([], [], pen=pg.mkPen("w", width=1))
+        self._plot_fft = pg.PlotWidget()
+        self._plot_fft.showGrid(x=True, y=True, alpha=0.25)
+        self._plot_fft.setLabel("left", "amplitude")
+        self._plot_fft.setLabel("bottom", "f", units="Hz")
+        self._curve_fft = self._plot_fft.plot([], [], pen=pg.mkPen("y", width=2))
+        self._plot_fft.setVisible(False)
+        self._raw_tree = _JsonTreeView()
+        self._btn_raw = QToolButton()
+        self._btn_raw.setText(f"IMU raw JSON (<= {self._ui_config.imu_raw_view_hz:g} Hz)")
+        self._btn_raw.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        self._btn_raw.setCheckable(True)
+        self._btn_raw.setChecked(True)
+        self._btn_raw.setArrowType(Qt.DownArrow)
+        self._btn_raw.setAutoRaise(True)
         imu_layout.addWidget(self._plot, 2)
-        imu_layout.addWidget(QLabel("IMU raw JSON"))
-        imu_layout.addWidget(self._raw, 1)
+        imu_layout.addWidget(self._plot_accel, 2)
+        imu_layout.addWidget(self._plot_heading, 1)
+        imu_layout.addWidget(self._plot_amag, 1)
+        imu_layout.addWidget(self._plot_latency, 1)
+        imu_layout.addWidget(self._plot_fft, 1)
+        imu_layout.addWidget(self._btn_raw)
+        imu_layout.addWidget(self._raw_tree.widget, 1)
         right_split.addWidget(imu_panel)
 
         splitter = QSplitter()
@@ -859,29 +3118,124 @@ class MainWindow:
 
         # Data buffers
         self._t0 = time.monotonic()
-        self._buf_t: deque[float] = deque(maxlen=400)
-        self._buf_x: deque[float] = deque(maxlen=400)
-        self._buf_y: deque[float] = deque(maxlen=400)
-        self._buf_z: deque[float] = deque(maxlen=400)
+        self._imu_history = _ImuHistory(self._ui_config.imu_history_samples)
+        self._imu_range_guard = False
+        self._imu_last_sample: Optional[_ImuSample] = None
+        self._imu_reorder = _ImuReorder(self._ui_config.imu_reorder_ms / 1000.0)
+        # Robot time base: plot t = ts_ms / 1000 - origin, anchored so the first sample lines up
+        # with the receive time base.
+        self._imu_ts_origin: Optional[float] = None
+        # (ts_ms / 1000, host t) of the newest payload timestamp, for clock jump detection.
+        self._imu_ts_newest: Optional[tuple[float, float]] = None
+        self._imu_latency = _LatencyHistogram(_IMU_LATENCY_BUCKETS_MS)
+        # Newest payload not yet shown in the raw view (None = view is up to date).
+        self._imu_raw_payload: Any = None
+        self._cam_frame: Optional[_CameraFrame] = None
+        self._cam_stats_last = (0, 0, 0.0, 0)  # decoded, painted, work_s, dropped
+        self._stats_last_t = time.monotonic()
+        self._lidar = _LidarPipeline()
+        self._lidar_grid: Optional[_OccupancyGrid] = None
+        self._lidar_grid_scan = 0  # pipeline arrival number last added to the grid
+        # Label text waiting for the next frame (label -> text); only the newest text is kept.
+        self._pending_labels: dict[Any, str] = {}
+
+        # Handlers only store state and mark their panel dirty; the render timer repaints each
+        # dirty panel once per frame, so repaint work does not scale with the publish rates.
+        self._render = _RenderScheduler(
+            on_error=lambda name, e: self._append_log(f"render {name} failed: {e}")
+        )
+        self._render.add("labels", self._render_labels)
+        self._render.add("imu", self._render_imu)
+        self._render.add(
+            "imu_fft",
+            self._render_imu_fft,
+            min_interval_s=1.0 / float(self._ui_config.imu_fft_hz),
+            ready=self._plot_fft.isVisible,
+        )
+        self._render.add("camera", self._render_camera)
+        self._render.add(
+            "lidar", self._render_lidar, min_interval_s=1.0 / float(self._ui_config.lidar_update_hz)
+        )
+        self._render.add(
+            "imu_raw",
+            self._render_imu_raw,
+            min_interval_s=1.0 / float(self._ui_config.imu_raw_view_hz),
+            ready=self._raw_view_visible,
+        )
+        self._render.add("stats", self._render_stats, min_interval_s=1.0)
 
         # Wiring
         self._btn_oled.clicked.connect(self._on_send_oled)
         self._btn_stop.clicked.connect(lambda: self._send_stop(repeat=3))
         self._combo_imu_plot.currentTextChanged.connect(self._on_imu_plot_changed)
+        self._spin_imu_window.valueChanged.connect(self._on_imu_window_changed)
+        self._chk_imu_follow.toggled.connect(lambda _on: self._render.mark("imu"))
+        self._plot.getViewBox().sigRangeChangedManually.connect(self._on_imu_range_manual)
+        for plot in (self._plot_accel, self._plot_heading, self._plot_amag, self._plot_latency):
+            plot.getViewBox().sigRangeChangedManually.connect(self._on_imu_range_manual)
+        self._chk_imu_latency.toggled.connect(
+            lambda on: self._on_imu_derived_toggled(self._plot_latency, on)
+        )
+        self._combo_imu_time_base.currentTextChanged.connect(self._on_imu_time_base_changed)
+        self._chk_imu_heading.toggled.connect(
+            lambda on: self._on_imu_derived_toggled(self._plot_heading, on)
+        )
+        self._chk_imu_amag.toggled.connect(lambda on: self._on_imu_derived_toggled(self._plot_amag, on))
+        self._chk_imu_fft.toggled.connect(self._on_imu_fft_toggled)
+        self._combo_fft_channel.currentTextChanged.connect(lambda _t: self._on_imu_fft_toggled(True))
+        self._btn_heading_zero.clicked.connect(self._imu_history.reset_heading)
+        self._plot.getViewBox().sigXRangeChanged.connect(self._on_imu_xrange_changed)
+        self._on_imu_plot_changed(self._combo_imu_plot.currentText())
+        self._btn_raw.toggled.connect(self._on_raw_view_toggled)
+        self._combo_gyro_path.textChanged.connect(self._on_imu_paths_changed)
+        self._combo_accel_path.textChanged.connect(self._on_imu_paths_changed)
+        self._spin_lidar_max_points.valueChanged.connect(lambda _v: self._render.mark("lidar"))
+        self._spin_lidar_range_m.valueChanged.connect(lambda _v: self._render.mark("lidar"))
+        self._chk_lidar_flip_y.toggled.connect(self._on_lidar_flip_y)
+        self._chk_lidar_grid.toggled.connect(self._on_lidar_grid_toggled)
+        if self._chk_lidar_grid.isChecked():
+            self._on_lidar_grid_toggled(True)
+        self._combo_lidar_display.currentTextChanged.connect(self._on_lidar_display_changed)
+        self._spin_lidar_sectors.valueChanged.connect(self._on_lidar_sectors_changed)
+        self._on_lidar_sectors_changed(self._spin_lidar_sectors.value())
+        self._on_lidar_display_changed(self._combo_lidar_display.currentText())
+        self._btn_lidar_view.clicked.connect(self._reset_lidar_view)
+        # Pan/zoom/resize change the screen-space level of detail.
+        lidar_vb = self._lidar_plot.getViewBox()
+        lidar_vb.sigRangeChanged.connect(lambda *_a: self._render.mark("lidar"))
+        lidar_vb.sigResized.connect(lambda *_a: self._render.mark("lidar"))
 
         bridge.qobj.log.connect(self._append_log)
-        bridge.qobj.imu.connect(self._on_imu)
-        bridge.qobj.motor_telemetry.connect(self._on_motor_telemetry)
-        bridge.qobj.cam_jpeg.connect(self._on_cam_jpeg)
-        bridge.qobj.cam_meta.connect(self._on_cam_meta)
-        bridge.qobj.lidar_scan.connect(self._on_lidar_scan)
-        bridge.qobj.lidar_front.connect(self._on_lidar_front)
+
+        # Received samples wait in per-topic mailboxes; the drain timer hands them to the handlers.
+        # "latest" mailboxes only ever hold the newest sample, so a stalled GUI shows fresh data.
+        self._drain_handlers = {
+            "imu": self._on_imu,
+            "motor_telemetry": self._on_motor_telemetry,
+            "cam_jpeg": self._on_cam_jpeg,
+            "cam_meta": self._on_cam_meta,
+            "lidar_scan": self._on_lidar_scan,
+            "lidar_front": self._on_lidar_front,
+        }
+        self._drain_timer = QTimer()
+        self._drain_timer.timeout.connect(self._drain_mailboxes)
+        self._drain_timer.start(max(1, int(1000.0 / float(self._ui_config.delivery_drain_hz))))
+
+        self._render_timer = QTimer()
+        self._render_timer.timeout.connect(self._tick_render)
+        self._render_timer.setTimerType(Qt.PreciseTimer)
+        self._render_timer.start(max(1, int(round(1000.0 / float(self._ui_config.render_fps)))))
 
         # Motor publish timer
         self._motor_timer = QTimer()
         self._motor_timer.timeout.connect(self._tick_motor)
-        self._motor_timer.start(int(1000 / float(self._spin_hz.value())))
+        self._motor_timer.setTimerType(Qt.PreciseTimer)
         self._spin_hz.valueChanged.connect(self._on_hz_changed)
+        self._spin_deadman.valueChanged.connect(self._on_hz_changed)
+        self._combo_publish_mode.currentTextChanged.connect(self._on_publish_mode_changed)
+        self._chk_publish_on_key.toggled.connect(lambda _on: self._key_latency.clear())
+        self._on_publish_mode_changed(self._motor_policy.mode)
+        self._motor_timer.start()
 
         # Global key capture
         self._typing_widgets = (QLineEdit, QPlainTextEdit, QAbstractSpinBox)
@@ -896,22 +3250,10 @@ class MainWindow:
 
         self._key_filter = _KeyFilter(self)
 
-        # LiDAR update throttling
-        self._lidar_last_scan: Optional[dict[str, Any]] = None
-        self._lidar_timer = QTimer()
-        self._lidar_timer.timeout.connect(self._tick_lidar)
-        self._lidar_timer.start(max(10, int(1000.0 / float(self._ui_config.lidar_update_hz))))
-
-        # Open Zenoh now
-        try:
-            self._client.open()
-            self._lbl_status.setText("connected")
-        except SystemExit:
-            raise
-        except Exception as e:
-            self._lbl_status.setText("error")
-            self._append_log(f"connect failed: {e}")
-            QMessageBox.critical(self._win, "Zenoh connect failed", str(e))
+        # Open Zenoh now; the supervisor retries and reconnects in the background.
+        bridge.qobj.status.connect(self._lbl_status.setText)
+        self._supervisor = supervisor
+        self._supervisor.start()
 
     def show(self) -> None:
         self._win.show()
@@ -920,6 +3262,54 @@ class MainWindow:
         ts = time.strftime("%H:%M:%S")
         self._log.appendPlainText(f"[{ts}] {msg}")
 
+    def _drain_mailboxes(self) -> None:
+        if self._closing:
+            return
+        for topic, handler in self._drain_handlers.items():
+            for item in self._bridge.mailbox(self._robot_id, topic).take_all():
+                try:
+                    handler(item)
+                except Exception as e:
+                    self._append_log(f"{topic} handler failed: {e}")
+        if len(self._imu_reorder):
+            # Samples held for reordering are released after the window even without new data.
+            self._release_imu(time.monotonic())
+
+    def _tick_render(self) -> None:
+        if self._closing:
+            return
+        self._render.mark("stats")
+        self._render.frame(time.monotonic())
+
+    def _set_label_later(self, label: Any, text: str) -> None:
+        self._pending_labels[label] = text
+        self._render.mark("labels")
+
+    def _render_labels(self) -> None:
+        pending, self._pending_labels = self._pending_labels, {}
+        for label, text in pending.items():
+            label.setText(text)
+
+    def _render_stats(self) -> None:
+        parts = []
+        for topic in self._bridge.topics():
+            dropped = self._bridge.mailbox(self._robot_id, topic).dropped
+            if dropped:
+                parts.append(f"{topic}={dropped}")
+        self._lbl_delivery.setText("dropped: " + (" ".join(parts) if parts else "0"))
+        now = time.monotonic()
+        self._update_motor_rate(now)
+        self._update_cam_stats(max(1e-3, now - self._stats_last_t))
+        self._stats_last_t = now
+        self._lbl_key_latency.setText(self._key_latency.summary())
+        self._lbl_key_latency.setToolTip(self._key_latency.format_buckets())
+        late = self._imu_reorder.late
+        self._lbl_imu_latency.setText(self._imu_latency.summary() + (f" late={late}" if late else ""))
+        self._lbl_imu_latency.setToolTip(self._imu_latency.format_buckets())
+        text, tooltip = self._render.summary()
+        self._lbl_render.setText(text)
+        self._lbl_render.setToolTip(tooltip)
+
     def _event_filter(self, obj: Any, event: Any) -> bool:
         from PySide6.QtWidgets import QApplication, QPlainTextEdit
 
@@ -971,39 +3361,60 @@ class MainWindow:
             return False
 
         if event.type() == self._QEvent.KeyPress and not ev.isAutoRepeat():
+            self._motor_key_t = time.monotonic()
             self._pressed.add(key)
+            self._on_motor_keys_changed()
             return True
         if event.type() == self._QEvent.KeyRelease and not ev.isAutoRepeat():
+            self._motor_key_t = time.monotonic()
             self._pressed.discard(key)
             if not self._pressed:
                 self._send_stop(repeat=2)
+                self._motor_timer.start()
+            else:
+                self._on_motor_keys_changed()
             return True
         return False
 
-    def _on_hz_changed(self, v: float) -> None:
-        try:
-            interval_ms = int(1000 / float(v))
-        except Exception:
-            interval_ms = 50
+    def _on_motor_keys_changed(self) -> None:
+        if not self._chk_publish_on_key.isChecked():
+            return
+        # Publish the new command now and restart the timer so its next tick is a full period
+        # (or heartbeat) later instead of a near-duplicate send.
+        self._tick_motor()
+        self._motor_timer.start()
+
+    def _on_hz_changed(self, _v: float = 0.0) -> None:
+        if self._motor_policy.mode == "on_change":
+            interval_ms = int(self._motor_policy.heartbeat_s(int(self._spin_deadman.value())) * 1000)
+        else:
+            try:
+                interval_ms = int(1000 / float(self._spin_hz.value()))
+            except Exception:
+                interval_ms = 50
         self._motor_timer.setInterval(max(10, interval_ms))
 
+    def _on_publish_mode_changed(self, text: str) -> None:
+        self._motor_policy.mode = text if text in MOTOR_PUBLISH_MODES else "fixed"
+        self._motor_policy.reset()
+        self._spin_hz.setEnabled(self._motor_policy.mode == "fixed")
+        self._on_hz_changed()
+
+    def _on_imu_paths_changed(self, _text: str = "") -> None:
+        self._imu_decoder.gyro_path = self._combo_gyro_path.text().strip()
+        self._imu_decoder.accel_path = self._combo_accel_path.text().strip()
+
     def _on_imu_plot_changed(self, text: str) -> None:
-        label = "accel" if str(text).lower() == "accel" else "gyro"
+        mode = str(text).lower()
+        label = "accel" if mode == "accel" else "gyro"
         try:
             self._plot.setLabel("left", label)
         except Exception:
             pass
+        self._plot_accel.setVisible(mode == "stacked")
 
-        try:
-            self._buf_t.clear()
-            self._buf_x.clear()
-            self._buf_y.clear()
-            self._buf_z.clear()
-            self._curve_x.setData([], [])
-            self._curve_y.setData([], [])
-            self._curve_z.setData([], [])
-        except Exception:
-            pass
+        # Both vectors are kept in the ring, so switching just redraws the other columns.
+        self._render.mark("imu")
 
     def _desired_motor(self) -> tuple[float, float]:
         step = float(self._spin_step.value())
@@ -1089,13 +3500,23 @@ class MainWindow:
             self._last_nonzero = False
             return
 
+        deadman_ms = int(self._spin_deadman.value())
+        reason = self._motor_policy.due(
+            (v_l, v_r),
+            time.monotonic(),
+            deadman_ms=deadman_ms,
+            slack_s=self._motor_timer.interval() / 1000.0 * 0.25,
+        )
+        if reason is None:
+            return
+
         self._last_nonzero = True
         self._lbl_motor.setText(f"v_l={v_l:+.3f} v_r={v_r:+.3f}")
         cmd = MotorCommand(
             v_l=v_l,
             v_r=v_r,
             unit="mps",
-            deadman_ms=int(self._spin_deadman.value()),
+            deadman_ms=deadman_ms,
             seq=self._seq,
             ts_ms=int(time.time() * 1000),
         )
@@ -1116,11 +3537,16 @@ class MainWindow:
             else:
                 self._client.publish_motor(cmd)
 
-            self._record_motor_pub(now)
+            self._motor_policy.sent((v_l, v_r), now)
+            self._record_motor_pub(now, reason)
         except Exception as e:
             self._append_log(f"motor publish failed: {e}")
 
-    def _record_motor_pub(self, now: float) -> None:
+    def _record_motor_pub(self, now: float, reason: str) -> None:
+        self._motor_pub_counts[reason] = self._motor_pub_counts.get(reason, 0) + 1
+        if self._motor_key_t is not None:
+            self._key_latency.add((time.monotonic() - self._motor_key_t) * 1000.0)
+            self._motor_key_t = None
         last = self._motor_last_pub_t
         self._motor_last_pub_t = now
         if last is None:
@@ -1162,10 +3588,23 @@ class MainWindow:
                     self._client.publish_motor_ex(cmd, print_msg=True)
                 else:
                     self._client.publish_motor(cmd)
-                self._record_motor_pub(now)
+                self._record_motor_pub(now, "stop")
             except Exception as e:
                 self._append_log(f"stop publish failed: {e}")
                 break
+        self._motor_policy.reset()
+
+    def _update_motor_rate(self, now: float) -> None:
+        dt = now - self._motor_rate_last_t
+        if dt <= 0:
+            return
+        counts, self._motor_pub_counts = self._motor_pub_counts, {}
+        self._motor_rate_last_t = now
+        total = sum(counts.values())
+        detail = " ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+        self._lbl_motor_rate.setText(
+            f"{total / dt:4.1f} msg/s ({self._motor_policy.mode})" + (f" {detail}" if detail else "")
+        )
 
     def _on_send_oled(self) -> None:
         text = self._edit_oled.text()
@@ -1178,194 +3617,364 @@ class MainWindow:
         except Exception as e:
             self._append_log(f"oled publish failed: {e}")
 
-    def _on_motor_telemetry(self, payload: Any) -> None:
-        if not isinstance(payload, dict):
-            self._lbl_motor_telem_pw.setText("pw_l=-- pw_r=-- (raw --/--)")
-            self._lbl_motor_telem_cmd.setText("cmd_v_l=-- cmd_v_r=-- seq=-- ts_ms=--")
+    def _on_motor_telemetry(self, texts: tuple[str, str]) -> None:
+        pw_text, cmd_text = texts
+        self._set_label_later(self._lbl_motor_telem_pw, pw_text)
+        self._set_label_later(self._lbl_motor_telem_cmd, cmd_text)
+
+    def _on_imu(self, sample: _ImuSample) -> None:
+        self._imu_raw_payload = sample.payload
+        self._render.mark("imu_raw")
+        self._render.mark("imu_fft")
+
+        # Auto paths are only reported when detection ran, which need not be the newest sample.
+        if sample.gyro_auto_path is not None:
+            path = sample.gyro_auto_path
+            text = f"auto: {path}" if path else "auto: (not found)"
+            self._set_label_later(self._lbl_gyro_path, text)
+        if sample.accel_auto_path is not None:
+            path = sample.accel_auto_path
+            text = f"auto: {path}" if path else "auto: (not found)"
+            self._set_label_later(self._lbl_accel_path, text)
+
+        self._imu_last_sample = sample
+        self._render.mark("imu")
+        if sample.latency_ms is not None:
+            self._imu_latency.add(sample.latency_ms)
+        if sample.gyro is None and sample.accel is None:
             return
 
-        pw_l = payload.get("pw_l")
-        pw_r = payload.get("pw_r")
-        pw_l_raw = payload.get("pw_l_raw")
-        pw_r_raw = payload.get("pw_r_raw")
-
-        def _i(v: Any) -> Optional[int]:
-            if isinstance(v, bool):
-                return None
-            if isinstance(v, int):
-                return int(v)
-            return None
-
-        def _f(v: Any) -> Optional[float]:
-            if isinstance(v, bool):
-                return None
-            if isinstance(v, (int, float)):
-                return float(v)
-            return None
-
-        pw_l_i = _i(pw_l)
-        pw_r_i = _i(pw_r)
-        pw_l_raw_i = _i(pw_l_raw)
-        pw_r_raw_i = _i(pw_r_raw)
-
-        pw_l_s = "--" if pw_l_i is None else str(pw_l_i)
-        pw_r_s = "--" if pw_r_i is None else str(pw_r_i)
-        pw_l_raw_s = "--" if pw_l_raw_i is None else str(pw_l_raw_i)
-        pw_r_raw_s = "--" if pw_r_raw_i is None else str(pw_r_raw_i)
-        self._lbl_motor_telem_pw.setText(f"pw_l={pw_l_s} pw_r={pw_r_s} (raw {pw_l_raw_s}/{pw_r_raw_s})")
-
-        cmd_v_l = _f(payload.get("cmd_v_l"))
-        cmd_v_r = _f(payload.get("cmd_v_r"))
-        cmd_seq = _i(payload.get("cmd_seq"))
-        cmd_ts_ms = _i(payload.get("cmd_ts_ms"))
-        if cmd_ts_ms is None:
-            cmd_ts_ms = _i(payload.get("ts_ms"))
-
-        cmd_v_l_s = "--" if cmd_v_l is None else f"{cmd_v_l:+.3f}"
-        cmd_v_r_s = "--" if cmd_v_r is None else f"{cmd_v_r:+.3f}"
-        cmd_seq_s = "--" if cmd_seq is None else str(cmd_seq)
-        cmd_ts_s = "--" if cmd_ts_ms is None else str(cmd_ts_ms)
-        self._lbl_motor_telem_cmd.setText(
-            f"cmd_v_l={cmd_v_l_s} cmd_v_r={cmd_v_r_s} seq={cmd_seq_s} ts_ms={cmd_ts_s}"
-        )
-
-    def _on_imu(self, payload: Any) -> None:
-        try:
-            self._raw.setPlainText(json.dumps(payload, ensure_ascii=False, indent=2))
-        except Exception:
-            self._raw.setPlainText(str(payload))
-
-        gyro_candidates = ("gyro", "gyr", "angular_velocity", "angularVelocity")
-        accel_candidates = ("accel", "acc", "acceleration", "linear_acceleration", "linearAcceleration")
+        t = sample.recv_t - self._t0
+        if self._combo_imu_time_base.currentText() != "robot":
+            self._imu_history.append(t, sample.gyro, sample.accel, sample.latency_ms)
+            return
+        if sample.ts_ms is not None:
+            ts = sample.ts_ms / 1000.0
+            newest = self._imu_ts_newest
+            if self._imu_ts_origin is None or newest is None:
+                self._imu_ts_origin = ts - t
+            else:
+                # Compared with the newest sample, not the anchor: network delay only makes host
+                # time run ahead (a late burst), so it never reads as a jump.
+                d_ts = ts - newest[0]
+                if (
+                    d_ts < -(_IMU_TS_JUMP_S + self._imu_reorder.window_s)
+                    or d_ts - (t - newest[1]) > _IMU_TS_JUMP_S
+                ):
+                    self._reanchor_imu(ts, t, newest)
+            if self._imu_ts_newest is None or ts >= self._imu_ts_newest[0]:
+                self._imu_ts_newest = (ts, t)
+            t = ts - self._imu_ts_origin
+        self._imu_reorder.push(t, sample.recv_t, sample)
+        self._release_imu(time.monotonic())
+
+    def _reanchor_imu(self, ts: float, t: float, newest: tuple[float, float]) -> None:
+        assert self._imu_ts_origin is not None
+        jump = (ts - newest[0]) - (t - newest[1])
+        # Held samples are still on the old clock: release them all, then continue from the newest
+        # one so the history (windowing, heading dt) stays monotonic. `late` is kept.
+        self._release_imu(float("inf"))
+        floor = newest[0] - self._imu_ts_origin
+        self._imu_ts_origin = ts - max(t, floor)
+        self._imu_ts_newest = (ts, t)
+        self._append_log(f"imu ts_ms jumped {jump:+.1f} s (robot clock reset?); re-anchored")
+
+    def _release_imu(self, now: float) -> None:
+        for t, sample in self._imu_reorder.pop_ready(now):
+            self._imu_history.append(t, sample.gyro, sample.accel, sample.latency_ms)
+            self._render.mark("imu")
+
+    def _on_imu_time_base_changed(self, text: str) -> None:
+        # The two time bases do not share an axis, so the history starts over.
+        self._imu_history.clear()
+        self._imu_reorder.clear()
+        self._imu_ts_origin = None
+        self._imu_ts_newest = None
+        self._append_log(f"imu time base: {text} (chart history cleared)")
+        self._render.mark("imu")
+
+    def _render_imu(self) -> None:
+        sample = self._imu_last_sample
+        if sample is not None:
+            if sample.gyro is None:
+                self._lbl_gyro.setText("x=-- y=-- z=--")
+            else:
+                gx, gy, gz = sample.gyro
+                self._lbl_gyro.setText(f"x={gx:+.4f} y={gy:+.4f} z={gz:+.4f}")
+            if sample.accel is None:
+                self._lbl_accel.setText("x=-- y=-- z=--")
+            else:
+                ax, ay, az = sample.accel
+                self._lbl_accel.setText(f"x={ax:+.4f} y={ay:+.4f} z={az:+.4f}")
+        if len(self._imu_history):
+            last = self._imu_history.raw.view()[:, -1]
+            self._lbl_imu_derived.setText(f"heading={self._imu_history.heading:+.3f} |a|={last[8]:.4f}")
+        self._redraw_imu()
+
+    def _on_imu_derived_toggled(self, plot: Any, on: bool) -> None:
+        plot.setVisible(on)
+        self._render.mark("imu")
+
+    def _on_imu_fft_toggled(self, on: bool) -> None:
+        self._plot_fft.setVisible(on)
+        self._render.mark("imu_fft")
+        self._render.expedite("imu_fft")
+
+    def _render_imu_fft(self) -> None:
+        channel = str(self._combo_fft_channel.currentText())
+        result = self._imu_history.spectrum(channel, self._ui_config.imu_fft_size)
+        if result is None:
+            self._curve_fft.setData([], [])
+            return
+        freqs, amp, fs = result
+        self._curve_fft.setData(freqs, amp)
+        df = float(freqs[1] - freqs[0])
+        self._plot_fft.setTitle(f"{channel} spectrum (fs≈{fs:.1f} Hz, Δf={df:.2f} Hz)")
+
+    def _render_imu_raw(self) -> None:
+        payload, self._imu_raw_payload = self._imu_raw_payload, None
+        if payload is not None:
+            self._raw_tree.update(payload)
+
+    def _raw_view_visible(self) -> bool:
+        # Collapsed, splitter-squeezed, covered or minimized views skip the refresh entirely.
+        w = self._raw_tree.widget
+        return w.isVisible() and not w.visibleRegion().isEmpty() and not self._win.isMinimized()
+
+    def _on_raw_view_toggled(self, expanded: bool) -> None:
+        self._btn_raw.setArrowType(self._Qt.DownArrow if expanded else self._Qt.RightArrow)
+        self._raw_tree.widget.setVisible(expanded)
+        if expanded:
+            self._render.expedite("imu_raw")
+
+    def _on_imu_window_changed(self, _v: float = 0.0) -> None:
+        self._chk_imu_follow.setChecked(True)
+        self._render.mark("imu")
+
+    def _on_imu_range_manual(self, *_args: Any) -> None:
+        # Mouse zoom/pan: stop following so the view stays where the user put it.
+        self._chk_imu_follow.setChecked(False)
+
+    def _on_imu_xrange_changed(self, *_args: Any) -> None:
+        # Zoom/pan pulls the window from the matching pyramid level on the next frame.
+        if not self._imu_range_guard:
+            self._render.mark("imu")
+
+    def _redraw_imu(self) -> None:
+        curves = (self._curve_x, self._curve_y, self._curve_z)
+        accel_curves = (self._curve_ax, self._curve_ay, self._curve_az)
+        if len(self._imu_history) == 0:
+            derived = (self._curve_heading, self._curve_amag, self._curve_latency)
+            for curve in curves + accel_curves + derived:
+                curve.setData([], [])
+            return
 
-        gyro_path = self._combo_gyro_path.text().strip()
-        gyro_vec: Optional[tuple[float, float, float]]
-        if gyro_path:
-            gyro_vec = _extract_vec3_with_keysets(payload, gyro_path, keysets=_VEC3_KEYSETS_GYRO)
+        vb = self._plot.getViewBox()
+        if self._chk_imu_follow.isChecked():
+            x1 = float(self._imu_history.raw.view()[0, -1])
+            x0 = x1 - float(self._spin_imu_window.value())
+            self._imu_range_guard = True
+            try:
+                vb.setXRange(x0, x1, padding=0.0)
+            finally:
+                self._imu_range_guard = False
         else:
-            detected_path, gyro_vec = _autodetect_vec3(
-                payload, candidates=gyro_candidates, keysets=_VEC3_KEYSETS_GYRO
+            x0, x1 = vb.viewRange()[0]
+
+        # A min/max pair per pixel column is enough to draw every peak.
+        max_points = max(256, 2 * int(vb.width()))
+        # One query serves both plots; the columns just pick gyro (0..2) or accel (3..5).
+        t, values = self._imu_history.query(x0, x1, max_points)
+        mode = str(self._combo_imu_plot.currentText()).lower()
+        first = 3 if mode == "accel" else 0
+        for curve, row in zip(curves, values[first : first + 3]):
+            curve.setData(t, row, connect="finite")
+        if mode == "stacked":
+            for curve, row in zip(accel_curves, values[3:6]):
+                curve.setData(t, row, connect="finite")
+        if self._plot_heading.isVisible():
+            self._curve_heading.setData(t, values[6], connect="finite")
+        if self._plot_amag.isVisible():
+            self._curve_amag.setData(t, values[7], connect="finite")
+        if self._plot_latency.isVisible():
+            self._curve_latency.setData(t, values[8], connect="finite")
+
+    def _on_cam_meta(self, text: str) -> None:
+        self._set_label_later(self._lbl_cam_meta, text)
+
+    def _on_cam_jpeg(self, frame: _CameraFrame) -> None:
+        self._cam_frame = frame
+        self._render.mark("camera")
+
+    def _render_camera(self) -> None:
+        frame = self._cam_frame
+        if frame is None:
+            return
+        # The worker scales the next frames to the current size (the view copes until then).
+        self._cam_decoder.target_size = self._cam_view.target_size()
+        self._cam_view.set_image(frame.image)
+
+    def _update_cam_stats(self, dt: float) -> None:
+        dec = self._cam_decoder
+        view = self._cam_view
+        # Replaced in the decode lane / mailbox, or set but replaced before the view repainted.
+        dropped = self._bridge.mailbox(self._robot_id, "cam_jpeg").dropped + view.skipped
+        last_decoded, last_shown, last_work_s, last_dropped = self._cam_stats_last
+        n_dec = dec.decoded - last_decoded
+        work_ms = (dec.work_s - last_work_s) / n_dec * 1000.0 if n_dec else 0.0
+        frame = self._cam_frame
+        decode = ""
+        if frame is not None:
+            w, h = frame.source_size
+            scaling = "fast" if frame.fast else "smooth"
+            decode = f" ({frame.backend} {w}x{h} 1/{frame.decode_scale}, {scaling})"
+        self._lbl_cam_stats.setText(
+            f"frames: decoded {n_dec / dt:.1f}/s shown {(view.painted - last_shown) / dt:.1f}/s "
+            f"dropped {dropped - last_dropped} | worker decode+scale {work_ms:.1f} ms/frame{decode}"
+        )
+        self._cam_stats_last = (dec.decoded, view.painted, dec.work_s, dropped)
+
+    def _on_lidar_front(self, text: str) -> None:
+        self._set_label_later(self._lbl_lidar_front, text)
+
+    def _on_lidar_scan(self, scan: _LidarScan) -> None:
+        self._lidar.set_scan(scan)
+        self._render.mark("lidar")
+
+    def _reset_lidar_view(self) -> None:
+        # Fit the range filter when one is set, else the configured initial view.
+        half = float(self._spin_lidar_range_m.value()) or float(self._ui_config.lidar_view_m)
+        self._lidar_plot.setXRange(-half, half, padding=0.0)
+        self._lidar_plot.setYRange(-half, half, padding=0.0)
+
+    def _on_lidar_flip_y(self, _on: bool) -> None:
+        # Accumulated hits are in the old orientation.
+        if self._lidar_grid is not None:
+            self._lidar_grid.clear()
+            self._lidar_grid_image.clear()
+        self._render.mark("lidar")
+
+    def _on_lidar_grid_toggled(self, on: bool) -> None:
+        if on:
+            cfg = self._ui_config
+            self._lidar_grid = _OccupancyGrid(
+                resolution_m=cfg.lidar_grid_resolution_m,
+                extent_m=cfg.lidar_grid_extent_m,
+                half_life_s=cfg.lidar_grid_half_life_s,
             )
-            self._lbl_gyro_path.setText(f"auto: {detected_path}" if detected_path else "auto: (not found)")
-
-        if gyro_vec is None:
-            self._lbl_gyro.setText("x=-- y=-- z=--")
-        else:
-            gx, gy, gz = gyro_vec
-            self._lbl_gyro.setText(f"x={gx:+.4f} y={gy:+.4f} z={gz:+.4f}")
-
-        accel_path = self._combo_accel_path.text().strip()
-        accel_vec: Optional[tuple[float, float, float]]
-        if accel_path:
-            accel_vec = _extract_vec3_with_keysets(payload, accel_path, keysets=_VEC3_KEYSETS_ACCEL)
+            e = self._lidar_grid.extent_m
+            self._lidar_grid_image.setRect(-e, -e, 2.0 * e, 2.0 * e)
+            # Start from the scan on screen, if any.
+            self._lidar_grid_scan = 0
         else:
-            detected_path, accel_vec = _autodetect_vec3(
-                payload, candidates=accel_candidates, keysets=_VEC3_KEYSETS_ACCEL
+            self._lidar_grid = None
+            self._lidar_grid_image.clear()
+        self._lidar_grid_image.setVisible(on)
+        self._render.mark("lidar")
+
+    def _on_lidar_display_changed(self, display: str) -> None:
+        sectors = display == "sectors"
+        self._lidar_scatter.setVisible(not sectors)
+        self._lidar_sector_curve.setVisible(sectors)
+        self._lidar_sector_table.setVisible(sectors)
+        self._spin_lidar_sectors.setEnabled(sectors)
+        # Redraw the status line (and the view) for the new display even without a new scan.
+        self._lidar.invalidate()
+        self._render.mark("lidar")
+
+    def _on_lidar_sectors_changed(self, n: int) -> None:
+        from PySide6.QtWidgets import QTableWidgetItem
+
+        table = self._lidar_sector_table
+        table.setRowCount(n)
+        table.setVerticalHeaderLabels([f"{i * 360.0 / n:.0f} deg" for i in range(n)])
+        for row in range(n):
+            for col in range(table.columnCount()):
+                item = QTableWidgetItem("--")
+                item.setTextAlignment(int(self._Qt.AlignRight | self._Qt.AlignVCenter))
+                table.setItem(row, col, item)
+        self._render.mark("lidar")
+
+    def _render_lidar(self) -> None:
+        scan = self._lidar.scan
+        range_m = float(self._spin_lidar_range_m.value())
+        flip_y = self._chk_lidar_flip_y.isChecked()
+        grid = self._lidar_grid
+        if grid is not None and scan is not None and self._lidar_grid_scan != self._lidar.arrived:
+            # Once per scan; the image is redrawn at a cost set by the grid size, not the scan count.
+            self._lidar_grid_scan = self._lidar.arrived
+            x, y = self._lidar.filtered_xy(range_m=range_m, flip_y=flip_y)
+            grid.add(x, y, time.monotonic())
+            self._lidar_grid_image.setImage(
+                grid.grid, autoLevels=False, levels=(0.0, max(1.0, float(grid.grid.max())))
             )
-            self._lbl_accel_path.setText(f"auto: {detected_path}" if detected_path else "auto: (not found)")
-
-        if accel_vec is None:
-            self._lbl_accel.setText("x=-- y=-- z=--")
-        else:
-            ax, ay, az = accel_vec
-            self._lbl_accel.setText(f"x={ax:+.4f} y={ay:+.4f} z={az:+.4f}")
 
-        plot_mode = str(self._combo_imu_plot.currentText()).lower()
-        vec = accel_vec if plot_mode == "accel" else gyro_vec
-        if vec is None:
+        if self._combo_lidar_display.currentText() == "sectors":
+            self._render_lidar_sectors(range_m, flip_y)
             return
 
-        x, y, z = vec
-        t = time.monotonic() - self._t0
-        self._buf_t.append(t)
-        self._buf_x.append(x)
-        self._buf_y.append(y)
-        self._buf_z.append(z)
-        self._curve_x.setData(list(self._buf_t), list(self._buf_x))
-        self._curve_y.setData(list(self._buf_t), list(self._buf_y))
-        self._curve_z.setData(list(self._buf_t), list(self._buf_z))
-
-    def _on_cam_meta(self, payload: Any) -> None:
-        try:
-            self._lbl_cam_meta.setText("meta: " + json.dumps(payload, ensure_ascii=False))
-        except Exception:
-            self._lbl_cam_meta.setText("meta: (decode failed)")
-
-    def _on_cam_jpeg(self, jpg: bytes) -> None:
-        from PySide6.QtGui import QImage, QPixmap
-
-        img = QImage.fromData(jpg, "JPG")
-        if img.isNull():
-            self._append_log(f"camera jpeg decode failed (bytes={len(jpg)})")
-            return
-        pix = QPixmap.fromImage(img)
-        scaled = pix.scaled(
-            self._cam_label.size(), self._Qt.KeepAspectRatio, self._Qt.SmoothTransformation
+        vb = self._lidar_plot.getViewBox()
+        (x0, x1), (y0, y1) = vb.viewRange()
+        out = self._lidar.view(
+            range_m=range_m,
+            max_points=int(self._spin_lidar_max_points.value()),
+            flip_y=flip_y,
+            viewport=(x0, x1, y0, y1, int(vb.width()), int(vb.height())),
         )
-        self._cam_label.setPixmap(scaled)
-
-    def _on_lidar_front(self, payload: Any) -> None:
-        try:
-            self._lbl_lidar_front.setText("front: " + json.dumps(payload, ensure_ascii=False))
-        except Exception:
-            self._lbl_lidar_front.setText("front: (decode failed)")
-
-    def _on_lidar_scan(self, payload: Any) -> None:
-        if isinstance(payload, dict):
-            self._lidar_last_scan = payload
-        else:
-            self._lidar_last_scan = None
-
-    def _tick_lidar(self) -> None:
-        payload = self._lidar_last_scan
-        if not payload:
+        if scan is None or out is None:
             return
+        pos, n = out
+        self._lidar_scatter.setData(pos=pos)
 
-        seq, ts_ms, pts = _extract_lidar_points(payload)
-        n_total = len(pts)
+        seq, ts_ms = scan.seq, scan.ts_ms
+        n_total = int(scan.angles.shape[0])
         if n_total == 0:
             self._lbl_lidar.setText(f"scan: seq={seq} ts_ms={ts_ms} points=0")
-            self._lidar_scatter.setData(pos=[])
-            return
-
-        max_points = int(self._spin_lidar_max_points.value())
-        rmax = min(1.0, float(self._spin_lidar_range_m.value()))
-
-        np = self._np
-        angles = np.fromiter((p[0] for p in pts), dtype=np.float64, count=n_total)
-        ranges = np.fromiter((p[1] for p in pts), dtype=np.float64, count=n_total)
+        elif n == 0:
+            self._lbl_lidar.setText(f"scan: seq={seq} ts_ms={ts_ms} points=0 (after filter / out of view)")
+        else:
+            self._lbl_lidar.setText(f"scan: seq={seq} ts_ms={ts_ms} points={n}/{n_total} ({scan.layout})")
 
-        mask = ranges > 0.0
-        if rmax > 0.0:
-            mask &= ranges <= rmax
-        angles = angles[mask]
-        ranges = ranges[mask]
+    def _render_lidar_sectors(self, range_m: float, flip_y: bool) -> None:
+        import numpy as np
 
-        n = int(angles.shape[0])
-        if n == 0:
-            self._lbl_lidar.setText(f"scan: seq={seq} ts_ms={ts_ms} points=0 (after filter)")
-            self._lidar_scatter.setData(pos=[])
+        scan = self._lidar.scan
+        n = int(self._spin_lidar_sectors.value())
+        out = self._lidar.sectors(n, range_m=range_m, flip_y=flip_y)
+        if scan is None or out is None:
             return
-
-        if n > max_points:
-            idx = np.linspace(0, n - 1, num=max_points, dtype=np.int64)
-            angles = angles[idx]
-            ranges = ranges[idx]
-            n = int(angles.shape[0])
-
-        # Convert to XY where robot front is +Y (up) and angle_rad=0 points forward.
-        # x is right, y is forward.
-        x = ranges * np.sin(angles)
-        y = ranges * np.cos(angles)
-        if self._chk_lidar_flip_y.isChecked():
-            y = -y
-        pos = np.column_stack((x, y))
-        self._lidar_scatter.setData(pos=pos)
-
-        # Display area is fixed to 2m x 2m centered at origin.
-        # rmax is only used as a distance filter (and capped to <= 1.0 above).
-
-        self._lbl_lidar.setText(f"scan: seq={seq} ts_ms={ts_ms} points={n}/{n_total}")
+        nearest, mean, count = out
+
+        # Constant size whatever the scan: a closed outline through each sector's two edges.
+        width = 2.0 * np.pi / n
+        start = (np.arange(n) - 0.5) * width
+        a = np.column_stack((start, start + width)).ravel()
+        r = np.repeat(nearest, 2)
+        x = np.append(r * np.sin(a), r[0] * np.sin(a[0]))
+        y = np.append(r * np.cos(a), r[0] * np.cos(a[0]))
+        self._lidar_sector_curve.setData(x, y, connect="finite")
+
+        table = self._lidar_sector_table
+        for row in range(n):
+            texts = (
+                "--" if count[row] == 0 else f"{nearest[row]:.2f}",
+                "--" if count[row] == 0 else f"{mean[row]:.2f}",
+                str(int(count[row])),
+            )
+            for col, text in enumerate(texts):
+                item = table.item(row, col)
+                if item.text() != text:
+                    item.setText(text)
+
+        seq, ts_ms = scan.seq, scan.ts_ms
+        n_total = int(scan.angles.shape[0])
+        summary = "no points (after filter)"
+        if count.any():
+            i = int(np.nanargmin(nearest))
+            summary = f"nearest {nearest[i]:.2f} m @ {i * 360.0 / n:.0f} deg"
+        self._lbl_lidar.setText(
+            f"scan: seq={seq} ts_ms={ts_ms} points={int(count.sum())}/{n_total} {n} sectors, {summary}"
+        )
 
     def _on_close(self) -> None:
         if self._closing:
@@ -1377,11 +3986,18 @@ class MainWindow:
                 self._pressed.clear()
                 self._last_nonzero = False
                 self._motor_timer.stop()
+                self._drain_timer.stop()
+                self._render_timer.stop()
+                self._supervisor.stop()
             except Exception:
                 pass
 
             # Send multiple zero commands to avoid a final non-zero tick racing the close.
             self._send_stop(repeat=5)
+            if self._print_key_latency:
+                mode = "on key" if self._chk_publish_on_key.isChecked() else "timer"
+                print(f"[key->put] ({mode}) {self._key_latency.summary()}", flush=True)
+                print(self._key_latency.format_buckets(), flush=True)
         finally:
             try:
                 self._client.close()
@@ -1389,9 +4005,258 @@ class MainWindow:
                 pass
 
 
+class _FleetTile:
+    """
+    Compact per-robot panel for FleetWindow: camera thumbnail, LiDAR mini-plot and latest values.
+    """
+
+    _LIDAR_MAX_POINTS = 1000
+    # Thumbnail size (inside the frame); the fleet camera decoders scale to it in the worker.
+    CAMERA_SIZE = (240, 180)
+
+    def __init__(self, robot_id: str, *, ui_config: UIConfig) -> None:
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QFont
+        from PySide6.QtWidgets import QFrame, QGridLayout, QGroupBox, QLabel
+
+        import pyqtgraph as pg
+
+        self._Qt = Qt
+        self._range_m = float(ui_config.lidar_range_m)
+        view_m = self._range_m or float(ui_config.lidar_view_m)
+        self._flip_y = bool(ui_config.lidar_flip_y)
+        self._lidar = _LidarPipeline()
+
+        self.box = QGroupBox(robot_id)
+        grid = QGridLayout(self.box)
+
+        self._cam = _CameraView("camera: --")
+        fw = 2 * self._cam.widget.frameWidth()
+        self._cam.widget.setFixedSize(self.CAMERA_SIZE[0] + fw, self.CAMERA_SIZE[1] + fw)
+        grid.addWidget(self._cam.widget, 0, 0)
+
+        self._lidar_plot = pg.PlotWidget()
+        self._lidar_plot.setFixedSize(180, 180)
+        self._lidar_plot.setAspectLocked(True)
+        self._lidar_plot.hideAxis("left")
+        self._lidar_plot.hideAxis("bottom")
+        self._lidar_plot.setMouseEnabled(x=False, y=False)
+        self._lidar_plot.setXRange(-view_m, view_m, padding=0.0)
+        self._lidar_plot.setYRange(-view_m, view_m, padding=0.0)
+        robot = pg.ScatterPlotItem(size=8, pen=pg.mkPen("c"), brush=pg.mkBrush(0, 200, 200, 120))
+        robot.setData(pos=[(0.0, 0.0)])
+        self._lidar_plot.addItem(robot)
+        self._lidar_scatter = pg.ScatterPlotItem(size=2, pen=None, brush=pg.mkBrush(255, 255, 0, 200))
+        self._lidar_plot.addItem(self._lidar_scatter)
+        grid.addWidget(self._lidar_plot, 0, 1)
+
+        self._lbl = QLabel("imu: --\nlidar: --\nfront: --\ntelemetry: --")
+        self._lbl.setFont(QFont("Monospace"))
+        self._lbl.setFrameStyle(QFrame.Panel | QFrame.Sunken)
+        grid.addWidget(self._lbl, 1, 0, 1, 2)
+
+        self._imu_text = "imu: --"
+        self._lidar_text = "lidar: --"
+        self._front_text = "front: --"
+        self._telem_text = "telemetry: --"
+
+    def _refresh_text(self) -> None:
+        self._lbl.setText(
+            "\n".join((self._imu_text, self._lidar_text, self._front_text, self._telem_text))
+        )
+
+    def on_imu(self, sample: _ImuSample) -> None:
+        def _v(vec: Optional[tuple[float, float, float]]) -> str:
+            return "--" if vec is None else f"{vec[0]:+.2f} {vec[1]:+.2f} {vec[2]:+.2f}"
+
+        self._imu_text = f"gyro {_v(sample.gyro)} | accel {_v(sample.accel)}"
+        self._refresh_text()
+
+    def on_motor_telemetry(self, texts: tuple[str, str]) -> None:
+        self._telem_text = texts[0]
+        self._refresh_text()
+
+    def on_cam_meta(self, text: str) -> None:
+        self._cam.widget.setToolTip(text)
+
+    def on_cam_jpeg(self, frame: _CameraFrame) -> None:
+        # Already scaled to CAMERA_SIZE by the worker.
+        self._cam.set_image(frame.image)
+
+    def on_lidar_scan(self, scan: _LidarScan) -> None:
+        self._lidar.set_scan(scan)
+        vb = self._lidar_plot.getViewBox()
+        (x0, x1), (y0, y1) = vb.viewRange()
+        out = self._lidar.view(
+            range_m=self._range_m,
+            max_points=self._LIDAR_MAX_POINTS,
+            flip_y=self._flip_y,
+            viewport=(x0, x1, y0, y1, int(vb.width()), int(vb.height())),
+        )
+        if out is None:
+            return
+        pos, n = out
+        self._lidar_scatter.setData(pos=pos)
+        self._lidar_text = f"lidar: seq={scan.seq} points={n}/{int(scan.angles.shape[0])}"
+        self._refresh_text()
+
+    def on_lidar_front(self, text: str) -> None:
+        self._front_text = text
+        self._refresh_text()
+
+
+class FleetWindow:
+    """
+    Monitor-only view of every robot seen on one shared `dmc_robo/*/**` session.
+
+    Tiles are added as robots appear; all robots share the same decode pool and drain timer.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: ZenohClient,
+        supervisor: _SessionSupervisor,
+        bridge: _Bridge,
+        ui_config: UIConfig,
+        columns: int,
+    ) -> None:
+        from PySide6.QtCore import QTimer, Qt
+        from PySide6.QtGui import QAction
+        from PySide6.QtWidgets import (
+            QGridLayout,
+            QLabel,
+            QMainWindow,
+            QPlainTextEdit,
+            QScrollArea,
+            QSplitter,
+            QWidget,
+        )
+
+        self._client = client
+        self._bridge = bridge
+        self._ui_config = ui_config
+        self._columns = max(1, int(columns))
+        self._tiles: dict[str, _FleetTile] = {}
+        self._closing = False
+
+        class _Win(QMainWindow):
+            def __init__(self, owner: "FleetWindow"):
+                super().__init__()
+                self._owner = owner
+
+            def closeEvent(self, event: Any) -> None:
+                self._owner._on_close()
+                event.accept()
+
+        self._win = _Win(self)
+        self._win.setWindowTitle("Zenoh Remote UI (fleet)")
+        self._win.setMinimumSize(1100, 700)
+
+        self._grid_host = QWidget()
+        self._grid = QGridLayout(self._grid_host)
+        self._lbl_waiting = QLabel(f"waiting for robots on {_FLEET_KEY} ...")
+        self._grid.addWidget(self._lbl_waiting, 0, 0)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(self._grid_host)
+
+        self._log = QPlainTextEdit()
+        self._log.setReadOnly(True)
+        self._log.setMaximumBlockCount(2000)
+
+        split = QSplitter()
+        split.setOrientation(Qt.Vertical)
+        split.addWidget(scroll)
+        split.addWidget(self._log)
+        split.setStretchFactor(0, 1)
+        self._win.setCentralWidget(split)
+
+        action_quit = QAction("Quit", self._win)
+        action_quit.triggered.connect(self._win.close)
+        self._win.menuBar().addAction(action_quit)
+
+        bridge.qobj.log.connect(self._append_log)
+
+        self._drain_timer = QTimer()
+        self._drain_timer.timeout.connect(self._drain_mailboxes)
+        self._drain_timer.start(max(1, int(1000.0 / float(ui_config.delivery_drain_hz))))
+
+        self._lbl_link = QLabel("connecting...")
+        self._win.statusBar().addWidget(self._lbl_link)
+        bridge.qobj.status.connect(self._lbl_link.setText)
+        self._supervisor = supervisor
+        self._supervisor.start()
+
+    def show(self) -> None:
+        self._win.show()
+
+    def _append_log(self, msg: str) -> None:
+        ts = time.strftime("%H:%M:%S")
+        self._log.appendPlainText(f"[{ts}] {msg}")
+
+    def _tile(self, robot_id: str) -> _FleetTile:
+        tile = self._tiles.get(robot_id)
+        if tile is None:
+            if not self._tiles:
+                self._lbl_waiting.hide()
+            tile = _FleetTile(robot_id, ui_config=self._ui_config)
+            i = len(self._tiles)
+            self._grid.addWidget(tile.box, i // self._columns, i % self._columns)
+            self._tiles[robot_id] = tile
+            self._win.setWindowTitle(f"Zenoh Remote UI (fleet: {len(self._tiles)} robots)")
+            self._append_log(f"robot discovered: {robot_id}")
+        return tile
+
+    def _drain_mailboxes(self) -> None:
+        if self._closing:
+            return
+        for robot_id in self._bridge.robots():
+            tile = self._tile(robot_id)
+            handlers = {
+                "imu": tile.on_imu,
+                "motor_telemetry": tile.on_motor_telemetry,
+                "cam_jpeg": tile.on_cam_jpeg,
+                "cam_meta": tile.on_cam_meta,
+                "lidar_scan": tile.on_lidar_scan,
+                "lidar_front": tile.on_lidar_front,
+            }
+            for topic, handler in handlers.items():
+                items = self._bridge.mailbox(robot_id, topic).take_all()
+                if not items:
+                    continue
+                # Tiles only show the latest state, so queued samples collapse to the newest one.
+                try:
+                    handler(items[-1])
+                except Exception as e:
+                    self._append_log(f"{robot_id}: {topic} handler failed: {e}")
+
+    def _on_close(self) -> None:
+        if self._closing:
+            return
+        self._closing = True
+        self._drain_timer.stop()
+        self._supervisor.stop()
+        try:
+            self._client.close()
+        except Exception:
+            pass
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Zenoh remote UI for dmc_robo")
-    p.add_argument("--robot-id", required=True, help="robot_id (e.g. rasp-zero-01)")
+    p.add_argument("--robot-id", default=None, help="robot_id (e.g. rasp-zero-01). Required unless --fleet.")
+    p.add_argument(
+        "--fleet",
+        action="store_true",
+        help="Monitor every robot on one shared session (subscribes dmc_robo/*/**). No motor/OLED control.",
+    )
+    p.add_argument(
+        "--fleet-columns",
+        type=int,
+        default=4,
+        help="Tiles per row in --fleet mode (default: 4).",
+    )
     p.add_argument(
         "--config",
         type=Path,
@@ -1422,6 +4287,20 @@ def main(argv: Optional[list[str]] = None) -> int:
         help='Connect endpoint override (repeatable), e.g. --connect "tcp/192.168.1.10:7447". '
         "If set, it is applied on top of defaults or --zenoh-config.",
     )
+    p.add_argument(
+        "--motor-encoding",
+        choices=MOTOR_ENCODINGS,
+        default=None,
+        help="motor/cmd payload encoding (default: [motor].encoding in config.toml, else json). "
+        "'bin' is a compact fixed-layout format; the robot must support it.",
+    )
+    p.add_argument(
+        "--motor-publish-mode",
+        choices=MOTOR_PUBLISH_MODES,
+        default=None,
+        help="motor/cmd publish mode (default: [motor].publish_mode or fixed). "
+        "'on_change' sends on key change plus deadman heartbeats.",
+    )
     p.add_argument(
         "--print-pub",
         action="store_true",
@@ -1437,9 +4316,16 @@ def main(argv: Optional[list[str]] = None) -> int:
         action="store_true",
         help="Print measured motor publish period to terminal (about 1 line/sec).",
     )
+    p.add_argument(
+        "--print-key-latency",
+        action="store_true",
+        help="Print the key event -> motor/cmd put latency histogram on exit.",
+    )
     args = p.parse_args(argv)
     if args.print_pub_motor_all:
         args.print_pub = True
+    if not args.fleet and not args.robot_id:
+        p.error("--robot-id is required (or use --fleet)")
 
     config_path: Optional[Path]
     if args.no_config:
@@ -1459,14 +4345,71 @@ def main(argv: Optional[list[str]] = None) -> int:
     from PySide6.QtWidgets import QApplication
 
     app = QApplication(sys.argv[:1])
-    bridge = _Bridge()
+    bridge = _Bridge(ui_config)
+    # In single-robot mode the IMU decoder is shared with MainWindow (field path boxes);
+    # fleet robots each get their own auto-detecting decoder.
+    imu_decoder = _ImuDecoder()
+    cam_decoder = _CameraDecoder(
+        scaling=ui_config.camera_scaling, fast_above_fps=ui_config.camera_fast_above_fps
+    )
+
+    def _make_decoders() -> dict[str, Callable[[bytes, float], Any]]:
+        return {
+            "imu": _ImuDecoder() if args.fleet else imu_decoder,
+            "motor_telemetry": _decode_motor_telemetry,
+            "cam_jpeg": _CameraDecoder(target_size=_FleetTile.CAMERA_SIZE, scaling="fast")
+            if args.fleet
+            else cam_decoder,
+            "cam_meta": _decode_cam_meta,
+            "lidar_scan": _LidarScanDecoder(),
+            "lidar_front": _decode_lidar_front,
+        }
+
+    decode_pool = _DecodePool(
+        bridge=bridge, make_decoders=_make_decoders, workers=ui_config.delivery_decode_workers
+    )
+    if not args.fleet:
+        robot_id = args.robot_id
+        cam_decoder.arrivals = lambda: decode_pool.received(robot_id, "cam_jpeg")
     client = ZenohClient(
-        open_session=open_session, robot_id=args.robot_id, bridge=bridge, print_publish=args.print_pub
+        open_session=open_session,
+        robot_id=None if args.fleet else args.robot_id,
+        bridge=bridge,
+        decode_pool=decode_pool,
+        print_publish=args.print_pub,
+        motor_encoding=args.motor_encoding or ui_config.motor_encoding,
+    )
+    supervisor = _SessionSupervisor(
+        client=client,
+        bridge=bridge,
+        grace_s=ui_config.reconnect_grace_s,
+        backoff_max_s=ui_config.reconnect_backoff_max_s,
     )
-    win = MainWindow(client=client, bridge=bridge, args=args, ui_config=ui_config)
-    app.installEventFilter(win._key_filter)  # global motor key capture
+    win: Any
+    if args.fleet:
+        win = FleetWindow(
+            client=client,
+            supervisor=supervisor,
+            bridge=bridge,
+            ui_config=ui_config,
+            columns=args.fleet_columns,
+        )
+    else:
+        win = MainWindow(
+            client=client,
+            supervisor=supervisor,
+            bridge=bridge,
+            imu_decoder=imu_decoder,
+            cam_decoder=cam_decoder,
+            args=args,
+            ui_config=ui_config,
+        )
+        app.installEventFilter(win._key_filter)  # global motor key capture
     win.show()
-    return int(app.exec())
+    try:
+        return int(app.exec())
+    finally:
+        decode_pool.shutdown()
 
 
 if __name__ == "__main__":
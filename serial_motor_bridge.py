@@ -9,9 +9,19 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
+from dmc_common import (
+    MOTOR_BIN_UNITS,
+    MOTOR_ENCODINGS,
+    MOTOR_PUBLISH_MODES,
+    MotorPublishPolicy,
+    encode_motor_cmd,
+)
+
 
 LINE_RE = re.compile(r"^L:\s*(-?\d+)\s*,\s*R:\s*(-?\d+)\s*$")
 
+_RECONNECT_BACKOFF_MIN_S = 0.5
+
 
 def _load_toml_file(path: Path) -> dict[str, Any]:
     try:
@@ -63,6 +73,12 @@ class SerialConfig:
     deadman_ms: int = 300
     publish_hz: float = 10.0
     unit: str = "mps"
+    encoding: str = "json"
+    publish_mode: str = "fixed"
+    heartbeat_margin: float = 0.5
+    idle_deadband: float = 0.02
+    reconnect_grace_s: float = 3.0
+    reconnect_backoff_max_s: float = 10.0
 
 
 def _load_serial_config(path: Optional[Path]) -> SerialConfig:
@@ -72,6 +88,7 @@ def _load_serial_config(path: Optional[Path]) -> SerialConfig:
     data = _load_toml_file(path)
     controller = _toml_get(data, ("controller",), {})
     motor = _toml_get(data, ("motor",), {})
+    reconnect = _toml_get(data, ("reconnect",), {})
 
     def _f(x: Any, default: float) -> float:
         try:
@@ -127,6 +144,50 @@ def _load_serial_config(path: Optional[Path]) -> SerialConfig:
 
     unit = _s(_toml_get(controller, ("unit",), SerialConfig.unit), SerialConfig.unit)
 
+    encoding_default = _s(_toml_get(motor, ("encoding",), SerialConfig.encoding), SerialConfig.encoding)
+    encoding = _s(_toml_get(controller, ("encoding",), encoding_default), encoding_default)
+    encoding = encoding.strip().lower() if encoding else SerialConfig.encoding
+    if encoding not in MOTOR_ENCODINGS:
+        encoding = SerialConfig.encoding
+
+    mode_default = _s(_toml_get(motor, ("publish_mode",), SerialConfig.publish_mode), SerialConfig.publish_mode)
+    publish_mode = _s(_toml_get(controller, ("publish_mode",), mode_default), mode_default)
+    publish_mode = publish_mode.strip().lower() if publish_mode else SerialConfig.publish_mode
+    if publish_mode not in MOTOR_PUBLISH_MODES:
+        publish_mode = SerialConfig.publish_mode
+
+    margin_default = _f(
+        _toml_get(motor, ("heartbeat_margin",), SerialConfig.heartbeat_margin),
+        SerialConfig.heartbeat_margin,
+    )
+    heartbeat_margin = _clamp(
+        _f(_toml_get(controller, ("heartbeat_margin",), margin_default), margin_default),
+        0.1,
+        0.9,
+    )
+    idle_deadband = _clamp(
+        _f(
+            _toml_get(controller, ("idle_deadband",), SerialConfig.idle_deadband),
+            SerialConfig.idle_deadband,
+        ),
+        0.0,
+        0.5,
+    )
+
+    reconnect_grace_s = _clamp(
+        _f(_toml_get(reconnect, ("grace_s",), SerialConfig.reconnect_grace_s), SerialConfig.reconnect_grace_s),
+        0.0,
+        60.0,
+    )
+    reconnect_backoff_max_s = _clamp(
+        _f(
+            _toml_get(reconnect, ("backoff_max_s",), SerialConfig.reconnect_backoff_max_s),
+            SerialConfig.reconnect_backoff_max_s,
+        ),
+        _RECONNECT_BACKOFF_MIN_S,
+        300.0,
+    )
+
     return SerialConfig(
         serial=serial,
         baud=baud,
@@ -135,6 +196,12 @@ def _load_serial_config(path: Optional[Path]) -> SerialConfig:
         deadman_ms=deadman_ms,
         publish_hz=publish_hz,
         unit=unit,
+        encoding=encoding,
+        publish_mode=publish_mode,
+        heartbeat_margin=heartbeat_margin,
+        idle_deadband=idle_deadband,
+        reconnect_grace_s=reconnect_grace_s,
+        reconnect_backoff_max_s=reconnect_backoff_max_s,
     )
 
 
@@ -203,21 +270,127 @@ def _map_to_mps(raw: float, raw_max: int, max_mps: float) -> float:
     return float(raw) / float(raw_max) * float(max_mps)
 
 
-def _send_stop(pub: Any, *, unit: str, deadman_ms: int, repeat: int = 5) -> None:
-    payload = {
-        "v_l": 0.0,
-        "v_r": 0.0,
-        "unit": unit,
-        "deadman_ms": int(deadman_ms),
-        "seq": 0,
-        "ts_ms": int(time.time() * 1000),
-    }
-    for i in range(repeat):
-        payload["seq"] = i
-        payload["ts_ms"] = int(time.time() * 1000)
+class _ReconnectingPublisher:
+    """
+    motor/cmd publisher that survives router restarts and link drops.
+
+    `put()` never raises. A failed open or put, or a link that stays gone longer than `grace_s`
+    (zenoh relinks configured endpoints by itself first), closes the session; it is reopened on a
+    later `put()` with exponential backoff, so the serial loop keeps draining the controller.
+    """
+
+    def __init__(
+        self, *, open_session: Any, key: str, grace_s: float, backoff_max_s: float
+    ) -> None:
+        self._open_session = open_session
+        self._key = key
+        self._grace_s = float(grace_s)
+        self._backoff_max_s = max(_RECONNECT_BACKOFF_MIN_S, float(backoff_max_s))
+        self._backoff = _RECONNECT_BACKOFF_MIN_S
+        self._session: Any = None
+        self._pub: Any = None
+        self._next_open_t = 0.0
+        self._ever_linked = False
+        self._down_since: Optional[float] = None
+        self._relink_deadline = 0.0
+
+    def _open(self, now: float) -> bool:
+        if now < self._next_open_t:
+            return False
         try:
-            pub.put(json.dumps(payload).encode("utf-8"))
-        except Exception:
+            self._session = self._open_session()
+            self._pub = self._session.declare_publisher(self._key)
+        except (Exception, SystemExit) as e:
+            # The opener reports zenoh.open() failures as SystemExit; here they are retryable.
+            self._drop()
+            print(f"[zenoh] open failed (retry in {self._backoff:.1f} s): {e}", flush=True)
+            self._next_open_t = now + self._backoff
+            self._backoff = min(self._backoff * 2.0, self._backoff_max_s)
+            if self._down_since is None:
+                self._down_since = now
+            return False
+        self._relink_deadline = now + max(self._grace_s, self._backoff)
+        return True
+
+    def _drop(self) -> None:
+        pub, self._pub = self._pub, None
+        session, self._session = self._session, None
+        if pub is not None:
+            try:
+                pub.undeclare()
+            except Exception:
+                pass
+        if session is not None:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    def _linked(self) -> Optional[bool]:
+        session = self._session
+        if session is None or session.is_closed():
+            return None
+        info = session.info
+        return any(True for _ in info.routers_zid()) or any(True for _ in info.peers_zid())
+
+    def _check_link(self, now: float) -> None:
+        linked = self._linked()
+        if linked:
+            self._ever_linked = True
+            self._backoff = _RECONNECT_BACKOFF_MIN_S
+            if self._down_since is not None:
+                print(f"[zenoh] reconnected after {now - self._down_since:.2f} s", flush=True)
+                self._down_since = None
+            return
+        if linked is False and not self._ever_linked:
+            return
+        if self._down_since is None:
+            self._down_since = now
+            self._relink_deadline = now + self._grace_s
+            print("[zenoh] link lost", flush=True)
+        if linked is None or now >= self._relink_deadline:
+            print(f"[zenoh] reopening session after {now - self._down_since:.1f} s", flush=True)
+            self._drop()
+            self._backoff = min(self._backoff * 2.0, self._backoff_max_s)
+
+    def open(self) -> bool:
+        """Connects eagerly (startup); a failure is retried by later `put()` calls."""
+        return self._session is not None or self._open(time.monotonic())
+
+    def put(self, data: bytes) -> bool:
+        now = time.monotonic()
+        if self._session is not None:
+            self._check_link(now)
+        if self._session is None and not self._open(now):
+            return False
+        try:
+            self._pub.put(data)
+        except Exception as e:
+            print(f"[zenoh] put failed: {e}", flush=True)
+            if self._down_since is None:
+                self._down_since = now
+            self._drop()
+            return False
+        return True
+
+    def close(self) -> None:
+        self._drop()
+
+
+def _send_stop(
+    pub: Any, *, unit: str, deadman_ms: int, encoding: str = "json", repeat: int = 5
+) -> None:
+    for i in range(repeat):
+        data = encode_motor_cmd(
+            v_l=0.0,
+            v_r=0.0,
+            unit=unit,
+            deadman_ms=deadman_ms,
+            seq=i,
+            ts_ms=int(time.time() * 1000),
+            encoding=encoding,
+        )
+        if not pub.put(data):
             return
         time.sleep(0.05)
 
@@ -264,8 +437,24 @@ def main(argv: Optional[list[str]] = None) -> int:
         "--publish-hz", type=float, default=None, help="Publish rate (Hz) (default: 10)"
     )
     p.add_argument("--unit", type=str, default=None, help="Speed unit (default: mps)")
+    p.add_argument(
+        "--motor-encoding",
+        choices=MOTOR_ENCODINGS,
+        default=None,
+        help="motor/cmd payload encoding (default: json). 'bin' needs robot-side support.",
+    )
+    p.add_argument(
+        "--motor-publish-mode",
+        choices=MOTOR_PUBLISH_MODES,
+        default=None,
+        help="motor/cmd publish mode (default: fixed). 'on_change' sends when the averaged command "
+        "changes plus deadman heartbeats.",
+    )
     p.add_argument("--print-lines", action="store_true", help="Print parsed serial values")
     p.add_argument("--print-pub", action="store_true", help="Print published payloads")
+    p.add_argument(
+        "--print-rate", action="store_true", help="Print the measured publish rate once per second"
+    )
     args = p.parse_args(argv)
 
     config_path: Optional[Path]
@@ -289,11 +478,15 @@ def main(argv: Optional[list[str]] = None) -> int:
     deadman_ms = int(args.deadman_ms) if args.deadman_ms is not None else cfg.deadman_ms
     publish_hz = float(args.publish_hz) if args.publish_hz is not None else cfg.publish_hz
     unit = args.unit if args.unit else cfg.unit
+    encoding = args.motor_encoding if args.motor_encoding else cfg.encoding
+    publish_mode = args.motor_publish_mode if args.motor_publish_mode else cfg.publish_mode
 
     if raw_max <= 0:
         raise SystemExit("--raw-max must be > 0")
     if publish_hz <= 0:
         raise SystemExit("--publish-hz must be > 0")
+    if encoding == "bin" and unit not in MOTOR_BIN_UNITS:
+        raise SystemExit(f"--unit {unit!r} cannot be sent with --motor-encoding bin")
 
     open_session = _build_session_opener(
         config_path=args.zenoh_config, mode=args.mode, connect_endpoints=list(args.connect)
@@ -305,10 +498,22 @@ def main(argv: Optional[list[str]] = None) -> int:
     except Exception as e:
         raise SystemExit("pyserial is required: pip install pyserial") from e
 
-    session = open_session()
-    pub = session.declare_publisher(key)
+    pub = _ReconnectingPublisher(
+        open_session=open_session,
+        key=key,
+        grace_s=cfg.reconnect_grace_s,
+        backoff_max_s=cfg.reconnect_backoff_max_s,
+    )
+    pub.open()
     ser = None
 
+    policy = MotorPublishPolicy(mode=publish_mode, heartbeat_margin=cfg.heartbeat_margin)
+    # "on_change" only: an idle stick jittering by a few counts would otherwise read as a stream of
+    # changes. "fixed" sends every tick anyway, so small inputs pass through unchanged there.
+    deadband = cfg.idle_deadband * raw_max if publish_mode == "on_change" else 0.0
+    rate_counts: dict[str, int] = {}
+    rate_last_t = time.monotonic()
+
     seq = 0
     try:
         interval_s = 1.0 / float(publish_hz)
@@ -351,31 +556,66 @@ def main(argv: Optional[list[str]] = None) -> int:
 
             avg_l = _clamp(avg_l, -raw_max, raw_max)
             avg_r = _clamp(avg_r, -raw_max, raw_max)
+            if abs(avg_l) < deadband:
+                avg_l = 0.0
+            if abs(avg_r) < deadband:
+                avg_r = 0.0
             v_l = _map_to_mps(avg_l, raw_max, max_mps)
             v_r = _map_to_mps(avg_r, raw_max, max_mps)
-            payload = {
-                "v_l": v_l,
-                "v_r": v_r,
-                "unit": unit,
-                "deadman_ms": deadman_ms,
-                "seq": seq,
-                "ts_ms": int(time.time() * 1000),
-            }
-            pub.put(json.dumps(payload).encode("utf-8"))
-            if args.print_pub:
-                print(json.dumps(payload))
-            seq += 1
             sum_l = 0.0
             sum_r = 0.0
             count = 0
-
             while next_pub <= now:
                 next_pub += interval_s
+
+            if args.print_rate and now - rate_last_t >= 1.0:
+                total = sum(rate_counts.values())
+                detail = " ".join(f"{k}={v}" for k, v in sorted(rate_counts.items()))
+                print(
+                    f"[motor rate] {total / (now - rate_last_t):.1f} msg/s ({publish_mode}) {detail}",
+                    flush=True,
+                )
+                rate_counts = {}
+                rate_last_t = now
+
+            # The averaging window is the sampling period, so "on_change" reacts within one window.
+            reason = policy.due((v_l, v_r), now, deadman_ms=deadman_ms, slack_s=interval_s)
+            if reason is None:
+                continue
+            ts_ms = int(time.time() * 1000)
+            sent = pub.put(
+                encode_motor_cmd(
+                    v_l=v_l,
+                    v_r=v_r,
+                    unit=unit,
+                    deadman_ms=deadman_ms,
+                    seq=seq,
+                    ts_ms=ts_ms,
+                    encoding=encoding,
+                )
+            )
+            if sent:
+                policy.sent((v_l, v_r), now)
+                rate_counts[reason] = rate_counts.get(reason, 0) + 1
+            if args.print_pub:
+                print(
+                    json.dumps(
+                        {
+                            "v_l": v_l,
+                            "v_r": v_r,
+                            "unit": unit,
+                            "deadman_ms": deadman_ms,
+                            "seq": seq,
+                            "ts_ms": ts_ms,
+                        }
+                    )
+                )
+            seq += 1
     except KeyboardInterrupt:
         pass
     finally:
         try:
-            _send_stop(pub, unit=unit, deadman_ms=deadman_ms, repeat=5)
+            _send_stop(pub, unit=unit, deadman_ms=deadman_ms, encoding=encoding, repeat=5)
         except Exception:
             pass
         if ser is not None:
@@ -383,10 +623,7 @@ def main(argv: Optional[list[str]] = None) -> int:
                 ser.close()
             except Exception:
                 pass
-        try:
-            session.close()
-        except Exception:
-            pass
+        pub.close()
 
     return 0
 